@@ -0,0 +1,107 @@
+"""
+Benchmark: a Cricket verification lookup against the single ontology file
+versus category shards, where only the Sports shard is loaded.
+
+Each size builds a synthetic ontology once and splits a copy of it into
+shards; every run starts a manager (plus the entity index) in a fresh process
+and reads the Cricket entity names. "resident" counts the triples in memory,
+"max RSS" is the process' peak. Run from the backend directory:
+    python -m benchmarks.category_shards --sizes 1000 5000
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import resource
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_articles
+
+
+def _build(owl_path: Path, size: int):
+    from modules.dynamic_ontology.manager import OntologyManager
+    from modules.dynamic_ontology.populator import populate_article_from_json
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = OntologyManager(path=owl_path, snapshot_path=None, shard_dir=None)
+        for article in synthetic_articles(size):
+            populate_article_from_json(article, manager)
+        manager.save()
+
+
+def _split(owl_path: Path, shard_dir: Path):
+    from modules.dynamic_ontology.manager import OntologyManager
+    from modules.dynamic_ontology.shards import split
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        split(
+            OntologyManager(path=owl_path, snapshot_path=None, shard_dir=None),
+            shard_dir,
+        )
+
+
+def _lookup(owl_path: Path, shard_dir: Path | None, queue):
+    from modules.dynamic_ontology.manager import OntologyManager
+    from modules.similarity_matching.entity_index import EntityIndex
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        manager = OntologyManager(
+            path=owl_path, snapshot_path=None, shard_dir=shard_dir
+        )
+        index = EntityIndex()
+        index.build(manager.ontology)
+        manager.add_shard_listener(index.on_shard_changed)
+        started = time.perf_counter() - start
+        if manager.shards is not None:
+            manager.shards.ensure("Cricket")
+        names = index.get("Cricket", "persons")
+        first = time.perf_counter() - start - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put((started, first, len(names), len(manager.ontology.world.graph), peak))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    print(
+        f"{'articles':>10}{'mode':>9}{'startup s':>11}{'lookup s':>10}"
+        f"{'names':>7}{'resident':>10}{'max RSS MiB':>13}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            owl_path = Path(tmp) / "bench.owl"
+            sharded_path = Path(tmp) / "sharded.owl"
+            shard_dir = Path(tmp) / "shards"
+            for target, target_args in (
+                (_build, (owl_path, size)),
+                (shutil.copy, (owl_path, sharded_path)),
+                (_split, (sharded_path, shard_dir)),
+            ):
+                process = context.Process(target=target, args=target_args)
+                process.start()
+                process.join()
+            for mode, path, shards in (
+                ("single", owl_path, None),
+                ("sharded", sharded_path, shard_dir),
+            ):
+                queue = context.Queue()
+                process = context.Process(target=_lookup, args=(path, shards, queue))
+                process.start()
+                started, first, names, resident, peak = queue.get()
+                process.join()
+                print(
+                    f"{size:>10}{mode:>9}{started:>11.3f}{first:>10.3f}"
+                    f"{names:>7}{resident:>10}{peak:>13.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark: near-duplicate lookup latency of `EntityResolver` (n-gram blocking +
+RapidFuzz) versus scoring every known name, and how many spelling variants each
+attaches to the right name.
+
+Known names are random combinations of the sample entities' words; queries are
+half variants of a known name (suffix or dropped character) and half unseen
+names. `--check` only runs the regression pairs below (exit status 1 on a
+failure). Run from the backend directory:
+    python -m benchmarks.entity_resolution --names 1000 10000 50000
+    python -m benchmarks.entity_resolution --check
+"""
+
+import argparse
+import random
+import time
+
+from rapidfuzz.fuzz import ratio
+
+from benchmarks.synthetic import ENTITY_TYPES, load_samples
+from modules.dynamic_ontology.config import ENTITY_MATCH_THRESHOLD
+from modules.dynamic_ontology.entity_resolution import (
+    EntityResolver,
+    _ClassIndex,
+    normalize,
+)
+
+
+class _Person:
+    name = "Person"
+
+
+# Different entities a whole-name ratio >= 90 used to merge: never variants
+DIFFERENT_NAMES = [
+    ("Chamal Rajapaksa", "Namal Rajapaksa"),
+    ("India", "Indian"),
+    ("Ministry of Health", "Ministry of Wealth"),
+    ("Asia Cup", "Asia Cap"),
+    ("නව ක්‍රීඩක ක", "නව ක්‍රීඩක ඛ"),
+    ("නව ක්‍රීඩක ක", "නව ක්‍රීඩක ග"),
+    ("Asia Cup 2023", "Asia Cup 2024"),
+]
+# Spelling variants that must still be found
+VARIANT_NAMES = [
+    ("ඇන්ජලෝ මැතිව්ස්", "ඇන්ජලෝ මැතිව්ස්ගේ"),
+    ("ක්‍රීඩක සංගමය", "ක්රීඩක සංගමය"),
+    ("Angelo Mathews", "Angelo Matthews"),
+    ("Mahinda Rajapaksa", "MAHINDA  rajapaksa"),
+]
+# A~B and B~C, but not A~C: no group may hold A and C
+CHAINED_NAMES = ("Kumar Sangakkara", "Kumar Sangakara", "Kumar Sangakar")
+
+
+def _resolver(names) -> EntityResolver:
+    resolver = EntityResolver()
+    resolver._classes = {"Person": _ClassIndex()}
+    resolver._ontology = object()
+    for storid, name in enumerate(names):
+        resolver._classes["Person"].add(normalize(name), storid)
+    return resolver
+
+
+def check() -> list[str]:
+    """The regression pairs that resolve wrongly."""
+    failures = []
+    for expected, pairs in ((None, DIFFERENT_NAMES), (0, VARIANT_NAMES)):
+        for known, query in pairs:
+            found = _resolver([known]).resolve(_Person, query)
+            if found != expected:
+                failures.append(f"{query!r} -> {known!r}: {found}, not {expected}")
+    groups = _resolver(CHAINED_NAMES).duplicate_groups("Person")
+    if any(0 in group and 2 in group for group in groups):
+        failures.append(f"{CHAINED_NAMES} chained into one group: {groups}")
+    return failures
+
+
+def _vocabulary() -> list[str]:
+    words = {
+        word
+        for sample in load_samples()
+        for etype in ENTITY_TYPES
+        for name in sample.get(etype, [])
+        for word in name.split()
+        if not any(c.isdigit() for c in word)
+    }
+    return sorted(words)
+
+
+def _variant(rng: random.Random, name: str) -> str:
+    if rng.random() < 0.5:
+        return name + "ගේ"
+    i = rng.randrange(1, len(name))
+    return name[:i] + name[i + 1 :]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--names", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args(argv)
+
+    failures = check()
+    for failure in failures:
+        print(f"[ERROR] {failure}")
+    print(f"regression pairs: {len(failures)} failed")
+    if args.check:
+        raise SystemExit(1 if failures else 0)
+
+    rng = random.Random(0)
+    words = _vocabulary()
+    print(
+        f"{'names':>8}{'blocked ms':>12}{'scan ms':>10}"
+        f"{'variants found':>16}{'false merges':>14}"
+    )
+    for size in args.names:
+        known = list(dict.fromkeys(" ".join(rng.sample(words, 3)) for _ in range(size)))
+        resolver = _resolver(known)
+
+        targets = rng.sample(range(len(known)), args.queries // 2)
+        queries = [(_variant(rng, known[t]), t) for t in targets]
+        queries += [(" ".join(rng.sample(words, 3)), None) for _ in targets]
+
+        start = time.perf_counter()
+        found = [resolver.resolve(_Person, q) for q, _ in queries]
+        blocked = (time.perf_counter() - start) / len(queries) * 1000
+
+        normalized = [normalize(name) for name in known]
+        start = time.perf_counter()
+        for q, _ in queries[:20]:
+            q = normalize(q)
+            max(normalized, key=lambda name: ratio(q, name))
+        scan = (time.perf_counter() - start) / 20 * 1000
+
+        hits = sum(f == t for f, (_, t) in zip(found, queries) if t is not None)
+        false = sum(f is not None for f, (_, t) in zip(found, queries) if t is None)
+        print(
+            f"{len(known):>8}{blocked:>12.3f}{scan:>10.2f}"
+            f"{hits:>9}/{len(targets):<6}{false:>14}"
+        )
+    print(f"(threshold {ENTITY_MATCH_THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
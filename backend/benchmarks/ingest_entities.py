@@ -0,0 +1,92 @@
+"""
+Benchmark: bulk ingest throughput with the exact (class, name) entity index
+versus the previous wildcard `search_one(iri="*" + name)` lookup.
+
+Each run ingests synthetic articles into a fresh ontology in its own process
+and stops early when the time budget runs out. Run from the backend directory:
+    python -m benchmarks.ingest_entities --sizes 1000 10000 100000 --budget 300
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_articles
+
+
+def _legacy_manager_class():
+    from modules.dynamic_ontology.manager import OntologyManager
+
+    class LegacyOntologyManager(OntologyManager):
+        def get_or_create_entity(self, cls, name):
+            safe_name = self._safe_name(name)
+            existing = self.ontology.search_one(iri="*" + safe_name)
+            if existing:
+                return existing
+            individual = cls(safe_name)
+            individual.canonicalName = name
+            return individual
+
+        def get_or_create_category(self, cls, name):
+            existing = self.ontology.search_one(iri="*" + name)
+            if existing:
+                return existing
+            return cls(name)
+
+    return LegacyOntologyManager
+
+
+def _run(mode: str, size: int, budget: float, queue):
+    from modules.dynamic_ontology.manager import OntologyManager
+    from modules.dynamic_ontology.populator import populate_article_from_json
+
+    manager_class = _legacy_manager_class() if mode == "legacy" else OntologyManager
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(
+        io.StringIO()
+    ) as out:
+        manager = manager_class(path=Path(tmp) / "bench.owl")
+        done = 0
+        start = time.perf_counter()
+        for article in synthetic_articles(size):
+            populate_article_from_json(article, manager)
+            done += 1
+            if done % 100 == 0:
+                out.seek(0)
+                out.truncate()  # drop the populator's debug output
+                if time.perf_counter() - start > budget:
+                    break
+        elapsed = time.perf_counter() - start
+    queue.put((done, elapsed))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--modes", nargs="+", default=["legacy", "indexed"])
+    parser.add_argument("--budget", type=float, default=120.0, help="seconds per run")
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':<10}{'articles':>10}{'ingested':>10}{'seconds':>10}{'art/s':>10}")
+    for size in args.sizes:
+        for mode in args.modes:
+            queue = context.Queue()
+            process = context.Process(
+                target=_run, args=(mode, size, args.budget, queue)
+            )
+            process.start()
+            done, elapsed = queue.get()
+            process.join()
+            partial = "" if done == size else "  (budget reached)"
+            print(
+                f"{mode:<10}{size:>10}{done:>10}{elapsed:>10.1f}"
+                f"{done / elapsed:>10.0f}{partial}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: article ingest with batched article-to-entity linking
+(`OntologyManager.link_entities`) versus one `.append()` per entity per
+property, as the populator did before.
+
+Each run ingests synthetic articles into a fresh ontology in its own process;
+"link ms" is the time spent linking per article. Run from the backend directory:
+    python -m benchmarks.link_entities --articles 500 --entities 2 10 50
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_articles
+
+
+def _manager_class(mode: str):
+    from modules.dynamic_ontology.manager import OntologyManager
+
+    class TimedOntologyManager(OntologyManager):
+        link_seconds = 0.0
+
+        def link_entities(self, article, links):
+            start = time.perf_counter()
+            if mode == "append":
+                for prop, entities in links:
+                    values = getattr(article, prop)
+                    for entity in entities:
+                        values.append(entity)
+            else:
+                super().link_entities(article, links)
+            self.link_seconds += time.perf_counter() - start
+
+    return TimedOntologyManager
+
+
+def _run(mode: str, articles: int, entities: int, queue):
+    from modules.dynamic_ontology.populator import populate_article_from_json
+
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(
+        io.StringIO()
+    ) as out:
+        manager = _manager_class(mode)(path=Path(tmp) / "bench.owl")
+        start = time.perf_counter()
+        for i, article in enumerate(
+            synthetic_articles(articles, entities_per_type=entities)
+        ):
+            populate_article_from_json(article, manager)
+            if i % 100 == 0:
+                out.seek(0)
+                out.truncate()  # drop the populator's debug output
+        elapsed = time.perf_counter() - start
+    queue.put((elapsed, manager.link_seconds))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--entities", type=int, nargs="+", default=[2, 10, 50])
+    parser.add_argument("--modes", nargs="+", default=["append", "bulk"])
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'mode':<8}{'entities/type':>14}{'art/s':>10}{'link ms':>10}")
+    for entities in args.entities:
+        for mode in args.modes:
+            queue = context.Queue()
+            process = context.Process(
+                target=_run, args=(mode, args.articles, entities, queue)
+            )
+            process.start()
+            elapsed, link_seconds = queue.get()
+            process.join()
+            print(
+                f"{mode:<8}{entities:>14}{args.articles / elapsed:>10.0f}"
+                f"{link_seconds / args.articles * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
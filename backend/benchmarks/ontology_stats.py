@@ -0,0 +1,73 @@
+"""
+Benchmark: cost of one `/health` stats read, materializing every instance of
+the counted classes (the previous `get_ontology_stats`) versus the
+incrementally maintained counters.
+
+Synthetic articles are populated into a temporary copy of the ontology.
+Run from the backend directory:
+    python -m benchmarks.ontology_stats --articles 5000
+"""
+
+import argparse
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_articles
+from modules.dynamic_ontology.config import ONTOLOGY_FILE
+from modules.dynamic_ontology.manager import OntologyManager
+from modules.dynamic_ontology.populator import populate_article_from_json
+
+
+def materialized_stats(ontology):
+    counts = {
+        key: len(list(getattr(ontology, name).instances()))
+        for name, key in (
+            ("NewsArticle", "articles"),
+            ("Person", "persons"),
+            ("Organization", "organizations"),
+            ("Location", "locations"),
+            ("Event", "events"),
+        )
+    }
+    counts["total_entities"] = sum(
+        counts[key] for key in ("persons", "organizations", "locations", "events")
+    )
+    return counts
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ONTOLOGY_FILE.name
+        shutil.copy(ONTOLOGY_FILE, path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = OntologyManager(path=path, snapshot_path=None)
+            for article in synthetic_articles(args.articles):
+                populate_article_from_json(article, manager)
+
+        counters = manager.get_ontology_stats(breakdowns=False)
+        assert counters == materialized_stats(manager.ontology), counters
+        print(f"ontology: {counters}")
+        legacy = timed(lambda: materialized_stats(manager.ontology), args.repeat)
+        current = timed(lambda: manager.get_ontology_stats(), args.repeat * 100)
+        print(f"materialized instances: {legacy:10.3f} ms/call")
+        print(f"counters + breakdowns:  {current:10.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: per-call cost of the QUERY_MAP catalogue as ad-hoc SPARQL text
+(parsed and planned by owlready2 on every call) versus prepared queries with the
+category bound as a parameter.
+
+Run from the backend directory:
+    python -m benchmarks.sparql_prepared --repeat 200
+"""
+
+import argparse
+import time
+
+from owlready2 import default_world
+
+from modules.dynamic_ontology.manager import OntologyManager
+from modules.similarity_matching.query import NS, PREFIX, trusted_contents_query
+from modules.similarity_matching.query_mapping import QUERY_MAP
+from modules.similarity_matching.similarity_engine import get_verified_values
+
+
+def legacy_entity_query(category: str, prop: str) -> str:
+    """The query text as it used to be written out in `query.py`."""
+    return f"""
+{PREFIX}
+SELECT ?name
+WHERE {{
+  ?article ns:hasCategory ?category .
+  FILTER (?category = ns:{category})
+  ?article ns:{prop} ?entity .
+  ?entity ns:canonicalName ?name .
+}}
+"""
+
+
+def legacy_trusted_query(category: str) -> str:
+    return f"""
+{PREFIX}
+SELECT DISTINCT ?trustSementics ?title ?url
+WHERE {{
+  ?article ns:hasCategory ?cat .
+  FILTER (?cat = ns:{category})
+  ?article ns:hasFullText ?trustSementics .
+  ?article ns:hasTitle ?title .
+  ?article ns:hasSourceURL ?url .
+}}
+"""
+
+
+def _per_call_us(fn, calls: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for args in calls:
+            fn(*args)
+    return (time.perf_counter() - start) / (repeat * len(calls)) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    OntologyManager()
+    specs = [spec for specs in QUERY_MAP.values() for spec in specs.values()]
+    categories = list(QUERY_MAP)
+
+    # warm up: prepare every query once, outside the measurement
+    for spec in specs:
+        get_verified_values(spec)
+    trusted_contents_query.prepare()
+
+    rows = [
+        (
+            "entity names (QUERY_MAP)",
+            _per_call_us(
+                lambda s: list(
+                    default_world.sparql(legacy_entity_query(s.category, s.property))
+                ),
+                [(s,) for s in specs],
+                args.repeat,
+            ),
+            _per_call_us(get_verified_values, [(s,) for s in specs], args.repeat),
+        ),
+        (
+            "trusted contents",
+            _per_call_us(
+                lambda c: list(default_world.sparql(legacy_trusted_query(c))),
+                [(c,) for c in categories],
+                args.repeat,
+            ),
+            _per_call_us(
+                lambda c: list(trusted_contents_query.execute(default_world[NS + c])),
+                [(c,) for c in categories],
+                args.repeat,
+            ),
+        ),
+    ]
+
+    print(f"{'query':<28}{'ad-hoc us':>12}{'prepared us':>14}{'saved us':>12}")
+    for name, adhoc, prepared in rows:
+        print(f"{name:<28}{adhoc:>12.1f}{prepared:>14.1f}{adhoc - prepared:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
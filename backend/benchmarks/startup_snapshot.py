@@ -0,0 +1,79 @@
+"""
+Benchmark: OntologyManager startup from the RDF/XML file versus the binary
+fast-start snapshot written next to it on save.
+
+Each size builds a synthetic ontology once, then starts a manager from it in
+fresh processes. Run from the backend directory:
+    python -m benchmarks.startup_snapshot --sizes 1000 10000 --repeat 3
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_articles
+
+
+def _build(owl_path: Path, size: int):
+    from modules.dynamic_ontology.manager import OntologyManager
+    from modules.dynamic_ontology.populator import populate_article_from_json
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = OntologyManager(
+            path=owl_path, snapshot_path=owl_path.with_suffix(".snapshot.sqlite3")
+        )
+        for article in synthetic_articles(size):
+            populate_article_from_json(article, manager)
+        manager.save()
+
+
+def _start(owl_path: Path, use_snapshot: bool, queue):
+    from modules.dynamic_ontology.manager import OntologyManager
+
+    snapshot = owl_path.with_suffix(".snapshot.sqlite3") if use_snapshot else None
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = OntologyManager(path=owl_path, snapshot_path=snapshot)
+        articles = len(list(manager.ontology.NewsArticle.instances()))
+    queue.put((manager.loaded_from, manager.load_seconds, articles))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'articles':>10}{'source':>10}{'MiB':>8}{'best s':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            owl_path = Path(tmp) / "bench.owl"
+            process = context.Process(target=_build, args=(owl_path, size))
+            process.start()
+            process.join()
+            for use_snapshot in (False, True):
+                timings = []
+                for _ in range(args.repeat):
+                    queue = context.Queue()
+                    process = context.Process(
+                        target=_start, args=(owl_path, use_snapshot, queue)
+                    )
+                    process.start()
+                    loaded_from, seconds, articles = queue.get()
+                    process.join()
+                    timings.append(seconds)
+                assert articles == size, (articles, size)
+                file = (
+                    owl_path.with_suffix(".snapshot.sqlite3")
+                    if use_snapshot
+                    else owl_path
+                )
+                mib = file.stat().st_size / 2**20
+                print(f"{size:>10}{loaded_from:>10}{mib:>8.1f}{min(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Synthetic article generator for the ingest benchmarks.
+
+Articles reuse the (category, subcategory) pairs of `data/samples` and draw
+entity names from a vocabulary that grows with the corpus, so lookups hit both
+existing and new entities the way a real backfill does.
+"""
+
+import json
+import random
+from pathlib import Path
+
+SAMPLES_DIR: Path = Path(__file__).parent.parent / "data" / "samples"
+
+ENTITY_TYPES = ["persons", "locations", "events", "organizations"]
+
+
+def load_samples() -> list[dict]:
+    samples = []
+    for path in sorted(SAMPLES_DIR.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            samples.extend(json.load(f))
+    return samples
+
+
+def synthetic_articles(count: int, seed: int = 0, entities_per_type: int = 2):
+    """Yield `count` article dicts in the `populate_article_from_json` format."""
+    rng = random.Random(seed)
+    samples = load_samples()
+    names = {
+        etype: [n for s in samples for n in s.get(etype, [])] or [etype]
+        for etype in ENTITY_TYPES
+    }
+    vocabulary = max(count // 2, 1)
+    for i in range(count):
+        sample = samples[i % len(samples)]
+        article = {
+            "headline": f"{sample['headline']} #{i}",
+            "content": f"{sample['content']} ({i})",
+            "timestamp": "2025-06-01T10:00:00",
+            "url": f"https://example.org/news/{i}",
+            "source": sample["source"],
+            "category": sample["category"],
+            "subcategory": sample["subcategory"],
+        }
+        for etype in ENTITY_TYPES:
+            article[etype] = [
+                f"{rng.choice(names[etype])} {rng.randrange(vocabulary)}"
+                for _ in range(entities_per_type)
+            ]
+        yield article
@@ -0,0 +1,94 @@
+"""
+Benchmark: memory and latency of fetching one category's trusted content for a
+verify call, via the SPARQL scan (`get_trusted_contents_by_category`, full text
+copied into every ranking entry) versus the materialized `trusted_view` with a
+title/url projection.
+
+Synthetic articles are added to the loaded ontology in memory only (nothing is
+saved). Run from the backend directory:
+    python -m benchmarks.trusted_view --articles 20000
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+from modules.dynamic_ontology.manager import OntologyManager
+from modules.dynamic_ontology.models import FormattedNewsArticle
+from modules.similarity_matching.query import category_entity
+from modules.similarity_matching.similarity_engine import (
+    get_trusted_contents_by_category,
+)
+from modules.similarity_matching.trusted_view import trusted_view
+
+
+def add_synthetic_articles(manager, category: str, count: int, text_size: int):
+    onto = manager.ontology
+    category_indiv = category_entity(category)
+    body = ("ශ්‍රී ලංකා කණ්ඩායම ජය ගත්තේය " * text_size)[:text_size]
+    for i in range(count):
+        article = manager.add_article(
+            FormattedNewsArticle(
+                headline=f"Synthetic headline {i}",
+                content=f"{i} {body}",
+                timestamp=datetime(2025, 1, 1),
+                url=f"https://example.org/benchmark/{i}",
+                source="benchmark",
+            )
+        )
+        with onto:
+            article.hasCategory.append(category_indiv)
+
+
+def measure(fn, repeat: int):
+    fn()  # warm up
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000, peak / 1024 / 1024
+
+
+def sparql_ranking(category):
+    return [
+        {"title": t.title, "url": t.url, "trustSementics": t.trustSementics}
+        for t in get_trusted_contents_by_category(category)
+    ]
+
+
+def view_ranking(category):
+    return [{"title": r.title, "url": r.url} for r in trusted_view.rows(category)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--text-size", type=int, default=2000)
+    parser.add_argument("--category", default="Cricket")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    manager = OntologyManager()
+    add_synthetic_articles(manager, args.category, args.articles, args.text_size)
+
+    start = time.perf_counter()
+    trusted_view.build(manager.ontology)
+    build_ms = (time.perf_counter() - start) * 1000
+    rows = len(trusted_view.rows(args.category))
+    print(f"{rows} rows in {args.category}, view built in {build_ms:.0f} ms")
+
+    print(f"{'path':<24}{'ms/call':>10}{'peak MiB':>10}")
+    for name, fn in [
+        ("sparql + full text", lambda: sparql_ranking(args.category)),
+        ("view (title, url)", lambda: view_ranking(args.category)),
+    ]:
+        ms, peak = measure(fn, args.repeat)
+        print(f"{name:<24}{ms:>10.1f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
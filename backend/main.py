@@ -1,8 +1,14 @@
 from pdb import post_mortem
 from turtle import pos
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
+import asyncio
+import httpx
+import json
+import os
 import uvicorn
 import logging
 
@@ -12,13 +18,38 @@ from modules.dynamic_ontology.relation_extraction.ner_enhaced_triple_extractor i
 )
 from modules.dynamic_ontology.relation_extraction import simple_triple_extractor
 from modules.pre_processing.sinhala_pos_tagger import SinhalaPOSTagger
-from modules.similarity_matching.similarity_engine import get_semantic_similarity_score
-from modules.similarity_matching.checker import check_news
-from modules.pre_processing.news_classification import get_category_subcategory
-from modules.pre_processing.news_detection import get_news_or_not
-from modules.pre_processing.ner import extract_named_entities
+from modules.similarity_matching.similarity_engine import (
+    get_semantic_similarity_score_async,
+)
+from modules.similarity_matching.checker import RANKING_FIELDS, check_news
+from modules.similarity_matching.config import SIMILARITY_BACKEND
+from modules.similarity_matching.local_similarity import local_similarity_engine
+from modules.similarity_matching.entity_index import entity_index
+from modules.similarity_matching.trusted_view import trusted_view
+from modules.pre_processing.news_classification import get_category_subcategory_async
+from modules.pre_processing.news_detection import get_news_or_not_async
+from modules.pre_processing.ner import extract_named_entities_async
+from modules.pre_processing.config import NER_BACKEND
+from modules.pre_processing.gazetteer_ner import gazetteer_ner
+from modules.remote_services.cache import result_cache
+from modules.remote_services.client import close_async_client, remote_call_flight
+from modules.remote_services.coalescing import SingleFlight, payload_key
+from modules.remote_services.config import REQUEST_DEADLINE
+from modules.remote_services.resilience import request_deadline, resilience_snapshot
 from modules.pre_processing import sinhala_preprocessor
 from modules.simulations.simulations import simulate_news_verification
+from modules.dynamic_ontology.bulk_pipeline import BulkPreprocessPipeline
+from modules.dynamic_ontology.config import (
+    BULK_PIPELINE_CONCURRENCY,
+    BULK_PIPELINE_MAX_CONCURRENCY,
+    BULK_STREAM_CHUNK_SIZE,
+    BULK_STREAM_MAX_LINE_BYTES,
+    ONTOLOGY_MULTI_WORKER,
+    ONTOLOGY_WRITE_BEHIND,
+    ONTOLOGY_WRITER_SOCKET,
+)
+from modules.dynamic_ontology.compaction import compact
+from modules.dynamic_ontology.entity_resolution import merge_duplicates
 from modules.dynamic_ontology.manager import OntologyManager
 from modules.dynamic_ontology.models import (
     NewsArticleCreate,
@@ -29,13 +60,17 @@ from modules.dynamic_ontology.models import (
 from modules.dynamic_ontology.populator import (
     populate_article_from_json,
     populate_bulk_articles,
+    populate_ndjson_chunk,
 )
+from modules.dynamic_ontology.workers import ReaderSync, elect_writer
 
 
 class VerifyNewsRequest(BaseModel):
     """Request model for verifying news articles"""
 
     text: str
+    # include the full trusted article text in each semantic_ranking entry
+    include_trusted_text: bool = False
 
 
 class SimilarityCheckRequest(BaseModel):
@@ -67,6 +102,15 @@ class NewsArticleFromSource(BaseModel):
     url: str
 
 
+class BulkNewsFromSourceRequest(BaseModel):
+    """Model for bulk preprocess-and-populate requests"""
+
+    data: list[NewsArticleFromSource]
+    concurrency: int = Field(
+        BULK_PIPELINE_CONCURRENCY, ge=1, le=BULK_PIPELINE_MAX_CONCURRENCY
+    )
+
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -81,17 +125,110 @@ app = FastAPI(
 
 # Global ontology manager instance
 ontology_manager = None
+# Set once startup has finished; reported by the readiness probe
+startup_complete = False
+
+# Multi-worker mode (see modules/dynamic_ontology/workers.py): "writer" or
+# "reader"; a single worker owns the ontology on its own
+worker_role = "single"
+writer_lock = None  # held by the writer for as long as it runs
+writer_server = None  # writer: uvicorn server on ONTOLOGY_WRITER_SOCKET
+writer_server_task = None
+writer_client = None  # reader: forwards ontology writes to the writer
+reader_sync = None  # reader: follows the writer's commits
+
+# Requests that change the ontology; a reader forwards them to the writer
+ONTOLOGY_WRITE_PATHS = frozenset(
+    {
+        "/ontology/export",
+        "/ontology/entities/merge-duplicates",
+        "/ontology/compact",
+        "/ontology/populate-article",
+        "/ontology/populate-bulk",
+        "/ontology/populate-stream",
+        "/ontology/preprocess-n-populate",
+        "/ontology/preprocess-n-populate/bulk",
+    }
+)
+_HOP_BY_HOP_HEADERS = frozenset(
+    {"connection", "keep-alive", "transfer-encoding", "upgrade", "host"}
+)
+
+# Concurrent /news/verify requests with the same preprocessed text share one run
+verification_flight = SingleFlight("verification")
+
+
+def _rebuild_ontology_indexes():
+    """Rebuild the in-memory views of the ontology from scratch"""
+    entity_index.build(ontology_manager.ontology)
+    trusted_view.build(ontology_manager.ontology)
+    if SIMILARITY_BACKEND == "local":
+        local_similarity_engine.build(ontology_manager.ontology)
+    if NER_BACKEND != "remote":
+        gazetteer_ner.build(ontology_manager.ontology)
+
+
+async def _serve_forwarded_writes():
+    """Writer: serve this app on ONTOLOGY_WRITER_SOCKET for the reader workers"""
+    global writer_server, writer_server_task
+    # A leftover socket of a previous writer; we hold the lock now
+    ONTOLOGY_WRITER_SOCKET.unlink(missing_ok=True)
+    config = uvicorn.Config(
+        app, uds=str(ONTOLOGY_WRITER_SOCKET), lifespan="off", log_config=None
+    )
+    writer_server = uvicorn.Server(config)
+    writer_server_task = asyncio.create_task(writer_server.serve())
+    logger.info(f"Serving forwarded ontology writes on {ONTOLOGY_WRITER_SOCKET}")
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the ontology manager on startup"""
-    global ontology_manager, sinhala_preprocessor, pos_tagger
+    global ontology_manager, sinhala_preprocessor, pos_tagger, startup_complete
+    global worker_role, writer_lock, reader_sync
     try:
+        if ONTOLOGY_MULTI_WORKER:
+            writer_lock = await run_in_threadpool(elect_writer)
+            worker_role = "writer" if writer_lock else "reader"
+            logger.info(f"Ontology worker role: {worker_role}")
+
         logger.info("Initializing ontology manager...")
-        ontology_manager = OntologyManager()
+        ontology_manager = OntologyManager(read_only=worker_role == "reader")
+        if worker_role == "reader":
+            reader_sync = ReaderSync(ontology_manager, _rebuild_ontology_indexes)
+        elif ONTOLOGY_WRITE_BEHIND:
+            ontology_manager.start_write_behind()
         logger.info("Ontology manager initialized successfully")
 
+        logger.info("Building entity index...")
+        entity_index.build(ontology_manager.ontology)
+        ontology_manager.add_article_listener(entity_index.on_article_populated)
+        ontology_manager.add_shard_listener(entity_index.on_shard_changed)
+        logger.info("Entity index built successfully")
+
+        logger.info("Building trusted content view...")
+        trusted_view.build(ontology_manager.ontology)
+        ontology_manager.add_article_listener(trusted_view.on_article_populated)
+        ontology_manager.add_shard_listener(trusted_view.on_shard_changed)
+        logger.info("Trusted content view built successfully")
+
+        if SIMILARITY_BACKEND == "local":
+            logger.info("Building local similarity matrix...")
+            local_similarity_engine.build(ontology_manager.ontology)
+            ontology_manager.add_article_listener(
+                local_similarity_engine.on_article_populated
+            )
+            ontology_manager.add_shard_listener(
+                local_similarity_engine.on_shard_changed
+            )
+            logger.info("Local similarity matrix built successfully")
+
+        if NER_BACKEND != "remote":
+            logger.info("Building gazetteer NER from ontology entities...")
+            gazetteer_ner.build(ontology_manager.ontology)
+            ontology_manager.add_article_listener(gazetteer_ner.on_article_populated)
+            logger.info(f"Gazetteer NER built with {len(gazetteer_ner)} names")
+
         logger.info("Initializing Sinhala preprocessor...")
         sinhala_preprocessor = sinhala_preprocessor.SinhalaPreprocessor()
         logger.info("Sinhala preprocessor initialized successfully")
@@ -100,17 +237,145 @@ async def startup_event():
         pos_tagger = SinhalaPOSTagger()
         logger.info("Sinhala POS tagger initialized successfully")
 
+        if reader_sync is not None:
+            reader_sync.start()
+        if worker_role == "writer":
+            await _serve_forwarded_writes()
+        startup_complete = True
+
     except Exception as e:
         logger.error(f"Failed to initialize ontology manager: {e}")
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Save pending ontology changes and release pooled connections"""
+    if writer_server is not None:
+        writer_server.should_exit = True
+        await writer_server_task
+        ONTOLOGY_WRITER_SOCKET.unlink(missing_ok=True)
+    if reader_sync is not None:
+        await run_in_threadpool(reader_sync.stop)
+    if writer_client is not None:
+        await writer_client.aclose()
+    if ontology_manager:
+        await run_in_threadpool(ontology_manager.close)
+    if writer_lock is not None:
+        writer_lock.close()  # after the last save
+    await close_async_client()
+
+
+def _route_path(request: Request) -> str:
+    """The request path without the app's root path, as routes see it"""
+    path = request.scope["path"]
+    root_path = request.scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    return path
+
+
+async def _forward_to_writer(request: Request):
+    """Reader: send the request to the writer worker and stream its response back"""
+    global writer_client
+    if writer_client is None:
+        writer_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=str(ONTOLOGY_WRITER_SOCKET)),
+            # Bulk populates run for as long as they take
+            timeout=httpx.Timeout(None, connect=5.0),
+        )
+    url = httpx.URL(
+        "http://ontology-writer",
+        raw_path=request.scope["raw_path"]
+        + (
+            b"?" + request.scope["query_string"]
+            if request.scope["query_string"]
+            else b""
+        ),
+    )
+    headers = [
+        (name, value)
+        for name, value in request.headers.raw
+        if name.decode("latin-1").lower() not in _HOP_BY_HOP_HEADERS
+    ]
+    upstream_request = writer_client.build_request(
+        request.method, url, headers=headers, content=request.stream()
+    )
+    try:
+        upstream = await writer_client.send(upstream_request, stream=True)
+    except httpx.TransportError as e:
+        logger.error(f"Ontology writer unavailable: {e}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Ontology writer unavailable, retry shortly"},
+            headers={"Retry-After": "1"},
+        )
+    return StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.status_code,
+        headers={
+            name: value
+            for name, value in upstream.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        },
+        background=BackgroundTask(upstream.aclose),
+    )
+
+
+@app.middleware("http")
+async def forward_ontology_writes(request: Request, call_next):
+    """
+    In a reader worker, hand requests that change the ontology to the writer.
+    Whatever their headers say: readers never get requests from other workers
+    (those arrive on the writer's socket), so no request may skip this.
+    """
+    if (
+        worker_role == "reader"
+        and request.method == "POST"
+        and _route_path(request) in ONTOLOGY_WRITE_PATHS
+    ):
+        return await _forward_to_writer(request)
+    return await call_next(request)
+
+
+def _worker_stats() -> dict:
+    stats = {"role": worker_role, "pid": os.getpid()}
+    if reader_sync is not None:
+        stats.update(reader_sync.stats())
+    return stats
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
     return {"message": "News Verifier Backend API", "version": "1.0.0"}
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests. Touches no state."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: startup has finished and the ontology is loaded"""
+    if not (startup_complete and ontology_manager):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "status": "starting",
+                "ontology_loaded": ontology_manager is not None,
+            },
+        )
+    return {
+        "status": "ready",
+        "ontology_stats": ontology_manager.get_ontology_stats(breakdowns=False),
+        "ontology_persistence": ontology_manager.persistence_stats(),
+        "ontology_worker": _worker_stats(),
+    }
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -120,6 +385,16 @@ async def health_check():
             "status": "healthy",
             "ontology_loaded": ontology_manager is not None,
             "ontology_stats": stats,
+            "ontology_persistence": (
+                ontology_manager.persistence_stats() if ontology_manager else {}
+            ),
+            "ontology_worker": _worker_stats(),
+            "result_cache": result_cache.stats(),
+            "remote_services": resilience_snapshot(),
+            "coalescing": {
+                "verification": verification_flight.stats(),
+                "remote_calls": remote_call_flight.stats(),
+            },
         }
     except Exception as e:
         return JSONResponse(
@@ -144,6 +419,124 @@ async def get_ontology_stats():
         )
 
 
+def _check_entity_index() -> list[dict]:
+    with ontology_manager.write_lock:
+        return entity_index.check_consistency()
+
+
+@app.get("/ontology/entity-index/check", tags=["Ontology"])
+async def check_entity_index():
+    """Compare the in-memory entity index with the SPARQL queries it replaces"""
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    try:
+        mismatches = await run_in_threadpool(_check_entity_index)
+        return {"consistent": not mismatches, "mismatches": mismatches}
+    except Exception as e:
+        logger.error(f"Error checking entity index: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Error checking entity index: {str(e)}"
+        )
+
+
+@app.post("/ontology/export", tags=["Ontology"])
+async def export_ontology_snapshot():
+    """Write an RDF/XML snapshot of the ontology to the .owl file"""
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    try:
+        path = await run_in_threadpool(ontology_manager.export_snapshot)
+        return {
+            "success": True,
+            "store": ontology_manager.store,
+            "path": str(path),
+            "bytes": path.stat().st_size,
+        }
+    except Exception as e:
+        logger.error(f"Error exporting ontology snapshot: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Error exporting ontology snapshot: {str(e)}"
+        )
+
+
+def _merge_duplicate_entities(dry_run: bool) -> dict:
+    with ontology_manager.write_lock:
+        result = merge_duplicates(ontology_manager, dry_run=dry_run)
+        if not dry_run and result["removed"]:
+            # Entity names changed under the in-memory indexes
+            entity_index.invalidate()
+            if NER_BACKEND != "remote":
+                gazetteer_ner.build(ontology_manager.ontology)
+    if not dry_run and result["removed"]:
+        ontology_manager.mark_dirty(result["removed"])
+    return result
+
+
+@app.post("/ontology/entities/merge-duplicates", tags=["Ontology"])
+async def merge_duplicate_entities(dry_run: bool = True):
+    """
+    Merge near-duplicate entities (spelling variants) into one individual each,
+    keeping the other spellings as aliases. Only reports the groups unless
+    `dry_run=false`.
+    """
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    try:
+        result = await run_in_threadpool(_merge_duplicate_entities, dry_run)
+        return {"success": True, **result}
+    except Exception as e:
+        logger.error(f"Error merging duplicate entities: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Error merging duplicate entities: {str(e)}"
+        )
+
+
+def _compact_ontology(max_seconds: float | None) -> dict:
+    result = compact(ontology_manager, max_seconds=max_seconds)
+    # Rebuilt under the lock verifications read them with
+    with ontology_manager.write_lock:
+        if result["duplicate_literals_removed"]:
+            # Article texts changed under the text views
+            trusted_view.build(ontology_manager.ontology)
+            if SIMILARITY_BACKEND == "local":
+                local_similarity_engine.build(ontology_manager.ontology)
+        if result["individuals_removed"]:
+            entity_index.invalidate()
+            if NER_BACKEND != "remote":
+                gazetteer_ner.build(ontology_manager.ontology)
+    return result
+
+
+@app.post("/ontology/compact", tags=["Ontology"])
+async def compact_ontology(max_seconds: float | None = None):
+    """
+    Garbage-collect the ontology: drop repeated article texts / publisher
+    names and individuals no article reaches, then rewrite the storage.
+    With `max_seconds` the pass stops early (`complete: false`); call again
+    to continue.
+    """
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    try:
+        result = await run_in_threadpool(_compact_ontology, max_seconds)
+        return {"success": True, **result}
+    except Exception as e:
+        logger.error(f"Error compacting ontology: {e}")
+        raise HTTPException(
+            status_code=500, detail=f"Error compacting ontology: {str(e)}"
+        )
+
+
+def _populate_and_mark_dirty(article_data: dict):
+    article_individual = populate_article_from_json(article_data, ontology_manager)
+    ontology_manager.mark_dirty()
+    return article_individual
+
+
 @app.post(
     "/ontology/populate-article", response_model=NewsArticleResponse, tags=["Ontology"]
 )
@@ -156,11 +549,10 @@ async def populate_single_article(article: NewsArticleCreate):
         # Convert Pydantic model to dict
         article_data = article.dict()
 
-        # Populate the article
-        article_individual = populate_article_from_json(article_data, ontology_manager)
-
-        # Save the ontology
-        ontology_manager.save()
+        # Populate the article; the ontology is saved by the write-behind flusher
+        article_individual = await run_in_threadpool(
+            _populate_and_mark_dirty, article_data
+        )
 
         logger.info(f"Successfully populated article: {article.headline}")
 
@@ -199,8 +591,10 @@ async def populate_bulk_articles_endpoint(request: BulkPopulateRequest):
 
         logger.info(f"Starting bulk population of {len(articles_data)} articles")
 
-        # Populate articles
-        results = populate_bulk_articles(articles_data, ontology_manager)
+        # Populate articles (flushes the ontology to disk when done)
+        results = await run_in_threadpool(
+            populate_bulk_articles, articles_data, ontology_manager
+        )
 
         logger.info(
             f"Bulk population completed. Success: {results['successful']}, Failed: {results['failed']}"
@@ -223,66 +617,207 @@ async def populate_bulk_articles_endpoint(request: BulkPopulateRequest):
         )
 
 
+class _UploadProgressResponse(StreamingResponse):
+    """
+    StreamingResponse whose body keeps reading the request while it streams.
+    The body is then the only consumer of `receive` (a client disconnect
+    surfaces there as ClientDisconnect), so the default disconnect listener,
+    which would swallow request chunks, is not run.
+    """
+
+    async def listen_for_disconnect(self, receive):
+        await asyncio.Event().wait()
+
+
+async def _ndjson_lines(
+    request: Request, max_line_bytes: int = BULK_STREAM_MAX_LINE_BYTES
+):
+    """
+    Yield (line number, line) for each non-empty line of the request body.
+    Raises ValueError on a line longer than `max_line_bytes`.
+    """
+    pending, pending_bytes = [], 0  # pieces of the line not yet ended
+    number = 0
+
+    def check(size):
+        if size > max_line_bytes:
+            raise ValueError(f"Line {number + 1} is longer than {max_line_bytes} bytes")
+
+    async for data in request.stream():
+        # Only the new data is split; earlier pieces are joined once the line ends
+        *ended, rest = data.split(b"\n")
+        for piece in ended:
+            check(pending_bytes + len(piece))
+            line = b"".join(pending) + piece if pending else piece
+            pending, pending_bytes = [], 0
+            number += 1
+            if line.strip():
+                yield number, line
+        if rest:
+            check(pending_bytes + len(rest))
+            pending.append(rest)
+            pending_bytes += len(rest)
+    line = b"".join(pending)
+    if line.strip():
+        yield number + 1, line
+
+
+@app.post("/ontology/populate-stream", tags=["Ontology"])
+async def populate_stream_endpoint(
+    request: Request, chunk_size: int = BULK_STREAM_CHUNK_SIZE
+):
+    """
+    Populate articles from a newline-delimited JSON body (one NewsArticleCreate
+    per line) as it arrives, committing every `chunk_size` articles.
+    Responds with one JSON progress line per committed chunk and a final summary;
+    a line longer than BULK_STREAM_MAX_LINE_BYTES ends it with an error line.
+    """
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    if chunk_size < 1:
+        raise HTTPException(status_code=400, detail="chunk_size must be positive")
+
+    async def progress():
+        totals = {"total_processed": 0, "successful": 0, "failed": 0, "chunks": 0}
+
+        async def commit(chunk):
+            result = await run_in_threadpool(
+                populate_ndjson_chunk, chunk, ontology_manager
+            )
+            for key in ("total_processed", "successful", "failed"):
+                totals[key] += result[key]
+            totals["chunks"] += 1
+            line = {"chunk": totals["chunks"], **result, "totals": dict(totals)}
+            return json.dumps(line, ensure_ascii=False) + "\n"
+
+        chunk = []
+        try:
+            async for numbered_line in _ndjson_lines(request):
+                chunk.append(numbered_line)
+                if len(chunk) >= chunk_size:
+                    yield await commit(chunk)
+                    chunk = []
+            if chunk:
+                yield await commit(chunk)
+        except Exception as e:
+            logger.error(f"Error in streaming population: {e}")
+            yield json.dumps({"done": False, "error": str(e), **totals}) + "\n"
+            return
+
+        logger.info(f"Streaming population completed: {totals}")
+        yield json.dumps({"done": True, **totals}) + "\n"
+
+    return _UploadProgressResponse(progress(), media_type="application/x-ndjson")
+
+
 @app.post("/ontology/preprocess-n-populate", tags=["Ontology"])
 async def preprocess_and_populate(request: NewsArticleFromSource):
     """Endpoint to preprocess text and populate into ontology"""
     if not ontology_manager:
         raise HTTPException(status_code=503, detail="Ontology manager not initialized")
 
-    try:
-        # Preprocess the text
-        preprocessed_text = sinhala_preprocessor.preprocess_text(request.content)
+    with request_deadline(REQUEST_DEADLINE):
+        try:
+            # Preprocess the text
+            preprocessed_text = sinhala_preprocessor.preprocess_text(request.content)
+
+            # Get category and subcategory, and extract named entities concurrently
+            (
+                (category, subcategory),
+                (persons, locations, events, organizations),
+            ) = await asyncio.gather(
+                get_category_subcategory_async(preprocessed_text),
+                extract_named_entities_async(preprocessed_text),
+            )
 
-        # Get category and subcategory
-        category, subcategory = get_category_subcategory(preprocessed_text)
+            if not category or not subcategory:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Could not determine category or subcategory from the content.",
+                )
+
+            # Create a NewsArticleCreate instance
+            article_data = NewsArticleCreate(
+                headline=request.headline,
+                content=preprocessed_text,
+                source=request.source,
+                timestamp=request.timestamp,
+                url=request.url,
+                category=category,
+                subcategory=subcategory,
+                persons=persons,
+                locations=locations,
+                events=events,
+                organizations=organizations,
+            )
 
-        if not category or not subcategory:
+            # Populate the article into the ontology; saved by the write-behind flusher
+            article_individual = await run_in_threadpool(
+                _populate_and_mark_dirty, article_data.model_dump()
+            )
+
+            return NewsArticleResponse(
+                success=True,
+                message="Article populated successfully",
+                article_id=str(article_individual.name)
+                if hasattr(article_individual, "name")
+                else None,
+            )
+
+        except Exception as e:
+            logger.error(f"Error preprocessing and populating article: {e}")
             raise HTTPException(
-                status_code=400,
-                detail="Could not determine category or subcategory from the content.",
+                status_code=500,
+                detail=f"Error preprocessing and populating article: {str(e)}",
             )
 
-        # Extract named entities
-        persons, locations, events, organizations = extract_named_entities(
-            preprocessed_text
-        )
 
-        # Create a NewsArticleCreate instance
-        article_data = NewsArticleCreate(
-            headline=request.headline,
-            content=preprocessed_text,
-            source=request.source,
-            timestamp=request.timestamp,
-            url=request.url,
-            category=category,
-            subcategory=subcategory,
-            persons=persons,
-            locations=locations,
-            events=events,
-            organizations=organizations,
+async def _classify_and_extract(text: str):
+    # Each article gets its own deadline for its service calls
+    with request_deadline(REQUEST_DEADLINE):
+        return await asyncio.gather(
+            get_category_subcategory_async(text),
+            extract_named_entities_async(text),
         )
 
-        # Populate the article into the ontology
-        article_individual = populate_article_from_json(
-            article_data.dict(), ontology_manager
-        )
 
-        # Save the ontology
-        ontology_manager.save()
+@app.post("/ontology/preprocess-n-populate/bulk", tags=["Ontology"])
+async def bulk_preprocess_and_populate(request: BulkNewsFromSourceRequest):
+    """
+    Preprocess, classify, extract entities for and populate many raw articles.
+    Preprocessing and service calls run for `concurrency` articles at a time;
+    a single writer populates the ontology, which is flushed once at the end.
+    """
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
 
-        return NewsArticleResponse(
-            success=True,
-            message="Article populated successfully",
-            article_id=str(article_individual.name)
-            if hasattr(article_individual, "name")
-            else None,
+    if not request.data:
+        raise HTTPException(status_code=400, detail="No articles provided")
+
+    try:
+        pipeline = BulkPreprocessPipeline(
+            preprocess=sinhala_preprocessor.preprocess_text,
+            analyse=_classify_and_extract,
+            write=lambda article: populate_article_from_json(article, ontology_manager),
+            concurrency=request.concurrency,
+        )
+        results = await pipeline.run([article.model_dump() for article in request.data])
+        if results["successful"]:
+            ontology_manager.mark_dirty(results["successful"])
+        await run_in_threadpool(ontology_manager.flush)
+
+        logger.info(
+            f"Bulk preprocess-and-populate completed in {results['seconds']}s. "
+            f"Success: {results['successful']}, Failed: {results['failed']}"
         )
+        return {"success": results["failed"] == 0, **results}
 
     except Exception as e:
-        logger.error(f"Error preprocessing and populating article: {e}")
+        logger.error(f"Error in bulk preprocess-and-populate: {e}")
         raise HTTPException(
             status_code=500,
-            detail=f"Error preprocessing and populating article: {str(e)}",
+            detail=f"Error in bulk preprocess-and-populate: {str(e)}",
         )
 
 
@@ -312,7 +847,9 @@ async def ner_enhanced_relation_extraction(request: VerifyNewsRequest):
         # Initialize the NER enhanced extractor
         ner_extractor = NEREnhancedTripleExtractor()
 
-        persons, locations, events, organizations = extract_named_entities(request.text)
+        persons, locations, events, organizations = await extract_named_entities_async(
+            request.text
+        )
 
         # Perform NER enhanced triple extraction
         result = ner_extractor.extract_triple_enhanced(
@@ -335,84 +872,104 @@ async def ner_enhanced_relation_extraction(request: VerifyNewsRequest):
         )
 
 
-@app.post("/news/verify", tags=["News Verification"])
-async def verify_news(request: VerifyNewsRequest):
-    """Endpoint to verify a news article"""
-    if not ontology_manager:
-        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+async def _verify_preprocessed(article_data: str, include_trusted_text: bool = False):
+    """Run verification steps 02-05 on already preprocessed text."""
+    flow = [{"step": "Pre-processing", "result": article_data}]
+
+    # STEP 02-04: News detection, classification and NER only depend on the
+    # preprocessed text, so dispatch them together and await all three.
+    (
+        checked_news,
+        classification_result,
+        (persons, locations, events, organizations),
+    ) = await asyncio.gather(
+        get_news_or_not_async(article_data),
+        get_category_subcategory_async(article_data),
+        extract_named_entities_async(article_data),
+    )
 
-    flow = []
+    # STEP 02: Verify whether the news is a news or not.
+    flow.append({"step": "News Detection", "result": checked_news})
+    print(f"[DEBUG] is_news: {checked_news}")
+
+    # STEP 03: Do classification , sub-categorization, etc.
+    print(f"[DEBUG] Classification result: {classification_result}")
+    flow.append(
+        {
+            "step": "Classification",
+            "result": "Category: "
+            + classification_result[0]
+            + ", Subcategory: "
+            + classification_result[1],
+        }
+    )
 
-    try:
-        # Convert Pydantic model to dict
-        article_data = request.text
-
-        # STEP 01: Pre-processing text (remove unnecessary characters, english stop words, etc.)
-        article_data = sinhala_preprocessor.preprocess_text(article_data)
-        flow.append({"step": "Pre-processing", "result": article_data})
-
-        # STEP 02: Verify whether the news is a news or not.
-        checked_news = get_news_or_not(article_data)
-        flow.append({"step": "News Detection", "result": checked_news})
-        print(f"[DEBUG] is_news: {checked_news}")
-
-        # STEP 03: Do classification , sub-categorization, etc.
-        classification_result = get_category_subcategory(article_data)
-        print(f"[DEBUG] Classification result: {classification_result}")
-        flow.append(
-            {
-                "step": "Classification",
-                "result": "Category: "
-                + classification_result[0]
-                + ", Subcategory: "
-                + classification_result[1],
-            }
+    # Check if category and subcategory are valid
+    if classification_result[0] == "" or classification_result[1] == "":
+        raise HTTPException(
+            status_code=400,
+            detail="Could not determine category or subcategory.",
         )
 
-        # Check if category and subcategory are valid
-        if classification_result[0] == "" or classification_result[1] == "":
-            raise HTTPException(
-                status_code=400, detail="Could not determine category or subcategory."
-            )
+    # STEP 04: Extract named entities using NER service
+    print(
+        f"[DEBUG] Extracted entities: persons={persons}, locations={locations}, events={events}, organizations={organizations}"
+    )
+    flow.append(
+        {
+            "step": "Named Entity Recognition",
+            "result": f"persons={persons}, locations={locations}, events={events}, organizations={organizations}",
+        }
+    )
 
-        # STEP 04: Extract named entities using NER service
-        persons, locations, events, organizations = extract_named_entities(article_data)
-        print(
-            f"[DEBUG] Extracted entities: persons={persons}, locations={locations}, events={events}, organizations={organizations}"
-        )
-        flow.append(
-            {
-                "step": "Named Entity Recognition",
-                "result": f"persons={persons}, locations={locations}, events={events}, organizations={organizations}",
-            }
-        )
+    formatted_article_data = CheckNewsModel(
+        content=article_data,
+        category=classification_result[0],
+        subcategory=classification_result[1],
+        persons=persons,
+        locations=locations,
+        events=events,
+        organizations=organizations,
+    )
 
-        formatted_article_data = CheckNewsModel(
-            content=article_data,
-            category=classification_result[0],
-            subcategory=classification_result[1],
-            persons=persons,
-            locations=locations,
-            events=events,
-            organizations=organizations,
-        )
+    # STEP 05: Do the similarity checking with ontology.
+    # check_news makes blocking similarity calls, keep it off the event loop.
+    result = await run_in_threadpool(
+        check_news,
+        news_json=formatted_article_data.dict(),
+        ontology_manager=ontology_manager,
+        debug=True,
+        ranking_fields=RANKING_FIELDS if include_trusted_text else ("title", "url"),
+    )
 
-        # STEP 05: Do the similarity checking with ontology.
-        result = check_news(
-            news_json=formatted_article_data.dict(),
-            ontology_manager=ontology_manager,
-            debug=True,
-        )
+    result["flow"] = flow
 
-        result["flow"] = flow
+    return result
 
-        return result
 
-    except Exception as e:
-        logger.error(f"Error verifying news article: {e}")
-        raise HTTPException(
-            status_code=500, detail=f"Error verifying news article: {str(e)}"
-        )
+@app.post("/news/verify", tags=["News Verification"])
+async def verify_news(request: VerifyNewsRequest):
+    """Endpoint to verify a news article"""
+    if not ontology_manager:
+        raise HTTPException(status_code=503, detail="Ontology manager not initialized")
+
+    with request_deadline(REQUEST_DEADLINE):
+        try:
+            # STEP 01: Pre-processing text (remove unnecessary characters, english stop words, etc.)
+            article_data = sinhala_preprocessor.preprocess_text(request.text)
+
+            # Identical verifications in flight share one pipeline execution
+            include_text = request.include_trusted_text
+            return await verification_flight.do(
+                payload_key(article_data, include_text),
+                lambda: _verify_preprocessed(article_data, include_text),
+            )
+
+        except Exception as e:
+            logger.error(f"Error verifying news article: {e}")
+            raise HTTPException(
+                status_code=500, detail=f"Error verifying news article: {str(e)}"
+            )
 
 
 @app.post("/news/verify/simulate", tags=["News Verification"])
@@ -439,10 +996,18 @@ async def check_similarity(request: SimilarityCheckRequest):
         news_data = request.dict()
 
         # Perform similarity check
-        result = get_semantic_similarity_score(
-            news_text=news_data["news_text"],
-            trusted_texts=[news_data["trusted_text"]],
-        )
+        if SIMILARITY_BACKEND == "local":
+            result = max(
+                local_similarity_engine.score_texts(
+                    news_data["news_text"], [news_data["trusted_text"]]
+                ),
+                default=0.0,
+            )
+        else:
+            result = await get_semantic_similarity_score_async(
+                news_text=news_data["news_text"],
+                trusted_texts=[news_data["trusted_text"]],
+            )
 
         return result
 
@@ -472,7 +1037,7 @@ async def detect_news(request: VerifyNewsRequest):
     """Endpoint to detect news"""
     try:
         # Call the news detection function
-        result = get_news_or_not(request.text)
+        result = await get_news_or_not_async(request.text)
         return {"is_news": result}
 
     except Exception as e:
@@ -485,7 +1050,7 @@ async def classify_news(request: VerifyNewsRequest):
     """Endpoint to classify news"""
     try:
         # Call the classification function
-        category, subcategory = get_category_subcategory(request.text)
+        category, subcategory = await get_category_subcategory_async(request.text)
         return {"category": category, "subcategory": subcategory}
 
     except Exception as e:
@@ -498,7 +1063,9 @@ async def extract_entities(request: VerifyNewsRequest):
     """Endpoint to extract named entities from news text"""
     try:
         # Call the NER extraction function
-        persons, locations, events, organizations = extract_named_entities(request.text)
+        persons, locations, events, organizations = await extract_named_entities_async(
+            request.text
+        )
         return {
             "persons": persons,
             "locations": locations,
@@ -0,0 +1,185 @@
+"""
+Ontology compaction / garbage collection.
+
+Removes what ingest leaves behind and nothing reads:
+  1. repeated `hasFullText` / `publisherName` values of one article (same text
+     up to Unicode normalization and whitespace, any datatype), keeping the
+     first one;
+  2. individuals (entities, category individuals, statements, ...) that no
+     NewsArticle reaches through object properties;
+then rewrites the storage (`.owl` file, or VACUUM for the sqlite store).
+
+Work is done in batches of `batch_size`, each holding the manager's write lock
+only briefly, and stops after `max_seconds`, so it can run next to live
+traffic; a later run picks up where the budget ran out. Run from the backend
+directory:
+    python -m modules.dynamic_ontology.compaction --max-seconds 60
+"""
+
+import argparse
+import time
+import unicodedata
+
+from owlready2 import owl_class, owl_named_individual, rdf_type
+
+from .config import COMPACTION_BATCH_SIZE
+
+# Multi-valued literal properties that get a value appended on every re-ingest
+DEDUPED_PROPERTIES = ("hasFullText", "publisherName")
+
+
+def _literal_key(value) -> str:
+    return " ".join(unicodedata.normalize("NFKC", str(value)).split())
+
+
+def duplicate_literal_rows(ontology) -> list[tuple[int, int, str]]:
+    """
+    `(rowid, subject, property python name)` of every redundant
+    DEDUPED_PROPERTIES value.
+    """
+    graph = ontology.world.graph
+    redundant = []
+    for prop_name in DEDUPED_PROPERTIES:
+        prop = getattr(ontology, prop_name)
+        seen = set()
+        rows = graph.execute(
+            "SELECT rowid, s, o FROM datas WHERE p=? ORDER BY s, rowid", (prop.storid,)
+        )
+        for rowid, subject, value in rows:
+            key = (subject, _literal_key(value))
+            if key in seen:
+                redundant.append((rowid, subject, prop.python_name))
+            else:
+                seen.add(key)
+    return redundant
+
+
+def unreachable_individuals(ontology) -> list[int]:
+    """Storids of named individuals that no NewsArticle reaches."""
+    graph = ontology.world.graph
+    articles = [c.storid for c in ontology.NewsArticle.descendants()]
+    placeholders = ",".join("?" * len(articles))
+    rows = graph.execute(
+        f"""
+        WITH RECURSIVE reachable(x) AS (
+            SELECT s FROM objs WHERE p={rdf_type} AND o IN ({placeholders})
+            UNION
+            SELECT objs.o FROM objs JOIN reachable ON objs.s = reachable.x
+            WHERE objs.p != {rdf_type} AND objs.o > 0
+        )
+        SELECT DISTINCT s FROM objs
+        WHERE p={rdf_type} AND o={owl_named_individual}
+          AND s NOT IN (SELECT x FROM reachable)
+          AND s NOT IN (SELECT s FROM objs WHERE p={rdf_type} AND o={owl_class})
+        """,
+        articles,
+    )
+    return [storid for (storid,) in rows]
+
+
+def _batches(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def compact(
+    manager, max_seconds: float | None = None, batch_size: int = COMPACTION_BATCH_SIZE
+) -> dict:
+    """
+    Run one compaction pass (see module docstring) and rewrite the storage.
+    :return: What was removed, triples and bytes reclaimed, and whether the
+        pass finished within `max_seconds`.
+    """
+    start = time.perf_counter()
+    ontology = manager.ontology
+    world = ontology.world
+    graph = world.graph
+
+    def out_of_time():
+        return max_seconds is not None and time.perf_counter() - start > max_seconds
+
+    with manager.write_lock:
+        if manager.shards is not None:
+            manager.shards.load_all()  # an entity may be reached from any shard
+        triples_before = len(graph)
+        bytes_before = manager.storage_bytes()
+        duplicates = duplicate_literal_rows(ontology)
+
+    literals_removed = 0
+    complete = True
+    for batch in _batches(duplicates, batch_size):
+        if out_of_time():
+            complete = False
+            break
+        with manager.write_lock:
+            graph.db.executemany(
+                "DELETE FROM datas WHERE rowid=?", [(rowid,) for rowid, _, _ in batch]
+            )
+            # Loaded entities cache their values; they reload on next access
+            for _, subject, attribute in batch:
+                entity = world._entities.get(subject)
+                if entity is not None:
+                    entity.__dict__.pop(attribute, None)
+        literals_removed += len(batch)
+
+    individuals_removed = 0
+    if complete:
+        with manager.write_lock:
+            orphans = unreachable_individuals(ontology)
+        for batch in _batches(orphans, batch_size):
+            if out_of_time():
+                complete = False
+                break
+            with manager.write_lock:
+                for storid in batch:
+                    # Ingest may have linked it since the scan
+                    referenced = graph.execute(
+                        "SELECT 1 FROM objs WHERE o=? LIMIT 1", (storid,)
+                    ).fetchone()
+                    individual = world._get_by_storid(storid)
+                    if referenced or individual is None:
+                        continue
+                    manager.remove_individual(individual)
+                    individuals_removed += 1
+
+    if literals_removed or individuals_removed:
+        with manager.write_lock:
+            manager.resolver.invalidate()
+            manager.stats.build(ontology)
+            manager.mark_rebuild()
+            manager.rewrite_storage()
+
+    with manager.write_lock:
+        triples_after = len(graph)
+        bytes_after = manager.storage_bytes()
+    return {
+        "complete": complete,
+        "duplicate_literals_removed": literals_removed,
+        "individuals_removed": individuals_removed,
+        "triples_before": triples_before,
+        "triples_after": triples_after,
+        "triples_reclaimed": triples_before - triples_after,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_reclaimed": bytes_before - bytes_after,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def main(argv=None):
+    from .manager import OntologyManager
+
+    parser = argparse.ArgumentParser(description="Compact the ontology.")
+    parser.add_argument("--max-seconds", type=float, default=None)
+    parser.add_argument("--batch-size", type=int, default=COMPACTION_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    manager = OntologyManager()
+    result = compact(manager, args.max_seconds, args.batch_size)
+    print(f"[INFO] Ontology compaction {'done' if result['complete'] else 'paused'}")
+    for key, value in result.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Central place for constants so you don't repeat literals across modules.
 """
 
+import os
 from pathlib import Path
 
 ONTOLOGY_IRI: str = (
@@ -10,3 +11,100 @@ ONTOLOGY_IRI: str = (
 
 # Updated path to point to the ontology file in the root of ontology-sinhala
 ONTOLOGY_FILE: Path = Path(__file__).parent.parent.parent / "new-ontology-v1.owl"
+
+# Storage backend: "rdfxml" re-serializes ONTOLOGY_FILE on every save, "sqlite"
+# keeps the quad store in ONTOLOGY_DB_FILE (WAL) and commits only the changes.
+# Import an existing ONTOLOGY_FILE once with `python -m modules.dynamic_ontology.migrate`.
+ONTOLOGY_STORE: str = os.getenv("ONTOLOGY_STORE", "rdfxml")
+ONTOLOGY_DB_FILE: Path = Path(
+    os.getenv("ONTOLOGY_DB_FILE", str(ONTOLOGY_FILE.with_suffix(".sqlite3")))
+)
+
+# Fast-start snapshot (rdfxml store only): every save also copies the quad store
+# to ONTOLOGY_SNAPSHOT_FILE, which startup restores instead of parsing the .owl
+# file as long as its checksum still matches. Set ONTOLOGY_SNAPSHOT=0 to disable.
+ONTOLOGY_SNAPSHOT: bool = os.getenv("ONTOLOGY_SNAPSHOT", "1") != "0"
+ONTOLOGY_SNAPSHOT_FILE: Path = Path(
+    os.getenv(
+        "ONTOLOGY_SNAPSHOT_FILE", str(ONTOLOGY_FILE.with_suffix(".snapshot.sqlite3"))
+    )
+)
+
+# Category shards (rdfxml store only, see shards.py): articles of each top-level
+# category live in their own .owl file in ONTOLOGY_SHARD_DIR, importing
+# ONTOLOGY_FILE (schema, entities). A shard is loaded on first use; once the
+# loaded shards hold more than ONTOLOGY_SHARD_MAX_TRIPLES triples, the least
+# recently used ones are saved and unloaded. Set ONTOLOGY_SHARDS=1 to enable and
+# split an existing ONTOLOGY_FILE with `python -m modules.dynamic_ontology.shards`.
+ONTOLOGY_SHARDS: bool = os.getenv("ONTOLOGY_SHARDS", "0") == "1"
+ONTOLOGY_SHARD_DIR: Path = Path(
+    os.getenv("ONTOLOGY_SHARD_DIR", str(ONTOLOGY_FILE.with_suffix(".shards")))
+)
+ONTOLOGY_SHARD_MAX_TRIPLES: int = int(
+    os.getenv("ONTOLOGY_SHARD_MAX_TRIPLES", "1000000")
+)
+
+# Write-behind saving: writers only mark the ontology dirty and a background
+# thread saves at most every ONTOLOGY_SAVE_INTERVAL seconds, or as soon as
+# ONTOLOGY_SAVE_MAX_CHANGES changes are pending. Set ONTOLOGY_WRITE_BEHIND=0 to
+# save synchronously on every write.
+ONTOLOGY_WRITE_BEHIND: bool = os.getenv("ONTOLOGY_WRITE_BEHIND", "1") != "0"
+ONTOLOGY_SAVE_INTERVAL: float = float(os.getenv("ONTOLOGY_SAVE_INTERVAL", "5"))
+ONTOLOGY_SAVE_MAX_CHANGES: int = int(os.getenv("ONTOLOGY_SAVE_MAX_CHANGES", "100"))
+
+# Multi-worker deployment (sqlite store only, see workers.py): with
+# ONTOLOGY_MULTI_WORKER=1 the uvicorn workers share ONTOLOGY_DB_FILE. The worker
+# holding ONTOLOGY_WRITER_LOCK_FILE is the writer and serves the writes the other
+# (read-only) workers forward to it on the Unix socket ONTOLOGY_WRITER_SOCKET.
+# Readers pick up committed changes every ONTOLOGY_READER_REFRESH_INTERVAL seconds,
+# so a write is visible everywhere within about ONTOLOGY_SAVE_INTERVAL plus that.
+ONTOLOGY_MULTI_WORKER: bool = os.getenv("ONTOLOGY_MULTI_WORKER", "0") == "1"
+ONTOLOGY_WRITER_LOCK_FILE: Path = Path(
+    os.getenv(
+        "ONTOLOGY_WRITER_LOCK_FILE", str(ONTOLOGY_DB_FILE.with_suffix(".writer.lock"))
+    )
+)
+ONTOLOGY_WRITER_SOCKET: Path = Path(
+    os.getenv(
+        "ONTOLOGY_WRITER_SOCKET", str(ONTOLOGY_DB_FILE.with_suffix(".writer.sock"))
+    )
+)
+ONTOLOGY_READER_REFRESH_INTERVAL: float = float(
+    os.getenv("ONTOLOGY_READER_REFRESH_INTERVAL", "1")
+)
+
+# Articles per commit for the streaming NDJSON ingest endpoint
+BULK_STREAM_CHUNK_SIZE: int = int(os.getenv("BULK_STREAM_CHUNK_SIZE", "500"))
+# Longest accepted NDJSON line (one article) in bytes; a longer line ends the stream
+BULK_STREAM_MAX_LINE_BYTES: int = int(
+    os.getenv("BULK_STREAM_MAX_LINE_BYTES", str(1024 * 1024))
+)
+
+# Articles preprocessed / analysed concurrently by the bulk preprocess-and-populate pipeline
+BULK_PIPELINE_CONCURRENCY: int = int(os.getenv("BULK_PIPELINE_CONCURRENCY", "8"))
+# Highest `concurrency` a bulk request may ask for
+BULK_PIPELINE_MAX_CONCURRENCY: int = int(
+    os.getenv("BULK_PIPELINE_MAX_CONCURRENCY", "32")
+)
+
+# Near-duplicate entity resolution on ingest (see entity_resolution.py): a new
+# entity name that is a spelling variant of an existing name of the same class is
+# attached to that individual as an `alias`. Names are compared token by token:
+# same digits, same number of tokens, the first token and every token shorter
+# than ENTITY_FUZZY_TOKEN_MIN_LENGTH characters equal (after normalization), the
+# other tokens equal up to an inflection suffix of ENTITY_MAX_SUFFIX_LENGTH
+# characters or with a RapidFuzz ratio of at least ENTITY_MATCH_THRESHOLD.
+# Candidates are the names sharing half of their ENTITY_NGRAM_SIZE-grams; n-grams
+# found in more than ENTITY_BLOCK_MAX_POSTINGS names are ignored for blocking.
+# Off by default (only exact names are reused); set ENTITY_RESOLUTION=1 to enable.
+ENTITY_RESOLUTION: bool = os.getenv("ENTITY_RESOLUTION", "0") == "1"
+ENTITY_MATCH_THRESHOLD: float = float(os.getenv("ENTITY_MATCH_THRESHOLD", "92"))
+ENTITY_FUZZY_TOKEN_MIN_LENGTH: int = int(
+    os.getenv("ENTITY_FUZZY_TOKEN_MIN_LENGTH", "6")
+)
+ENTITY_MAX_SUFFIX_LENGTH: int = int(os.getenv("ENTITY_MAX_SUFFIX_LENGTH", "2"))
+ENTITY_NGRAM_SIZE: int = int(os.getenv("ENTITY_NGRAM_SIZE", "3"))
+ENTITY_BLOCK_MAX_POSTINGS: int = int(os.getenv("ENTITY_BLOCK_MAX_POSTINGS", "2000"))
+
+# Individuals / duplicate values removed per write-lock hold by the compaction job
+COMPACTION_BATCH_SIZE: int = int(os.getenv("COMPACTION_BATCH_SIZE", "500"))
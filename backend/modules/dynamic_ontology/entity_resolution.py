@@ -0,0 +1,297 @@
+"""
+Near-duplicate entity resolution for named-entity individuals.
+
+`OntologyManager.get_or_create_entity` only finds an existing individual when
+the safe name matches exactly, so spelling variants ("ඇන්ජලෝ මැතිව්ස්" vs
+"ඇන්ජලෝ මැතිව්ස්ගේ") used to become separate individuals. `EntityResolver`
+indexes every `canonicalName` and `alias` per class by character n-grams
+(blocking), compares the few candidates sharing enough n-grams token by token,
+and returns the individual a new name should be attached to as an `alias`.
+Only later, long tokens may differ (an inflection suffix, a typo); first names
+and short tokens must be equal, so "Namal Rajapaksa" never absorbs "Chamal
+Rajapaksa", nor "Asia Cup" "Asia Cap". Names whose digits differ ("... 2023" vs
+"... 2024") are never merged.
+
+`merge_duplicates` applies the same matching to individuals that already exist
+and folds each group of variants into one individual; every member of a group
+is a variant of every other one. Run it from the backend
+directory:
+    python -m modules.dynamic_ontology.entity_resolution --dry-run
+"""
+
+import argparse
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+
+from rapidfuzz.fuzz import ratio
+
+from .config import (
+    ENTITY_BLOCK_MAX_POSTINGS,
+    ENTITY_FUZZY_TOKEN_MIN_LENGTH,
+    ENTITY_MATCH_THRESHOLD,
+    ENTITY_MAX_SUFFIX_LENGTH,
+    ENTITY_NGRAM_SIZE,
+)
+
+# Named-entity classes that are resolved
+RESOLVED_CLASSES = ("Person", "Location", "Event", "Organization")
+
+_DIGITS = re.compile(r"\d+")
+
+
+def normalize(name: str) -> str:
+    normalized = unicodedata.normalize("NFKC", str(name)).casefold()
+    chars = []
+    for c in normalized:
+        category = unicodedata.category(c)
+        if c.isalnum() or category in ("Mn", "Mc"):  # vowel signs, virama
+            chars.append(c)
+        elif category != "Cf":  # joiners (ZWJ in "ක්‍ර") only change rendering
+            chars.append(" ")
+    return " ".join("".join(chars).split())
+
+
+def ngrams(normalized: str, size: int = ENTITY_NGRAM_SIZE) -> set[str]:
+    padded = f" {normalized} "
+    return {padded[i : i + size] for i in range(max(1, len(padded) - size + 1))}
+
+
+def individual_names(individual) -> list[str]:
+    names = [individual.canonicalName] + list(individual.alias)
+    return list(dict.fromkeys(str(n) for n in names if n))
+
+
+class _ClassIndex:
+    """Names of one class: exact (normalized) lookup plus an n-gram inverted index."""
+
+    def __init__(self):
+        self.exact: dict[str, int] = {}  # normalized name -> storid
+        self.names: list[tuple[str, int]] = []  # (normalized name, storid)
+        self.postings: dict[str, list[int]] = defaultdict(list)  # n-gram -> name ids
+
+    def add(self, normalized: str, storid: int):
+        if normalized in self.exact:
+            return
+        self.exact[normalized] = storid
+        name_id = len(self.names)
+        self.names.append((normalized, storid))
+        for gram in ngrams(normalized):
+            self.postings[gram].append(name_id)
+
+    def candidates(self, normalized: str) -> list[int]:
+        """
+        Ids of names sharing at least half of `normalized`'s n-grams. Very
+        common n-grams (shared suffixes) do not discriminate and are skipped.
+        """
+        shared = Counter()
+        usable = 0
+        for gram in ngrams(normalized):
+            posting = self.postings.get(gram, ())
+            if len(posting) > ENTITY_BLOCK_MAX_POSTINGS:
+                continue
+            usable += 1
+            shared.update(posting)
+        needed = math.ceil(usable / 2)
+        return [name_id for name_id, count in shared.items() if count >= needed]
+
+
+class EntityResolver:
+    def __init__(self, threshold: float = ENTITY_MATCH_THRESHOLD):
+        self.threshold = threshold
+        self._classes: dict[str, _ClassIndex] = {}
+        self._ontology = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ontology is not None
+
+    # ------------------------------------------------------------------ utils
+
+    def matches(self, a: str, b: str) -> bool:
+        """Whether normalized names `a` and `b` are spellings of the same name."""
+        if a == b:
+            return True
+        tokens_a, tokens_b = a.split(), b.split()
+        if len(tokens_a) != len(tokens_b) or _DIGITS.findall(a) != _DIGITS.findall(b):
+            return False
+        for position, (x, y) in enumerate(zip(tokens_a, tokens_b)):
+            if x == y:
+                continue
+            if position == 0 or min(len(x), len(y)) < ENTITY_FUZZY_TOKEN_MIN_LENGTH:
+                return False
+            shorter, longer = sorted((x, y), key=len)
+            inflected = (
+                longer.startswith(shorter)
+                and len(longer) - len(shorter) <= ENTITY_MAX_SUFFIX_LENGTH
+            )
+            if not inflected and ratio(x, y) < self.threshold:
+                return False
+        return True
+
+    def _best(self, index: _ClassIndex, normalized: str):
+        best, best_score = None, -1.0
+        for name_id in index.candidates(normalized):
+            candidate, storid = index.names[name_id]
+            if not self.matches(normalized, candidate):
+                continue
+            score = ratio(normalized, candidate)
+            if score > best_score:
+                best, best_score = storid, score
+        return best
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)index the names of all individuals of `RESOLVED_CLASSES`."""
+        with self._lock:
+            self._ontology = ontology
+            self._classes = {}
+            for class_name in RESOLVED_CLASSES:
+                index = self._classes[class_name] = _ClassIndex()
+                for individual in getattr(ontology, class_name).instances():
+                    for name in individual_names(individual):
+                        index.add(normalize(name), individual.storid)
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt on the next `OntologyManager` lookup."""
+        with self._lock:
+            self._ontology = None
+            self._classes = {}
+
+    def add(self, cls, name: str, storid: int):
+        """Index `name` as a name of individual `storid` of class `cls`."""
+        with self._lock:
+            index = self._classes.get(cls.name)
+            if index is not None:
+                index.add(normalize(name), storid)
+
+    def resolve(self, cls, name: str) -> int | None:
+        """
+        Storid of the existing `cls` individual `name` is a variant of (same
+        normalized name, or `matches`), or None.
+        """
+        normalized = normalize(name)
+        if not normalized:
+            return None
+        with self._lock:
+            index = self._classes.get(cls.name)
+            if index is None:
+                return None
+            storid = index.exact.get(normalized)
+            if storid is None:
+                storid = self._best(index, normalized)
+            return storid
+
+    def duplicate_groups(self, class_name: str) -> list[list[int]]:
+        """
+        Groups (storids) of `class_name` individuals whose names are variants.
+        Complete linkage: an individual only joins a group if one of its names
+        matches a name of every member, so A~B and B~C do not pull A and C
+        together unless A~C too.
+        """
+        with self._lock:
+            index = self._classes.get(class_name, _ClassIndex())
+            names = defaultdict(list)  # storid -> normalized names
+            for normalized, storid in index.names:
+                names[storid].append(normalized)
+
+            def related(s, t):
+                return any(self.matches(a, b) for a in names[s] for b in names[t])
+
+            groups: list[list[int]] = []
+            group_of: dict[int, int] = {}
+            for storid, own in names.items():
+                near = {
+                    index.names[name_id][1]
+                    for normalized in own
+                    for name_id in index.candidates(normalized)
+                }
+                joined = None
+                for group_id in sorted({group_of[s] for s in near if s in group_of}):
+                    if all(related(storid, member) for member in groups[group_id]):
+                        joined = group_id
+                        break
+                if joined is None:
+                    joined = len(groups)
+                    groups.append([])
+                groups[joined].append(storid)
+                group_of[storid] = joined
+        return [group for group in groups if len(group) > 1]
+
+
+def _references(world, storid: int) -> int:
+    return world.graph.execute(
+        "SELECT COUNT(*) FROM objs WHERE o=?", (storid,)
+    ).fetchone()[0]
+
+
+def merge_duplicates(manager, dry_run: bool = False) -> dict:
+    """
+    Fold every group of near-duplicate individuals into its most referenced
+    member: references move to the survivor, the other names become its
+    `alias` values, and the duplicates are destroyed.
+    Callers must hold `manager.write_lock` and save afterwards.
+    :return: Counts, and the merged names per class.
+    """
+    ontology = manager.ontology
+    world = ontology.world
+    if manager.shards is not None:
+        manager.shards.load_all()  # references to the duplicates may be in any shard
+    resolver = EntityResolver(manager.resolver.threshold)
+    resolver.build(ontology)
+
+    merged = {}
+    removed = 0
+    for class_name in RESOLVED_CLASSES:
+        cls = getattr(ontology, class_name)
+        report = []
+        for group in resolver.duplicate_groups(class_name):
+            members = [world._get_by_storid(storid) for storid in group]
+            members.sort(key=lambda e: (-_references(world, e.storid), e.name))
+            survivor, duplicates = members[0], members[1:]
+            report.append(
+                {
+                    "into": survivor.canonicalName,
+                    "merged": [d.canonicalName for d in duplicates],
+                }
+            )
+            if not dry_run:
+                for duplicate in duplicates:
+                    manager.merge_entity(cls, duplicate, survivor)
+            removed += len(duplicates)
+        if report:
+            merged[class_name] = report
+
+    if not dry_run:
+        manager.resolver.build(ontology)
+        if removed:
+            manager.mark_rebuild()
+    return {"dry_run": dry_run, "removed": removed, "merged": merged}
+
+
+def main(argv=None):
+    from .manager import OntologyManager
+
+    parser = argparse.ArgumentParser(description="Merge near-duplicate entities.")
+    parser.add_argument("--dry-run", action="store_true", help="only report groups")
+    args = parser.parse_args(argv)
+
+    manager = OntologyManager()
+    with manager.write_lock:
+        result = merge_duplicates(manager, dry_run=args.dry_run)
+    if not args.dry_run and result["removed"]:
+        manager.save()
+    print(
+        f"[INFO] {'Would merge' if args.dry_run else 'Merged'} {result['removed']} entities"
+    )
+    for class_name, groups in result["merged"].items():
+        for group in groups:
+            print(f"  {class_name}: {group['merged']} -> {group['into']!r}")
+
+
+if __name__ == "__main__":
+    main()
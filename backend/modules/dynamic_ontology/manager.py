@@ -1,13 +1,55 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from owlready2 import get_ontology
+from owlready2 import (
+    FunctionalProperty,
+    ObjectProperty,
+    default_world,
+    destroy_entity,
+    get_ontology,
+)
 
-from .config import ONTOLOGY_FILE, ONTOLOGY_IRI
+from .config import (
+    ENTITY_RESOLUTION,
+    ONTOLOGY_DB_FILE,
+    ONTOLOGY_FILE,
+    ONTOLOGY_IRI,
+    ONTOLOGY_SAVE_INTERVAL,
+    ONTOLOGY_SAVE_MAX_CHANGES,
+    ONTOLOGY_SHARD_DIR,
+    ONTOLOGY_SHARDS,
+    ONTOLOGY_SNAPSHOT,
+    ONTOLOGY_SNAPSHOT_FILE,
+    ONTOLOGY_STORE,
+)
 from .models import FormattedNewsArticle
+from .entity_resolution import EntityResolver, individual_names
+from .shards import ShardSet
+from .stats import OntologyStats
+from .snapshot import HashingWriter, file_checksum, load_snapshot, write_snapshot
 from . import schema
 import unicodedata
 
 
+def open_quadstore(db_path: Path, read_only: bool = False):
+    """
+    Back owlready2's default world with the SQLite file `db_path`, in WAL mode;
+    with `read_only`, opened without ever taking SQLite's write lock.
+    """
+    if read_only:
+        default_world.set_backend(
+            filename=str(db_path), exclusive=False, read_only=True
+        )
+    else:
+        default_world.set_backend(
+            filename=str(db_path), exclusive=False, journal_mode="WAL"
+        )
+
+
 class OntologyManager:
     """
     Load an existing ontology from disk or create a new one.
@@ -15,18 +57,123 @@ class OntologyManager:
     `news_ontology.schema`, so this class stays compact and readable.
     """
 
-    def __init__(self, path: Path = ONTOLOGY_FILE, iri: str = ONTOLOGY_IRI):
+    def __init__(
+        self,
+        path: Path = ONTOLOGY_FILE,
+        iri: str = ONTOLOGY_IRI,
+        store: str = ONTOLOGY_STORE,
+        db_path: Path = ONTOLOGY_DB_FILE,
+        snapshot_path: Path | None = ONTOLOGY_SNAPSHOT_FILE
+        if ONTOLOGY_SNAPSHOT
+        else None,
+        resolve_entities: bool = ENTITY_RESOLUTION,
+        shard_dir: Path | None = ONTOLOGY_SHARD_DIR if ONTOLOGY_SHARDS else None,
+        read_only: bool = False,
+    ):
         self.path = Path(path)
         self.iri = iri
+        self.store = store
+        self.db_path = Path(db_path)
+        # Reader worker of a multi-worker deployment, see `workers.py`
+        self.read_only = read_only
+        if shard_dir is not None and store == "sqlite":
+            raise ValueError("[ERROR] Category shards need the rdfxml store.")
+        if read_only and store != "sqlite":
+            raise ValueError("[ERROR] A read-only ontology needs the sqlite store.")
+        # Binary fast-start snapshot of the rdfxml store, see `snapshot.py`; not
+        # with shards, it would capture whichever shards happen to be loaded
+        self.snapshot_path = (
+            Path(snapshot_path)
+            if snapshot_path and store != "sqlite" and shard_dir is None
+            else None
+        )
+        # Per-category article shards, see `shards.py`; None: one ontology file
+        self.shards = ShardSet(self, shard_dir) if shard_dir is not None else None
+        self._article_listeners = []
+        self._shard_listeners = []
+        self._individual_index = None  # (class name, name) -> storid, see `_index`
+        self._index_keys = {}  # storid -> its keys in `_individual_index`
+        self.stats = OntologyStats()
+        # Near-duplicate names, see `_variant_of`; built on first use
+        self.resolve_entities = resolve_entities
+        self.resolver = EntityResolver()
 
-        if self.path.exists():
-            print(f"[DEBUG] Loading ontology from: {self.path}")
-            self.ontology = get_ontology(str(self.path)).load()
+        # Writers hold `write_lock` while mutating; saves hold it while writing out.
+        # Request threads hold it while reading the world or the indexes built
+        # from it (see `checker._ontology_reads`), never across remote calls
+        self.write_lock = threading.RLock()
+        self._dirty = threading.Condition()
+        self._pending_changes = 0
+        self._first_dirty = 0.0
+        self._flusher = None
+        self._closing = False
+        self.save_interval = ONTOLOGY_SAVE_INTERVAL
+        self.save_max_changes = ONTOLOGY_SAVE_MAX_CHANGES
+        self.saves = 0
+        self.last_save_seconds = None
+
+        start = time.perf_counter()
+        if self.store == "sqlite":
+            self.loaded_from = "sqlite"
+            self._open_sqlite_store()
+        elif self.path.exists():
+            self._load_file()
         else:
+            self.loaded_from = "new"
             self.ontology = get_ontology(self.iri)
             schema.build_all(self.ontology)  # only once
             self.save()  # create file on disk
             print(f"[DEBUG] Created new ontology at: {self.path}")
+        self.load_seconds = time.perf_counter() - start
+        print(
+            f"[INFO] Ontology loaded in {self.load_seconds:.3f}s "
+            f"(loaded from: {self.loaded_from})"
+        )
+
+        self.stats.build(self.ontology)
+        self.add_article_listener(self.stats.on_article_populated)
+        self.add_shard_listener(self.stats.on_shard_changed)
+
+    def _load_file(self):
+        checksum = file_checksum(self.path) if self.snapshot_path else None
+        if checksum is not None:
+            iri = load_snapshot(default_world, self.snapshot_path, checksum)
+            if iri is not None:
+                print(f"[DEBUG] Loading ontology from snapshot: {self.snapshot_path}")
+                self.ontology = get_ontology(iri).load()
+                self.loaded_from = "snapshot"
+                return
+            print(f"[DEBUG] No fresh snapshot at {self.snapshot_path}")
+
+        print(f"[DEBUG] Loading ontology from: {self.path}")
+        self.ontology = get_ontology(str(self.path)).load()
+        self.loaded_from = "rdfxml"
+        if checksum is not None:
+            self._save_snapshot(checksum)  # so the next start can skip parsing
+
+    def _open_sqlite_store(self):
+        if self.read_only and not self.db_path.exists():
+            raise RuntimeError(f"Quad store {self.db_path} does not exist yet")
+        open_quadstore(self.db_path, read_only=self.read_only)
+        self.ontology = get_ontology(self.iri)
+        if self.ontology.NewsArticle is not None:
+            print(f"[DEBUG] Loading ontology from quad store: {self.db_path}")
+            self.ontology.load()
+            if self.read_only:
+                # Opening leaves a read transaction, which would pin this
+                # connection to the current commit
+                self.ontology.world.graph.db.commit()
+        elif self.read_only:
+            raise RuntimeError(f"Quad store {self.db_path} has no ontology yet")
+        elif self.path.exists():
+            raise RuntimeError(
+                f"Quad store {self.db_path} has no ontology yet; import {self.path} "
+                "with `python -m modules.dynamic_ontology.migrate` first"
+            )
+        else:
+            schema.build_all(self.ontology)  # only once
+            self.save()
+            print(f"[DEBUG] Created new ontology in quad store: {self.db_path}")
 
     # ------------------------------------------------------------------ utils
 
@@ -38,12 +185,68 @@ class OntologyManager:
         safe = "".join(c if c.isalnum() else "_" for c in normalized)
         return safe[:64] if safe else "unnamed_entity"
 
+    def _index(self) -> dict[tuple[str, str], int]:
+        """Exact-name index of existing individuals, built on first use."""
+        if self._individual_index is None:
+            self._individual_index, self._index_keys = {}, {}
+            for individual in self.ontology.individuals():
+                for cls in individual.is_a:
+                    self._index_put((cls.name, individual.name), individual.storid)
+        return self._individual_index
+
+    def _index_put(self, key: tuple[str, str], storid: int):
+        previous = self._individual_index.get(key)
+        if previous is not None and previous != storid:
+            self._index_keys.get(previous, set()).discard(key)
+        self._individual_index[key] = storid
+        self._index_keys.setdefault(storid, set()).add(key)
+
+    def _index_drop(self, storid: int) -> set[tuple[str, str]]:
+        """Remove the index entries of `storid`; returns their keys."""
+        keys = self._index_keys.pop(storid, set())
+        for key in keys:
+            self._individual_index.pop(key, None)
+        return keys
+
+    def _lookup(self, cls, name: str):
+        storid = self._index().get((cls.name, name))
+        if storid is not None:
+            return self.ontology.world._get_by_storid(storid)
+        # Same IRI under another class (or a punned class): reuse it as before
+        existing = self.ontology.world[self.ontology.base_iri + name]
+        if existing is not None:
+            self._index_put((cls.name, name), existing.storid)
+        return existing
+
+    def _remember(self, cls, individual):
+        if self._individual_index is not None:
+            self._index_put((cls.name, individual.name), individual.storid)
+
+    def _forget(self, storids: set[int]):
+        """Drop unloaded / destroyed individuals from the exact-name index."""
+        if self._individual_index is not None:
+            for storid in storids:
+                self._index_drop(storid)
+
     # ------------------------------------------------------------------ public
 
-    def add_article(self, article: FormattedNewsArticle):
-        with self.ontology:
+    def add_article(self, article: FormattedNewsArticle, category: str | None = None):
+        """
+        Create or update the article individual. With category shards the
+        article is stored in the shard of `category`.
+        """
+        namespace = self.ontology
+        if self.shards is not None and category is not None:
+            namespace = self.shards.writable_namespace(category)
+        # Triples (values set below included) go to the entered namespace's ontology
+        with namespace:
             NewsArticle = self.ontology.NewsArticle  # local shortcut
-            individual = NewsArticle(self._safe_name(article.url))
+            name = self._safe_name(article.url)
+            created = self._lookup(NewsArticle, name) is None
+            individual = NewsArticle(name)
+            if created:
+                self._remember(NewsArticle, individual)
+                self.stats.on_individual_created(NewsArticle)
 
             # functional props → normal assignment
             individual.hasTitle = article.headline
@@ -54,30 +257,400 @@ class OntologyManager:
             # multi-valued props → .append()
             individual.hasFullText.append(article.content)
             individual.publisherName.append(article.source)
+        # Counted now too, in case populating the rest of the article fails
+        self.stats.on_article_populated(individual, None)
         return individual
 
-    def save(self, fmt: str = "rdfxml"):
-        # Ensure the path is passed as a string to avoid issues with PosixPath
-        self.ontology.save(file=str(self.path), format=fmt)
-        print(f"[DEBUG] Ontology saved to: {self.path}")
+    def _variant_of(self, cls, name: str, safe_name: str):
+        """
+        The existing `cls` individual `name` is a spelling variant of, with
+        `name` added to its aliases, or None.
+        """
+        if not self.resolver.ready:
+            self.resolver.build(self.ontology)
+        storid = self.resolver.resolve(cls, name)
+        if storid is None:
+            return None
+        individual = self.ontology.world._get_by_storid(storid)
+        if name != individual.canonicalName and name not in individual.alias:
+            with self.ontology:
+                individual.alias.append(name)
+        print(f"[DEBUG] {name!r} is a variant of {individual.canonicalName!r}")
+        self.resolver.add(cls, name, storid)
+        self._index()[(cls.name, safe_name)] = storid
+        return individual
 
-    def get_ontology_stats(self):
-        """Get basic statistics about the ontology"""
+    def get_or_create_entity(self, cls, name: str):
+        """
+        The `cls` individual for entity `name`, created (with its canonicalName)
+        if missing. O(1) exact lookup on (class, safe name); with entity
+        resolution on, close spelling variants reuse the existing individual.
+        """
+        safe_name = self._safe_name(name)
+        print(f"[DEBUG] Safe name for {name}: {safe_name}")
+        existing = self._lookup(cls, safe_name)
+        if existing is not None:
+            return existing
+        if self.resolve_entities:
+            existing = self._variant_of(cls, name, safe_name)
+            if existing is not None:
+                return existing
         with self.ontology:
-            articles = list(self.ontology.NewsArticle.instances())
-            persons = list(self.ontology.Person.instances())
-            organizations = list(self.ontology.Organization.instances())
-            locations = list(self.ontology.Location.instances())
-            events = list(self.ontology.Event.instances())
-
-            return {
-                "articles": len(articles),
-                "persons": len(persons),
-                "organizations": len(organizations),
-                "locations": len(locations),
-                "events": len(events),
-                "total_entities": len(persons)
-                + len(organizations)
-                + len(locations)
-                + len(events),
-            }
+            individual = cls(safe_name)
+            individual.canonicalName = name
+        self._remember(cls, individual)
+        self.stats.on_individual_created(cls)
+        if self.resolver.ready:
+            self.resolver.add(cls, name, individual.storid)
+        return individual
+
+    def merge_entity(self, cls, duplicate, survivor):
+        """
+        Fold `duplicate` into `survivor`: every reference to `duplicate` is
+        moved to `survivor`, its names become aliases of `survivor`, and
+        `duplicate` is destroyed. Callers hold `write_lock`.
+        """
+        world = self.ontology.world
+        graph = world.graph
+        referrers = graph.execute(
+            "SELECT DISTINCT s, p FROM objs WHERE o=?", (duplicate.storid,)
+        ).fetchall()
+        # Rows that would duplicate an existing survivor triple stay behind
+        # and go away with `duplicate`
+        graph.execute(
+            "UPDATE OR IGNORE objs SET o=? WHERE o=?",
+            (survivor.storid, duplicate.storid),
+        )
+        names = individual_names(duplicate)
+        with self.ontology:
+            for name in names:
+                if name != survivor.canonicalName and name not in survivor.alias:
+                    survivor.alias.append(name)
+        destroy_entity(duplicate)
+
+        # Cached property values of the referrers still hold `duplicate`
+        for s, p in referrers:
+            subject, prop = world._entities.get(s), world._entities.get(p)
+            if prop is None:
+                continue
+            if subject is not None and hasattr(subject.__dict__, "pop"):
+                subject.__dict__.pop(prop.python_name, None)
+            survivor.__dict__.pop(f"INVERSE_{prop.python_name}", None)
+
+        if self._individual_index is not None:
+            for key in self._index_drop(duplicate.storid):
+                self._index_put(key, survivor.storid)
+        if self.shards is not None:
+            self.shards.mark_dirty()  # referrers may be in any loaded shard
+        self.stats.on_individual_destroyed(cls)
+
+    def remove_individual(self, individual):
+        """
+        Destroy `individual` (and every triple mentioning it) and drop it from
+        the exact-name index. Callers hold `write_lock`.
+        """
+        storid = individual.storid
+        destroy_entity(individual)
+        if self._individual_index is not None:
+            self._index_drop(storid)
+
+    def get_or_create_category(self, cls, name: str):
+        """The `cls` individual named after category `name`, created if missing."""
+        print(f"[DEBUG] Safe name for category {name}: {name}")
+        existing = self._lookup(cls, name)
+        if existing is not None:
+            return existing
+        with self.ontology:
+            individual = cls(name)
+        self._remember(cls, individual)
+        return individual
+
+    def link_entities(self, article, links) -> int:
+        """
+        Add `article -> entity` triples for every `(property name, entities)`
+        pair in `links`, in one batched insert instead of one `.append()` per
+        entity. Triples that already exist are skipped.
+        :return: Number of distinct triples submitted.
+        """
+        rows = {}
+        cached_names = {}  # property storid -> (attribute, inverse attribute)
+        for prop_name, entities in links:
+            prop = getattr(self.ontology, prop_name, None)
+            if prop is None or not issubclass(prop, ObjectProperty):
+                raise ValueError(
+                    f"[ERROR] Object property '{prop_name}' not found in ontology."
+                )
+            if issubclass(prop, FunctionalProperty):
+                raise ValueError(f"[ERROR] '{prop_name}' is functional; assign it.")
+            inverse = prop.inverse_property
+            cached_names[prop.storid] = (
+                prop.python_name,
+                inverse.python_name if inverse else f"INVERSE_{prop.python_name}",
+            )
+            for entity in entities:
+                rows[(article.storid, prop.storid, entity.storid)] = entity
+        if not rows:
+            return 0
+
+        # Same statement owlready2 runs per appended value, batched; then its
+        # bookkeeping (statistics refresh, stale attribute caches) once. The
+        # triples go to the article's ontology (its shard, if sharded).
+        graph = article.namespace.ontology.graph
+        graph.db.executemany(
+            "INSERT OR IGNORE INTO objs VALUES (?, ?, ?, ?)",
+            [(graph.c, s, p, o) for s, p, o in rows],
+        )
+        graph.parent.nb_added_triples += len(rows)
+        if graph.parent.nb_added_triples > 1000:
+            graph.parent.analyze()
+
+        for name, _ in cached_names.values():
+            article.__dict__.pop(name, None)
+        for (_, prop_storid, _), entity in rows.items():
+            if hasattr(entity.__dict__, "pop"):  # not for (punned) classes
+                entity.__dict__.pop(cached_names[prop_storid][1], None)
+        return len(rows)
+
+    def add_article_listener(self, listener):
+        """
+        Register `listener(article_individual, data)` to be called after an
+        article has been fully populated (see `populator.populate_article_from_json`).
+        In-memory indexes use this to stay in sync with the ontology.
+        """
+        self._article_listeners.append(listener)
+
+    def notify_article_populated(self, article, data):
+        for listener in self._article_listeners:
+            listener(article, data)
+
+    def add_shard_listener(self, listener):
+        """
+        Register `listener(categories, articles, loaded)` to be called when a
+        category shard is loaded (`loaded=True`) or about to be unloaded
+        (`loaded=False`); `categories` are the category names of the shard and
+        `articles` its article individuals. Never called without shards.
+        """
+        self._shard_listeners.append(listener)
+
+    def notify_shard_changed(self, categories: set[str], articles: list, loaded: bool):
+        for listener in self._shard_listeners:
+            listener(categories, articles, loaded)
+
+    def _write_file(self, path: Path, fmt: str, ontology=None) -> str:
+        """
+        Write the ontology (or `ontology`, e.g. a shard) to `path`; returns the
+        SHA-256 of the written bytes.
+        """
+        # Write next to the target and rename, so readers never see a partial file
+        tmp = path.with_name(f".{path.name}.tmp")
+        with open(tmp, "wb") as f:
+            writer = HashingWriter(f)
+            if ontology is None:
+                ontology = self.ontology
+            ontology.save(file=writer, format=fmt)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return writer.hexdigest()
+
+    def _save_snapshot(self, checksum: str):
+        # Only an optimization: the .owl file is already safely on disk
+        try:
+            write_snapshot(
+                self.ontology.world,
+                self.snapshot_path,
+                checksum,
+                self.ontology.base_iri,
+            )
+        except Exception as e:
+            print(
+                f"[ERROR] Could not write ontology snapshot {self.snapshot_path}: {e}"
+            )
+
+    def save(self, fmt: str = "rdfxml"):
+        """
+        Persist the ontology now. With the "sqlite" store this commits the changed
+        triples only; otherwise the whole ontology is written to `self.path`.
+        """
+        if self.read_only:
+            raise RuntimeError("[ERROR] Read-only ontology; the writer worker saves.")
+        with self.write_lock:
+            start = time.perf_counter()
+            if self.store == "sqlite":
+                self.ontology.world.save()
+            else:
+                checksum = self._write_file(self.path, fmt)
+                print(f"[DEBUG] Ontology saved to: {self.path}")
+                if self.snapshot_path is not None:
+                    self._save_snapshot(checksum)
+                if self.shards is not None:
+                    self.shards.save()
+            self.saves += 1
+            self.last_save_seconds = time.perf_counter() - start
+
+    def storage_bytes(self) -> int:
+        """On-disk size of the persisted ontology (sqlite store: db + WAL)."""
+        paths = (
+            [self.db_path, Path(f"{self.db_path}-wal")]
+            if self.store == "sqlite"
+            else [self.path]
+        )
+        shard_bytes = self.shards.storage_bytes() if self.shards is not None else 0
+        return sum(path.stat().st_size for path in paths if path.exists()) + shard_bytes
+
+    def rewrite_storage(self):
+        """
+        Save, then give freed space back: the rdfxml store rewrites the whole
+        file anyway; the sqlite store is vacuumed.
+        """
+        with self.write_lock:
+            if self.shards is not None:
+                self.shards.mark_dirty()
+            self.save()
+            if self.store == "sqlite":
+                db = self.ontology.world.graph.db
+                db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                db.execute("VACUUM")
+                db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def mark_rebuild(self):
+        """
+        Record, with the next save, that data was removed (compaction, duplicate
+        merging): reader workers (see `workers.py`) then rebuild their in-memory
+        indexes instead of only adding the newly populated articles. sqlite
+        store only; single-process deployments need no notice.
+        """
+        if self.store != "sqlite":
+            return
+        with self.write_lock:
+            db = self.ontology.world.graph.db
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS ontology_sync "
+                "(id INTEGER PRIMARY KEY CHECK (id = 0), epoch INTEGER NOT NULL)"
+            )
+            db.execute(
+                "INSERT INTO ontology_sync VALUES (0, 1) "
+                "ON CONFLICT(id) DO UPDATE SET epoch = epoch + 1"
+            )
+
+    def sync_epoch(self) -> int:
+        """How many times `mark_rebuild` has been committed (sqlite store)."""
+        if self.store != "sqlite":
+            return 0
+        try:
+            row = self.ontology.world.graph.db.execute(
+                "SELECT epoch FROM ontology_sync"
+            ).fetchone()
+        except sqlite3.OperationalError:  # never marked
+            return 0
+        return row[0] if row else 0
+
+    def export_snapshot(self, path: Path | None = None, fmt: str = "rdfxml") -> Path:
+        """
+        Write the full ontology to `path` (default: the .owl file) and return it.
+        With category shards that is the main ontology only; shards are files
+        of their own.
+        """
+        path = Path(path) if path is not None else self.path
+        with self.write_lock:
+            self._write_file(path, fmt)
+        print(f"[DEBUG] Ontology snapshot exported to: {path}")
+        return path
+
+    # ------------------------------------------------------------ write-behind
+
+    def mark_dirty(self, changes: int = 1):
+        """
+        Record `changes` unsaved writes. They are saved by the write-behind
+        thread when it runs (see `start_write_behind`), otherwise right away.
+        """
+        with self._dirty:
+            if not self._pending_changes:
+                self._first_dirty = time.monotonic()
+            self._pending_changes += changes
+            self._dirty.notify()
+            write_behind = self._flusher is not None
+        if not write_behind:
+            self.flush()
+
+    def flush(self):
+        """Save now if there are unsaved changes (bulk endpoints, shutdown)."""
+        with self.write_lock:
+            with self._dirty:
+                pending, self._pending_changes = self._pending_changes, 0
+            if not pending:
+                return
+            try:
+                self.save()
+            except Exception:
+                with self._dirty:
+                    self._pending_changes += pending
+                raise
+
+    def start_write_behind(
+        self,
+        interval: float = ONTOLOGY_SAVE_INTERVAL,
+        max_changes: int = ONTOLOGY_SAVE_MAX_CHANGES,
+    ):
+        """Save from a background thread; `close()` (also run at exit) flushes."""
+        if self._flusher is not None:
+            return
+        self.save_interval = interval
+        self.save_max_changes = max_changes
+        self._closing = False
+        self._flusher = threading.Thread(
+            target=self._write_behind_loop, name="ontology-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _write_behind_loop(self):
+        while True:
+            with self._dirty:
+                self._dirty.wait_for(lambda: self._pending_changes or self._closing)
+                deadline = self._first_dirty + self.save_interval
+                self._dirty.wait_for(
+                    lambda: self._closing
+                    or self._pending_changes >= self.save_max_changes,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                )
+                if self._closing:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[ERROR] Background ontology save failed: {e}")
+                time.sleep(self.save_interval)
+
+    def close(self):
+        """Stop the write-behind thread and save whatever is still pending."""
+        flusher = self._flusher
+        if flusher is not None:
+            with self._dirty:
+                self._closing = True
+                self._dirty.notify_all()
+            flusher.join()
+            self._flusher = None
+        self.flush()
+
+    def persistence_stats(self) -> dict:
+        with self._dirty:
+            pending = self._pending_changes
+        return {
+            "store": self.store,
+            "read_only": self.read_only,
+            "write_behind": self._flusher is not None,
+            "pending_changes": pending,
+            "saves": self.saves,
+            "last_save_seconds": self.last_save_seconds,
+            "loaded_from": self.loaded_from,
+            "load_seconds": round(self.load_seconds, 3),
+            "shards": self.shards.stats() if self.shards is not None else None,
+        }
+
+    def get_ontology_stats(self, breakdowns: bool = True) -> dict:
+        """
+        Counts of articles and entities, plus articles per category and per
+        publisher. Read from counters, so cheap enough for health probes.
+        """
+        return self.stats.snapshot(breakdowns)
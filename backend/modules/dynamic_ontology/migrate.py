@@ -0,0 +1,65 @@
+"""
+Import an RDF/XML ontology file into the SQLite quad store used when
+ONTOLOGY_STORE=sqlite.
+
+Run from the backend directory:
+    python -m modules.dynamic_ontology.migrate
+    python -m modules.dynamic_ontology.migrate --owl new-ontology-v1.owl --db new-ontology-v1.sqlite3
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from owlready2 import default_world, get_ontology
+
+from .config import ONTOLOGY_DB_FILE, ONTOLOGY_FILE
+from .manager import open_quadstore
+
+
+def migrate(owl_path: Path, db_path: Path, force: bool = False) -> dict:
+    """
+    Load `owl_path` into a new quad store at `db_path`.
+    :return: Counts of what was imported.
+    """
+    owl_path, db_path = Path(owl_path), Path(db_path)
+    if not owl_path.exists():
+        raise FileNotFoundError(f"Ontology file not found: {owl_path}")
+    if db_path.exists():
+        if not force:
+            raise FileExistsError(f"{db_path} already exists (use --force to replace)")
+        for leftover in (db_path, Path(f"{db_path}-wal"), Path(f"{db_path}-shm")):
+            leftover.unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    open_quadstore(db_path)
+    ontology = get_ontology(str(owl_path)).load()
+    default_world.save()
+
+    return {
+        "ontology": ontology.base_iri,
+        "articles": len(list(ontology.NewsArticle.instances())),
+        "individuals": len(list(ontology.individuals())),
+        "triples": default_world.graph.execute("SELECT COUNT(*) FROM quads").fetchone()[
+            0
+        ],
+        "seconds": round(time.perf_counter() - start, 2),
+        "database": str(db_path),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--owl", type=Path, default=ONTOLOGY_FILE)
+    parser.add_argument("--db", type=Path, default=ONTOLOGY_DB_FILE)
+    parser.add_argument("--force", action="store_true", help="replace an existing db")
+    args = parser.parse_args(argv)
+
+    result = migrate(args.owl, args.db, force=args.force)
+    print(f"[INFO] Migrated {args.owl} -> {result['database']}")
+    for key, value in result.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
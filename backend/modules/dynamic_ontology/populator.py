@@ -1,12 +1,127 @@
 # ontology_populator.py
+import json
 from datetime import datetime
-from .models import FormattedNewsArticle
+from .models import FormattedNewsArticle, NewsArticleCreate
+
+# Entity lists of an article and their ontology classes, in `mentionsEntity` order
+ENTITY_CLASSES = {
+    "persons": "Person",
+    "locations": "Location",
+    "events": "Event",
+    "organizations": "Organization",
+}
+
+# Context-aware relationships: (category, subcategory) -> {entity type: property}.
+# A `None` subcategory applies to every subcategory of the category.
+CONTEXT_PROPERTIES = {
+    ("PoliticsAndGovernance", "InternationalPolitics"): {
+        "organizations": "hasForeignOrganization",
+        "events": "hasForeignEvent",
+        "persons": "hasForeignPerson",
+        "locations": "hasForeignLocation",
+    },
+    ("PoliticsAndGovernance", "DomesticPolitics"): {
+        "organizations": "hasDomesticOrganization",
+        "events": "hasDomesticEvent",
+        "persons": "hasDomesticPerson",
+        "locations": "hasDomesticLocation",
+    },
+    ("ScienceAndTechnology", "TechAndInnovation"): {
+        "organizations": "hasTechCompany",
+        "events": "hasTechEvent",
+        "persons": "hasTechPerson",
+        "locations": "hasResearchLocation",
+    },
+    ("ScienceAndTechnology", "ResearchAndSpace"): {
+        "organizations": "hasResearchInstitution",
+        "persons": "hasResearchPerson",
+        "events": "hasResearchEvent",
+        "locations": "hasResearchLocation",
+    },
+    ("CultureAndEntertainment", "ScreenAndStage"): {
+        "persons": "hasFilmDirectorActor",
+        "organizations": "hasFilmProductionCompany",
+        "events": "hasResearchEvent",
+        "locations": "hasResearchLocation",
+    },
+    ("CultureAndEntertainment", "MusicAndArts"): {
+        "persons": "hasMusicArtist",
+        "organizations": "hasMusicCompany",
+        "events": "hasMusicEvent",
+        "locations": "hasMusicLocation",
+    },
+    ("Sports", "Cricket"): {
+        "organizations": "hasCricketTeam",
+        "persons": "hasCricketPlayer",
+        "locations": "hasCricketVenue",
+        "events": "hasCricketTournament",
+    },
+    ("Sports", "Football"): {
+        "organizations": "hasFootballTeam",
+        "persons": "hasFootballPlayer",
+        "locations": "hasFootballVenue",
+        "events": "hasFootballTournament",
+    },
+    ("Sports", "Other"): {
+        "organizations": "hasTeam",
+        "persons": "hasPlayer",
+        "locations": "hasVenue",
+        "events": "hasTournament",
+    },
+    ("CrimeAndJustice", None): {
+        "persons": "hasWitness",
+        "organizations": "hasInvestigation",
+    },
+    ("CrimeAndJustice", "CrimeReport"): {
+        "events": "hasCrimeType",
+        "locations": "hasCrimeLocation",
+    },
+    ("CrimeAndJustice", "CourtsAndInvestigation"): {
+        "events": "hasCourtCase",
+        "locations": "hasCourtLocation",
+    },
+}
+_MAPPED_CATEGORIES = {category for category, _ in CONTEXT_PROPERTIES}
+
+
+def context_properties(category, subcategory):
+    """
+    `(entity type, property)` pairs to link for an article of
+    `category`/`subcategory`, or None if the category has no specific links.
+    """
+    if category not in _MAPPED_CATEGORIES:
+        return None
+    return [
+        pair
+        for key in ((category, None), (category, subcategory))
+        for pair in CONTEXT_PROPERTIES.get(key, {}).items()
+    ]
+
+
+def article_entity_names(article):
+    """
+    The entity lists (`persons`, `locations`, ...) of a populated article, read
+    back from its `mentionsEntity` links; for article listeners that need the
+    populate data but get an article populated elsewhere.
+    """
+    data = {entity_type: [] for entity_type in ENTITY_CLASSES}
+    for entity in article.mentionsEntity:
+        classes = {cls.name for cls in entity.is_a}
+        for entity_type, class_name in ENTITY_CLASSES.items():
+            if class_name in classes and entity.canonicalName:
+                data[entity_type].append(str(entity.canonicalName))
+    return data
 
 
 def populate_article_from_json(data, manager):
     """
     Populate a single article from JSON data into the ontology
     """
+    with manager.write_lock:
+        return _populate_article(data, manager)
+
+
+def _populate_article(data, manager):
     onto = manager.ontology
 
     def parse_timestamp(ts_str):
@@ -27,7 +142,7 @@ def populate_article_from_json(data, manager):
         url=data["url"],
         source=data["source"],
     )
-    article_indiv = manager.add_article(article_obj)
+    article_indiv = manager.add_article(article_obj, data["category"])
 
     with onto:
         cat_class = getattr(onto, data["category"], None)
@@ -44,148 +159,35 @@ def populate_article_from_json(data, manager):
                 f"[ERROR] Subcategory '{data['subcategory']}' not found in ontology."
             )
 
-        def get_or_create(cls, name):
-            safe_name = manager._safe_name(name)
-            print(f"[DEBUG] Safe name for {name}: {safe_name}")
-            existing = onto.search_one(iri="*" + safe_name)
-            if existing:
-                return existing
-            ind = cls(safe_name)
-            ind.canonicalName = name
-            return ind
-
-        def get_or_create_category(cls, name):
-            safe_name = f"{name}"
-            print(f"[DEBUG] Safe name for category {name}: {safe_name}")
-            existing = onto.search_one(iri="*" + safe_name)
-            if existing:
-                return existing
-            return cls(safe_name)
+        get_or_create = manager.get_or_create_entity
+        get_or_create_category = manager.get_or_create_category
 
         cat_indiv = get_or_create_category(cat_class, data["category"])
         subcat_indiv = get_or_create_category(subcat_class, data["subcategory"])
-        article_indiv.hasCategory.append(cat_indiv)
-        article_indiv.hasCategory.append(subcat_indiv)
 
-        person_inds = [get_or_create(onto.Person, n) for n in data.get("persons", [])]
-        location_inds = [
-            get_or_create(onto.Location, n) for n in data.get("locations", [])
-        ]
-        event_inds = [get_or_create(onto.Event, n) for n in data.get("events", [])]
-        org_inds = [
-            get_or_create(onto.Organization, n) for n in data.get("organizations", [])
-        ]
+        entities = {
+            entity_type: [
+                get_or_create(getattr(onto, class_name), n)
+                for n in data.get(entity_type, [])
+            ]
+            for entity_type, class_name in ENTITY_CLASSES.items()
+        }
 
-        # Generic link
-        for entity in person_inds + location_inds + event_inds + org_inds:
-            article_indiv.mentionsEntity.append(entity)
-
-        # Category/Subcategory specific mappings
-        if data["category"] == "PoliticsAndGovernance":
-            if data["subcategory"] == "InternationalPolitics":
-                for org in org_inds:
-                    article_indiv.hasForeignOrganization.append(org)
-                for ev in event_inds:
-                    article_indiv.hasForeignEvent.append(ev)
-                for p in person_inds:
-                    article_indiv.hasForeignPerson.append(p)
-                for loc in location_inds:
-                    article_indiv.hasForeignLocation.append(loc)
-            elif data["subcategory"] == "DomesticPolitics":
-                for org in org_inds:
-                    article_indiv.hasDomesticOrganization.append(org)
-                for ev in event_inds:
-                    article_indiv.hasDomesticEvent.append(ev)
-                for p in person_inds:
-                    article_indiv.hasDomesticPerson.append(p)
-                for loc in location_inds:
-                    article_indiv.hasDomesticLocation.append(loc)
-        elif data["category"] == "ScienceAndTechnology":
-            if data["subcategory"] == "TechAndInnovation":
-                for org in org_inds:
-                    article_indiv.hasTechCompany.append(org)
-                for ev in event_inds:
-                    article_indiv.hasTechEvent.append(ev)
-                for p in person_inds:
-                    article_indiv.hasTechPerson.append(p)
-                for loc in location_inds:
-                    article_indiv.hasResearchLocation.append(loc)
-            elif data["subcategory"] == "ResearchAndSpace":
-                for org in org_inds:
-                    article_indiv.hasResearchInstitution.append(org)
-                for p in person_inds:
-                    article_indiv.hasResearchPerson.append(p)
-                for ev in event_inds:
-                    article_indiv.hasResearchEvent.append(ev)
-                for loc in location_inds:
-                    article_indiv.hasResearchLocation.append(loc)
-        elif data["category"] == "CultureAndEntertainment":
-            if data["subcategory"] == "ScreenAndStage":
-                for p in person_inds:
-                    article_indiv.hasFilmDirectorActor.append(p)
-                for org in org_inds:
-                    article_indiv.hasFilmProductionCompany.append(org)
-                for ev in event_inds:
-                    article_indiv.hasResearchEvent.append(ev)
-                for loc in location_inds:
-                    article_indiv.hasResearchLocation.append(loc)
-            elif data["subcategory"] == "MusicAndArts":
-                for p in person_inds:
-                    article_indiv.hasMusicArtist.append(p)
-                for org in org_inds:
-                    article_indiv.hasMusicCompany.append(org)
-                for ev in event_inds:
-                    article_indiv.hasMusicEvent.append(ev)
-                for loc in location_inds:
-                    article_indiv.hasMusicLocation.append(loc)
-        elif data["category"] == "Sports":
-            if data["subcategory"] == "Cricket":
-                for org in org_inds:
-                    article_indiv.hasCricketTeam.append(org)
-                for p in person_inds:
-                    article_indiv.hasCricketPlayer.append(p)
-                for loc in location_inds:
-                    article_indiv.hasCricketVenue.append(loc)
-                for ev in event_inds:
-                    article_indiv.hasCricketTournament.append(ev)
-            elif data["subcategory"] == "Football":
-                for org in org_inds:
-                    article_indiv.hasFootballTeam.append(org)
-                for p in person_inds:
-                    article_indiv.hasFootballPlayer.append(p)
-                for loc in location_inds:
-                    article_indiv.hasFootballVenue.append(loc)
-                for ev in event_inds:
-                    article_indiv.hasFootballTournament.append(ev)
-            elif data["subcategory"] == "Other":
-                for org in org_inds:
-                    article_indiv.hasTeam.append(org)
-                for p in person_inds:
-                    article_indiv.hasPlayer.append(p)
-                for loc in location_inds:
-                    article_indiv.hasVenue.append(loc)
-                for ev in event_inds:
-                    article_indiv.hasTournament.append(ev)
-        elif data["category"] == "CrimeAndJustice":
-            for p in person_inds:
-                article_indiv.hasWitness.append(p)
-            for org in org_inds:
-                article_indiv.hasInvestigation.append(org)
-            if data["subcategory"] == "CrimeReport":
-                for ev in event_inds:
-                    article_indiv.hasCrimeType.append(ev)
-                for loc in location_inds:
-                    article_indiv.hasCrimeLocation.append(loc)
-            elif data["subcategory"] == "CourtsAndInvestigation":
-                for ev in event_inds:
-                    article_indiv.hasCourtCase.append(ev)
-                for loc in location_inds:
-                    article_indiv.hasCourtLocation.append(loc)
-        else:
+        # Categories, generic link, then the category/subcategory specific ones
+        links = [
+            ("hasCategory", [cat_indiv, subcat_indiv]),
+            ("mentionsEntity", [e for es in entities.values() for e in es]),
+        ]
+        properties = context_properties(data["category"], data["subcategory"])
+        if properties is None:
             print(
                 f"[DEBUG] Unhandled category/subcategory: {data['category']}/{data['subcategory']}"
             )
+        else:
+            links += [(prop, entities[etype]) for etype, prop in properties]
+        manager.link_entities(article_indiv, links)
 
+    manager.notify_article_populated(article_indiv, data)
     return article_indiv
 
 
@@ -211,7 +213,8 @@ def populate_bulk_articles(data_list, manager):
 
     # Save the ontology after all articles are processed
     try:
-        manager.save()
+        manager.mark_dirty(len(data_list))
+        manager.flush()
         print("[INFO] Ontology saved successfully")
     except Exception as e:
         error_msg = f"Failed to save ontology: {str(e)}"
@@ -224,3 +227,42 @@ def populate_bulk_articles(data_list, manager):
         "failed": failed,
         "errors": errors,
     }
+
+
+def populate_ndjson_chunk(lines, manager):
+    """
+    Validate and populate one chunk of NDJSON lines (one article per line),
+    then commit the chunk to disk.
+    `lines` holds `(line number, line)` pairs; the numbers are used in error messages.
+    Returns statistics about the chunk, like `populate_bulk_articles`.
+    """
+    successful = 0
+    failed = 0
+    errors = []
+
+    for number, line in lines:
+        try:
+            article = NewsArticleCreate(**json.loads(line))
+            populate_article_from_json(article.model_dump(), manager)
+            successful += 1
+        except Exception as e:
+            failed += 1
+            error_msg = f"Line {number}: {str(e)}"
+            errors.append(error_msg)
+            print(f"[ERROR] {error_msg}")
+
+    # Commit the chunk before reading the next one
+    try:
+        manager.mark_dirty(len(lines))
+        manager.flush()
+    except Exception as e:
+        error_msg = f"Failed to save ontology: {str(e)}"
+        errors.append(error_msg)
+        print(f"[ERROR] {error_msg}")
+
+    return {
+        "total_processed": len(lines),
+        "successful": successful,
+        "failed": failed,
+        "errors": errors,
+    }
@@ -0,0 +1,357 @@
+"""
+Category-sharded ontology storage (`ONTOLOGY_SHARDS=1`, rdfxml store).
+
+The main ontology file keeps the schema, the named entities and the category
+individuals; the articles of each top-level category (`PoliticsAndGovernance`,
+`Sports`, ...) live in `<ONTOLOGY_SHARD_DIR>/<category>.owl`, an ontology that
+imports the main one. Shards are loaded into the manager's world, so articles
+keep their IRIs and link to the shared entities exactly as before.
+
+`ShardSet.ensure` loads the shard of a category on first use (ingest,
+verification). Once the loaded shards hold more than `max_triples` triples the
+least recently used ones are saved (if changed) and unloaded again, except
+those in use: readers that look at a shard's articles through several indexes
+(a verification) hold it with `with shards.use(category):`. Shard
+listeners registered with `OntologyManager.add_shard_listener` are told about
+every load / unload, so the in-memory indexes only hold loaded articles.
+
+Split an existing unsharded ontology file once, from the backend directory:
+    python -m modules.dynamic_ontology.shards
+"""
+
+import argparse
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from owlready2 import ThingClass, rdf_type
+
+from .config import ONTOLOGY_FILE, ONTOLOGY_SHARD_DIR, ONTOLOGY_SHARD_MAX_TRIPLES
+
+
+class _Shard:
+    def __init__(self, ontology):
+        self.ontology = ontology
+        self.triples = 0  # as of the last load / save
+        self.dirty = False
+        self.last_used = time.monotonic()
+        self.pins = 0  # `ShardSet.use` blocks running on it
+        self.evicting = False
+
+
+class ShardSet:
+    def __init__(
+        self,
+        manager,
+        directory: Path = ONTOLOGY_SHARD_DIR,
+        max_triples: int = ONTOLOGY_SHARD_MAX_TRIPLES,
+    ):
+        self.manager = manager
+        self.directory = Path(directory)
+        self.max_triples = max_triples
+        self._loaded: dict[str, _Shard] = {}  # top-level category -> shard
+        # Guards pins / evicting, which `use` changes without the write lock
+        self._pins_lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------ utils
+
+    def _iri(self, name: str) -> str:
+        return f"{self.manager.ontology.base_iri.rstrip('#/')}/shards/{name}"
+
+    def path(self, name: str) -> Path:
+        return self.directory / f"{name}.owl"
+
+    @staticmethod
+    def _count(ontology) -> int:
+        return ontology.graph.execute(
+            "SELECT COUNT(*) FROM quads WHERE c=?", (ontology.graph.c,)
+        ).fetchone()[0]
+
+    def _members(self, name: str) -> set[str]:
+        """The category names whose articles live in shard `name`."""
+        top = getattr(self.manager.ontology, name)
+        return {cls.name for cls in top.descendants()}
+
+    def _articles(self, ontology) -> list:
+        world = ontology.world
+        classes = [c.storid for c in self.manager.ontology.NewsArticle.descendants()]
+        rows = ontology.graph.execute(
+            f"SELECT s FROM objs WHERE c=? AND p={rdf_type} "
+            f"AND o IN ({','.join('?' * len(classes))})",
+            [ontology.graph.c, *classes],
+        )
+        return [world._get_by_storid(s) for (s,) in rows]
+
+    def _inverse_names(self) -> set[str]:
+        names = set()
+        for prop in self.manager.ontology.object_properties():
+            inverse = prop.inverse_property
+            names.add(inverse.python_name if inverse else f"INVERSE_{prop.python_name}")
+        return names
+
+    def _load(self, name: str) -> _Shard:
+        start = time.perf_counter()
+        ontology = self.manager.ontology.world.get_ontology(self._iri(name))
+        path = self.path(name)
+        if path.exists():
+            with open(path, "rb") as f:
+                ontology.load(fileobj=f)
+        else:
+            ontology.imported_ontologies.append(self.manager.ontology)
+        shard = self._loaded[name] = _Shard(ontology)
+        shard.triples = self._count(ontology)
+        self.loads += 1
+        print(
+            f"[DEBUG] Loaded shard {name} ({shard.triples} triples) "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        self.manager.notify_shard_changed(
+            self._members(name), self._articles(ontology), loaded=True
+        )
+        return shard
+
+    def _save(self, name: str, shard: _Shard):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manager._write_file(self.path(name), "rdfxml", shard.ontology)
+        shard.dirty = False
+        shard.triples = self._count(shard.ontology)
+
+    def _over_budget(self) -> bool:
+        # Callers hold the write lock
+        shards = list(self._loaded.values())
+        return len(shards) > 1 and sum(s.triples for s in shards) > self.max_triples
+
+    def _evict_over_budget(self, keep: str | None = None):
+        """Unload least recently used shards, not `keep` or pinned ones."""
+        while self._over_budget():
+            with self._pins_lock:
+                idle = [
+                    name
+                    for name, shard in self._loaded.items()
+                    if name != keep and not shard.pins
+                ]
+            if not idle:
+                return  # over budget until the pinned shards are released
+            if not self.evict(min(idle, key=lambda n: self._loaded[n].last_used)):
+                return
+
+    def _pin(self, name: str) -> _Shard | None:
+        with self._pins_lock:
+            shard = self._loaded.get(name)
+            if shard is None or shard.evicting:
+                return None
+            shard.pins += 1
+            shard.last_used = time.monotonic()
+            return shard
+
+    # ------------------------------------------------------------------ public
+
+    def categories(self) -> list[str]:
+        """Top-level category names, one shard each."""
+        return [cls.name for cls in self.manager.ontology.NewsCategory.subclasses()]
+
+    def shard_of(self, category: str) -> str | None:
+        """The shard (top-level category) of category or subcategory `category`."""
+        cls = getattr(self.manager.ontology, str(category), None)
+        if not isinstance(cls, ThingClass):
+            return None
+        top = set(self.categories())
+        for ancestor in cls.ancestors():
+            if ancestor.name in top:
+                return ancestor.name
+        return None
+
+    def ensure(self, category: str):
+        """
+        Load the shard of `category` (category or subcategory name) unless it is
+        loaded, mark it most recently used and return its ontology.
+        """
+        name = self.shard_of(category)
+        if name is None:
+            raise ValueError(f"[ERROR] Category '{category}' not found in ontology.")
+        # Check and load under the lock, so concurrent calls neither load a
+        # shard twice nor evict past each other; `use` pins loaded shards without it
+        with self.manager.write_lock:
+            shard = self._loaded.get(name) or self._load(name)
+            shard.last_used = time.monotonic()
+            self._evict_over_budget(keep=name)
+        return shard.ontology
+
+    @contextmanager
+    def use(self, category: str):
+        """
+        Load the shard of `category` like `ensure` and keep it loaded until the
+        block ends: over-budget unloading skips shards in use. Yields the
+        shard's ontology.
+        """
+        name = self.shard_of(category)
+        if name is None:
+            raise ValueError(f"[ERROR] Category '{category}' not found in ontology.")
+        shard = self._pin(name)
+        while shard is None:  # not loaded, or unloaded before we could pin it
+            self.ensure(category)
+            shard = self._pin(name)
+        try:
+            yield shard.ontology
+        finally:
+            with self._pins_lock:
+                shard.pins -= 1
+
+    def writable_namespace(self, category: str):
+        """
+        Namespace to create / change `category` articles in: the main
+        ontology's IRIs, stored in the category's shard, which is marked changed.
+        """
+        ontology = self.ensure(category)
+        self._loaded[self.shard_of(category)].dirty = True
+        return ontology.get_namespace(self.manager.ontology.base_iri)
+
+    def load_all(self):
+        """
+        Load every shard that has a file, regardless of the budget; for jobs
+        over the whole ontology (compaction, duplicate merging). The next
+        `ensure` unloads down to the budget again.
+        """
+        with self.manager.write_lock:
+            for name in self.categories():
+                if name not in self._loaded and self.path(name).exists():
+                    self._load(name)
+
+    def mark_dirty(self, category: str | None = None):
+        """Mark the shard of `category` (default: every loaded shard) changed."""
+        names = [self.shard_of(category)] if category else list(self._loaded)
+        for name in names:
+            if name in self._loaded:
+                self._loaded[name].dirty = True
+
+    def evict(self, name: str) -> bool:
+        """
+        Save shard `name` if it changed, then unload it. Returns False (and
+        keeps it) if it is not loaded or in use.
+        """
+        with self.manager.write_lock:
+            with self._pins_lock:
+                shard = self._loaded.get(name)
+                if shard is None or shard.pins:
+                    return False
+                shard.evicting = True
+            if shard.dirty:
+                try:
+                    self._save(name, shard)
+                except Exception:
+                    shard.evicting = False  # still loaded and usable
+                    raise
+            ontology = shard.ontology
+            world = ontology.world
+            articles = self._articles(ontology)
+            self.manager.notify_shard_changed(
+                self._members(name), articles, loaded=False
+            )
+
+            # Shared individuals (entities, categories) cache inverse values,
+            # which still list the unloaded articles
+            inverse_names = self._inverse_names()
+            for (o,) in world.graph.execute(
+                "SELECT DISTINCT o FROM objs WHERE c=?", (ontology.graph.c,)
+            ):
+                entity = world._entities.get(o)
+                if entity is not None and hasattr(entity.__dict__, "pop"):
+                    for attribute in inverse_names:
+                        entity.__dict__.pop(attribute, None)
+            ontology.destroy(update_relation=True)
+            self.manager._forget({article.storid for article in articles})
+            del self._loaded[name]
+            self.evictions += 1
+            print(f"[DEBUG] Unloaded shard {name}")
+            return True
+
+    def save(self, everything: bool = False):
+        """Write the changed loaded shards (every loaded one with `everything`)."""
+        with self.manager.write_lock:
+            for name, shard in list(self._loaded.items()):
+                if shard.dirty or everything:
+                    self._save(name, shard)
+
+    def storage_bytes(self) -> int:
+        return sum(
+            self.path(name).stat().st_size
+            for name in self.categories()
+            if self.path(name).exists()
+        )
+
+    def stats(self) -> dict:
+        shards = {}
+        for name in self.categories():
+            shard = self._loaded.get(name)
+            shards[name] = {
+                "loaded": shard is not None,
+                "triples": shard.triples if shard is not None else None,
+                "in_use": shard.pins if shard is not None else 0,
+            }
+        return {
+            "max_triples": self.max_triples,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "shards": shards,
+        }
+
+
+def split(manager, directory: Path = ONTOLOGY_SHARD_DIR) -> dict[str, int]:
+    """
+    Move every article of an unsharded `manager` into the shard of its
+    category and rewrite the main file without them. Articles without a
+    (known) category stay in the main file.
+    :return: Articles moved per shard.
+    """
+    shards = ShardSet(manager, directory)
+    existing = [p for p in (shards.path(n) for n in shards.categories()) if p.exists()]
+    if existing:
+        raise FileExistsError(f"{existing[0]} already exists; already split?")
+
+    moved = {}
+    with manager.write_lock:
+        main_c = manager.ontology.graph.c
+        db = manager.ontology.world.graph.db
+        for article in list(manager.ontology.NewsArticle.instances()):
+            names = {shards.shard_of(cat.name) for cat in article.hasCategory}
+            names.discard(None)
+            if len(names) != 1:
+                continue
+            name = names.pop()
+            shard = shards._loaded.get(name) or shards._load(name)
+            for table in ("objs", "datas"):
+                db.execute(
+                    f"UPDATE {table} SET c=? WHERE c=? AND s=?",
+                    (shard.ontology.graph.c, main_c, article.storid),
+                )
+            moved[name] = moved.get(name, 0) + 1
+        shards.save(everything=True)
+        manager.save()
+    return moved
+
+
+def main(argv=None):
+    from .manager import OntologyManager
+
+    parser = argparse.ArgumentParser(description="Split the ontology into shards.")
+    parser.add_argument("--owl", type=Path, default=ONTOLOGY_FILE)
+    parser.add_argument("--dir", type=Path, default=ONTOLOGY_SHARD_DIR)
+    args = parser.parse_args(argv)
+
+    backup = args.owl.with_suffix(".unsharded.owl")
+    shutil.copy(args.owl, backup)
+    manager = OntologyManager(
+        path=args.owl, store="rdfxml", snapshot_path=None, shard_dir=None
+    )
+    moved = split(manager, args.dir)
+    print(f"[INFO] Split {args.owl} into {args.dir} (original kept as {backup})")
+    for name, count in moved.items():
+        print(f"  {name}: {count} articles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Binary fast-start snapshot of the in-memory quad store (ONTOLOGY_STORE=rdfxml).
+
+Every save of the `.owl` file also copies owlready2's SQLite quad store to
+ONTOLOGY_SNAPSHOT_FILE, tagged with the SHA-256 of the `.owl` bytes it matches.
+On startup the snapshot is restored into memory with the SQLite backup API,
+which skips RDF/XML parsing entirely. A missing snapshot, or one whose checksum
+no longer matches the `.owl` file (edited or replaced by hand), is ignored and
+the `.owl` file is parsed as before.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+SNAPSHOT_VERSION = 1
+_META_TABLE = "snapshot_meta"
+
+
+class HashingWriter:
+    """Binary file wrapper that hashes everything written through it."""
+
+    def __init__(self, file):
+        self.file = file
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data):
+        self.sha256.update(data)
+        return self.file.write(data)
+
+    def hexdigest(self) -> str:
+        return self.sha256.hexdigest()
+
+
+def file_checksum(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def write_snapshot(world, path: Path, source_checksum: str, ontology_iri: str):
+    """
+    Copy `world`'s quad store to `path` (temp file + atomic rename), recording
+    the checksum of the `.owl` file it was saved alongside.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    world.graph.commit()  # the backup only sees committed pages
+    target = sqlite3.connect(str(tmp))
+    try:
+        world.graph.db.backup(target)
+        target.execute(f"DROP TABLE IF EXISTS {_META_TABLE}")
+        target.execute(f"CREATE TABLE {_META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+        target.executemany(
+            f"INSERT INTO {_META_TABLE} VALUES (?, ?)",
+            [
+                ("version", str(SNAPSHOT_VERSION)),
+                ("source_sha256", source_checksum),
+                ("ontology_iri", ontology_iri),
+            ],
+        )
+        target.commit()
+    finally:
+        target.close()
+    with open(tmp, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_meta(path: Path) -> dict[str, str] | None:
+    """The snapshot's metadata, or None if `path` is missing or not a snapshot."""
+    if not Path(path).exists():
+        return None
+    try:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return dict(db.execute(f"SELECT key, value FROM {_META_TABLE}"))
+        finally:
+            db.close()
+    except sqlite3.DatabaseError:
+        return None
+
+
+def load_snapshot(world, path: Path, source_checksum: str) -> str | None:
+    """
+    Restore the snapshot at `path` into `world` (which must not hold any
+    ontology yet) if it matches `source_checksum`.
+    :return: The snapshot's ontology IRI, or None if it was missing or stale.
+    """
+    if len(world.graph) > 1:  # already holds triples; set_backend would clone them
+        return None
+    meta = read_meta(path)
+    if (
+        meta is None
+        or meta.get("version") != str(SNAPSHOT_VERSION)
+        or meta.get("source_sha256") != source_checksum
+    ):
+        return None
+
+    # Same connection settings owlready2 uses for its own in-memory store
+    memory = sqlite3.connect(
+        ":memory:", isolation_level="EXCLUSIVE", check_same_thread=False
+    )
+    source = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        source.backup(memory)
+    finally:
+        source.close()
+    memory.execute(f"DROP TABLE {_META_TABLE}")
+    memory.commit()
+
+    # owlready2 only adopts an existing database when given an existing filename;
+    # the data lives in `memory` and nothing is ever written back to `path`.
+    world.set_backend(filename=str(path), connection=memory)
+    world.filename = world.graph.filename = ":memory:"
+    return meta["ontology_iri"]
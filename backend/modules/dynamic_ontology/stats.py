@@ -0,0 +1,167 @@
+"""
+Incrementally maintained ontology statistics.
+
+Replaces materializing every instance of the counted classes on each
+`get_ontology_stats` call (and so on each health probe) with counters:
+class counts are taken once with SPARQL `COUNT` on startup and bumped by
+`OntologyManager` whenever it creates an individual, and the per-category /
+per-publisher article breakdowns are kept up to date by an article listener.
+"""
+
+import sys
+import threading
+from collections import Counter
+
+from owlready2 import default_world
+
+# Counted classes and their key in `snapshot()`
+COUNTED_CLASSES = {
+    "NewsArticle": "articles",
+    "Person": "persons",
+    "Organization": "organizations",
+    "Location": "locations",
+    "Event": "events",
+}
+ENTITY_CLASSES = ("Person", "Organization", "Location", "Event")
+
+_COUNT_INSTANCES = """
+SELECT (COUNT(DISTINCT ?x) AS ?n)
+WHERE { ?x rdf:type/rdfs:subClassOf* ?? . }
+"""
+
+
+def _article_keys(article) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    categories = tuple(sorted({sys.intern(cat.name) for cat in article.hasCategory}))
+    publishers = tuple(sorted({sys.intern(str(p)) for p in article.publisherName}))
+    return categories, publishers
+
+
+class OntologyStats:
+    def __init__(self):
+        self._classes: Counter[str] = Counter()
+        self._categories: Counter[str] = Counter()
+        self._publishers: Counter[str] = Counter()
+        # article storid -> (category names, publisher names) it is counted under
+        self._articles: dict[int, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._ontology = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ontology is not None
+
+    # ------------------------------------------------------------------ utils
+
+    def _count(self, keys, delta: int):
+        categories, publishers = keys
+        for name in categories:
+            self._categories[name] += delta
+            if not self._categories[name]:
+                del self._categories[name]
+        for name in publishers:
+            self._publishers[name] += delta
+            if not self._publishers[name]:
+                del self._publishers[name]
+
+    def _put(self, article):
+        keys = _article_keys(article)
+        previous = self._articles.get(article.storid)
+        if previous == keys:
+            return
+        if previous is not None:
+            self._count(previous, -1)
+        self._count(keys, +1)
+        self._articles[article.storid] = keys
+
+    def _count_classes(self, ontology) -> Counter:
+        query = default_world.prepare_sparql(_COUNT_INSTANCES)
+        classes = Counter()
+        for name in COUNTED_CLASSES:
+            cls = getattr(ontology, name)
+            if cls is not None:
+                classes[name] = list(query.execute([cls]))[0][0]
+        return classes
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)count everything in `ontology`."""
+        classes = self._count_classes(ontology)
+        with self._lock:
+            self._ontology = ontology
+            self._classes = classes
+            self._categories = Counter()
+            self._publishers = Counter()
+            self._articles = {}
+            for article in ontology.NewsArticle.instances():
+                self._put(article)
+
+    def recount_classes(self):
+        """
+        Recount the class counts only, for individuals created by another
+        process (reader workers, see `workers.py`); breakdowns come from the
+        article listener.
+        """
+        if self._ontology is None:
+            return
+        classes = self._count_classes(self._ontology)
+        with self._lock:
+            self._classes = classes
+
+    def on_individual_created(self, cls):
+        """Called by `OntologyManager` after creating an individual of `cls`."""
+        if self._ontology is None:
+            return
+        names = [c.name for c in cls.ancestors() if c.name in COUNTED_CLASSES]
+        with self._lock:
+            for name in names:
+                self._classes[name] += 1
+
+    def on_individual_destroyed(self, cls):
+        """Called by `OntologyManager` after destroying an individual of `cls`."""
+        if self._ontology is None:
+            return
+        names = [c.name for c in cls.ancestors() if c.name in COUNTED_CLASSES]
+        with self._lock:
+            for name in names:
+                self._classes[name] -= 1
+
+    def on_article_populated(self, article, data):
+        """`OntologyManager` article listener: recount the article's breakdowns."""
+        with self._lock:
+            self._put(article)
+
+    def on_shard_changed(self, categories, articles, loaded: bool):
+        """
+        `OntologyManager` shard listener: count the articles of a loaded shard,
+        uncount those of an unloaded one. With shards, stats cover loaded shards.
+        """
+        if self._ontology is None:
+            return
+        delta = 1 if loaded else -1
+        with self._lock:
+            for article in articles:
+                names = {
+                    ancestor.name
+                    for cls in article.is_a
+                    for ancestor in cls.ancestors()
+                    if ancestor.name in COUNTED_CLASSES
+                }
+                for name in names:
+                    self._classes[name] += delta
+                if loaded:
+                    self._put(article)
+                else:
+                    keys = self._articles.pop(article.storid, None)
+                    if keys is not None:
+                        self._count(keys, -1)
+
+    def snapshot(self, breakdowns: bool = True) -> dict:
+        """Counts in the `get_ontology_stats` format, plus the breakdowns."""
+        with self._lock:
+            stats = {key: self._classes[name] for name, key in COUNTED_CLASSES.items()}
+            stats["total_entities"] = sum(self._classes[n] for n in ENTITY_CLASSES)
+            if breakdowns:
+                stats["categories"] = dict(self._categories.most_common())
+                stats["publishers"] = dict(self._publishers.most_common())
+        return stats
@@ -0,0 +1,256 @@
+"""
+Multi-worker deployment (`ONTOLOGY_MULTI_WORKER=1`, sqlite store).
+
+Without it every uvicorn worker would load its own copy of the ontology and
+their saves would overwrite each other. Instead all workers share the quad
+store `ONTOLOGY_DB_FILE`:
+
+- On startup the workers elect one writer (`elect_writer`): the process that
+  takes the exclusive lock on `ONTOLOGY_WRITER_LOCK_FILE`. It opens the store
+  read-write, applies every write and also listens on the Unix socket
+  `ONTOLOGY_WRITER_SOCKET`, to which the other workers forward the write
+  requests they receive.
+- The other workers are readers: they open the store read-only (they never
+  take SQLite's write lock) and answer the read requests themselves. A
+  `ReaderSync` thread checks every `ONTOLOGY_READER_REFRESH_INTERVAL` seconds
+  whether the writer has committed. If so it drops the reader's cached
+  individuals and hands the articles populated since (by `processedDate`) to
+  the article listeners, so the in-memory indexes catch up; after changes that
+  remove data (`OntologyManager.mark_rebuild`) it rebuilds them instead.
+
+The writer commits within `ONTOLOGY_SAVE_INTERVAL` (write-behind), so readers
+see a write after at most that plus the refresh interval. The lock goes with
+the writer process; the worker uvicorn starts in its place takes it over.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from owlready2 import Thing
+
+from .config import (
+    ONTOLOGY_DB_FILE,
+    ONTOLOGY_IRI,
+    ONTOLOGY_READER_REFRESH_INTERVAL,
+    ONTOLOGY_SAVE_INTERVAL,
+    ONTOLOGY_STORE,
+    ONTOLOGY_WRITER_LOCK_FILE,
+)
+from .populator import article_entity_names
+
+
+def try_writer_lock(path: Path = ONTOLOGY_WRITER_LOCK_FILE):
+    """
+    Take the writer lock without waiting. Returns the open lock file, which
+    holds the lock as long as it stays open, or None if another process has it.
+    """
+    import fcntl  # POSIX only, like the multi-worker mode
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock = open(path, "a+")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        return None
+    lock.seek(0)
+    lock.truncate()
+    lock.write(f"{os.getpid()}\n")
+    lock.flush()
+    return lock
+
+
+def store_ready(db_path: Path = ONTOLOGY_DB_FILE, iri: str = ONTOLOGY_IRI) -> bool:
+    """Whether the quad store at `db_path` holds a committed ontology `iri`."""
+    if not Path(db_path).exists():
+        return False
+    try:
+        with closing(sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)) as db:
+            row = db.execute(
+                "SELECT 1 FROM ontologies WHERE iri IN (?, ?)", (iri, f"{iri}#")
+            ).fetchone()
+    except sqlite3.Error:  # being created
+        return False
+    return row is not None
+
+
+def elect_writer(
+    lock_path: Path = ONTOLOGY_WRITER_LOCK_FILE,
+    db_path: Path = ONTOLOGY_DB_FILE,
+    iri: str = ONTOLOGY_IRI,
+    store: str = ONTOLOGY_STORE,
+    poll: float = 0.5,
+):
+    """
+    Decide this worker's role. Returns the held writer lock (see
+    `try_writer_lock`), or None for a reader. A reader only returns once the
+    writer has created the store; until then it keeps trying for the lock, in
+    case the writer dies first.
+    """
+    if store != "sqlite":
+        raise ValueError("[ERROR] Multi-worker mode needs ONTOLOGY_STORE=sqlite.")
+    waiting = False
+    while True:
+        lock = try_writer_lock(lock_path)
+        if lock is not None:
+            return lock
+        if store_ready(db_path, iri):
+            return None
+        if not waiting:
+            print(f"[INFO] Waiting for the writer worker to create {db_path}")
+            waiting = True
+        time.sleep(poll)
+
+
+class ReaderSync:
+    """
+    Keeps a read-only `OntologyManager` (and the indexes fed by its article
+    listeners) up to date with the writer's commits. `rebuild()` rebuilds the
+    indexes the caller owns; the manager's stats are rebuilt here.
+    Create it before building the indexes, so no commit falls in between.
+    """
+
+    def __init__(
+        self, manager, rebuild, interval: float = ONTOLOGY_READER_REFRESH_INTERVAL
+    ):
+        self.manager = manager
+        self.rebuild = rebuild
+        self.interval = interval
+        self._db = manager.ontology.world.graph.db
+        self._processed = manager.ontology.processedDate.storid
+        self._version = self._data_version()
+        self._epoch = manager.sync_epoch()
+        # Latest `processedDate` seen, and the articles that have it
+        self._watermark, self._at_watermark = self._latest()
+        self._stop = threading.Event()
+        self._thread = None
+        self.refreshes = 0
+        self.rebuilds = 0
+        self.articles_synced = 0
+        self.last_refresh_seconds = None
+        self._last_check = time.monotonic()
+
+    # ------------------------------------------------------------------ utils
+
+    def _data_version(self) -> int:
+        # Changes whenever another connection commits
+        return self._db.execute("PRAGMA data_version").fetchone()[0]
+
+    def _latest(self) -> tuple[str | None, set[int]]:
+        (watermark,) = self._db.execute(
+            "SELECT MAX(o) FROM datas WHERE p=?", (self._processed,)
+        ).fetchone()
+        rows = self._db.execute(
+            "SELECT s FROM datas WHERE p=? AND o=?", (self._processed, watermark)
+        )
+        return watermark, {s for (s,) in rows}
+
+    def _populated_since(self) -> list[int]:
+        """Articles populated (or re-populated) after the watermark, oldest first."""
+        if self._watermark is None:
+            rows = self._db.execute(
+                "SELECT s, o FROM datas WHERE p=? ORDER BY o", (self._processed,)
+            ).fetchall()
+        else:
+            rows = self._db.execute(
+                "SELECT s, o FROM datas WHERE p=? AND o>=? ORDER BY o",
+                (self._processed, self._watermark),
+            ).fetchall()
+        storids = []
+        for s, o in rows:
+            if o == self._watermark and s in self._at_watermark:
+                continue
+            if o != self._watermark:
+                self._watermark, self._at_watermark = o, set()
+            self._at_watermark.add(s)
+            storids.append(s)
+        return storids
+
+    def _drop_cached_individuals(self):
+        # Cached property values may predate the writer's changes; the
+        # individuals are reloaded from the store on next use
+        entities = self.manager.ontology.world._entities
+        for storid, entity in list(entities.items()):
+            if isinstance(entity, Thing):
+                entities.pop(storid, None)
+
+    # ------------------------------------------------------------------ public
+
+    def refresh(self) -> bool:
+        """
+        Catch up with the writer's commits; False if there were none. Runs under
+        the manager's `write_lock`, which request threads also hold while they
+        read the ontology and the indexes, so none sees a refresh halfway.
+        """
+        with self.manager.write_lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        self._last_check = time.monotonic()
+        if self._db.in_transaction:
+            self._db.commit()  # move past the pinned commit
+        version = self._data_version()
+        if version == self._version:
+            return False
+        start = time.perf_counter()
+        self._version = version
+        self._drop_cached_individuals()
+        epoch = self.manager.sync_epoch()
+        if epoch != self._epoch:
+            self._epoch = epoch
+            self._watermark, self._at_watermark = self._latest()
+            self.manager.stats.build(self.manager.ontology)
+            self.rebuild()
+            self.rebuilds += 1
+        else:
+            world = self.manager.ontology.world
+            for storid in self._populated_since():
+                article = world._get_by_storid(storid)
+                self.manager.notify_article_populated(
+                    article, article_entity_names(article)
+                )
+                self.articles_synced += 1
+            self.manager.stats.recount_classes()
+        self.refreshes += 1
+        self.last_refresh_seconds = round(time.perf_counter() - start, 3)
+        return True
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="ontology-reader-sync", daemon=True
+        )
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()  # timings are in `stats()`
+            except Exception as e:
+                print(f"[ERROR] Ontology reader refresh failed: {e}")
+
+    def stop(self):
+        thread = self._thread
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "refresh_interval": self.interval,
+            # Write-behind interval of the writer, then our next check
+            "max_staleness_seconds": ONTOLOGY_SAVE_INTERVAL + self.interval,
+            "seconds_since_check": round(time.monotonic() - self._last_check, 3),
+            "refreshes": self.refreshes,
+            "rebuilds": self.rebuilds,
+            "articles_synced": self.articles_synced,
+            "last_refresh_seconds": self.last_refresh_seconds,
+        }
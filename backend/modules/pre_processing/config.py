@@ -0,0 +1,18 @@
+"""
+Model locations and backend selection for the pre-processing services.
+"""
+
+import os
+from pathlib import Path
+
+# backend/data/models
+MODELS_DIR: Path = Path(__file__).parent.parent.parent / "data" / "models"
+
+# "remote" (hosted classification service) or "local" (in-process model)
+CLASSIFICATION_BACKEND: str = os.environ.get("CLASSIFICATION_BACKEND", "remote")
+
+CLASSIFIER_MODEL_FILE: Path = MODELS_DIR / "news_classifier.joblib"
+
+# "remote" (hosted NER service), "local" (ontology gazetteer) or
+# "fallback" (remote service, gazetteer when the service fails)
+NER_BACKEND: str = os.environ.get("NER_BACKEND", "remote")
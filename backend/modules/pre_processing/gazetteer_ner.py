@@ -0,0 +1,100 @@
+"""
+Gazetteer NER backend built from the ontology's named-entity individuals.
+
+Every `canonicalName` (and `alias`) of a Person, Location, Event or Organization
+is tokenized and stored in a token trie. Extraction walks the token stream once
+and takes the longest known name starting at each position, so the cost is
+linear in the text length (times the longest name, in tokens).
+"""
+
+import threading
+import unicodedata
+
+import pygtrie
+
+# ontology class name -> key in the NER result
+ENTITY_TYPES: dict[str, str] = {
+    "Person": "persons",
+    "Location": "locations",
+    "Event": "events",
+    "Organization": "organizations",
+}
+
+# punctuation stripped from token edges before matching
+_EDGE_PUNCTUATION = ".,;:!?\"'()[]{}«»“”‘’-–—|/#"
+
+
+def tokenize(text: str) -> tuple[str, ...]:
+    normalized = unicodedata.normalize("NFKC", text)
+    tokens = (t.strip(_EDGE_PUNCTUATION) for t in normalized.split())
+    return tuple(t for t in tokens if t)
+
+
+class GazetteerNER:
+    def __init__(self):
+        self._trie = pygtrie.Trie()
+        self._max_tokens = 0
+        self._lock = threading.Lock()
+
+    def _add_name(self, name: str, entity_type: str):
+        key = tokenize(name)
+        if not key:
+            return
+        entry = self._trie.get(key)
+        if entry is None:
+            entry = self._trie[key] = {}
+        entry.setdefault(entity_type, name)
+        self._max_tokens = max(self._max_tokens, len(key))
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)compile the matcher from all named-entity individuals."""
+        with self._lock:
+            self._trie = pygtrie.Trie()
+            self._max_tokens = 0
+            for class_name, entity_type in ENTITY_TYPES.items():
+                for individual in getattr(ontology, class_name).instances():
+                    names = [individual.canonicalName] + list(individual.alias)
+                    for name in names:
+                        if name:
+                            self._add_name(str(name), entity_type)
+
+    def on_article_populated(self, article, data):
+        """`OntologyManager` article listener: add the article's entity names."""
+        with self._lock:
+            for entity_type in ENTITY_TYPES.values():
+                for name in data.get(entity_type, []):
+                    self._add_name(name, entity_type)
+
+    def extract(self, news_text: str):
+        """
+        Find known entity names in `news_text` (longest match wins).
+        :return: `(persons, locations, events, organizations)` like the NER service.
+        """
+        found = {entity_type: [] for entity_type in ENTITY_TYPES.values()}
+        tokens = tokenize(news_text)
+        with self._lock:
+            i = 0
+            while i < len(tokens):
+                step = self._trie.longest_prefix(tokens[i : i + self._max_tokens])
+                if not step:
+                    i += 1
+                    continue
+                for entity_type, name in step.value.items():
+                    if name not in found[entity_type]:
+                        found[entity_type].append(name)
+                i += len(step.key)
+        return (
+            found["persons"],
+            found["locations"],
+            found["events"],
+            found["organizations"],
+        )
+
+    def __len__(self):
+        return len(self._trie)
+
+
+# Shared matcher, built on startup when NER_BACKEND is not "remote"
+gazetteer_ner = GazetteerNER()
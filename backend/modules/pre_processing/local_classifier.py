@@ -0,0 +1,151 @@
+"""
+In-process category/subcategory classifier trained from the ontology.
+
+Character n-gram TF-IDF features feed a linear SVM that predicts the
+subcategory; the category is its parent class in the ontology schema.
+Inference scores the n-grams directly against the fitted vocabulary and
+weights instead of going through `Pipeline.predict`, which keeps a single
+prediction well under a millisecond.
+
+Train and save the model (run from the backend directory):
+    python -m modules.pre_processing.local_classifier train
+"""
+
+import argparse
+import threading
+from collections import Counter
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.pipeline import Pipeline
+from sklearn.svm import LinearSVC
+
+from .config import CLASSIFIER_MODEL_FILE
+
+
+class LocalNewsClassifier:
+    """Predicts `(category, subcategory)` with the same contract as the remote service."""
+
+    def __init__(self, pipeline: Pipeline, parents: dict[str, str]):
+        self.pipeline = pipeline
+        self.parents = parents  # subcategory -> category
+
+        vectorizer = pipeline.named_steps["tfidf"]
+        svm = pipeline.named_steps["svm"]
+        self._analyzer = vectorizer.build_analyzer()
+        self._vocabulary = vectorizer.vocabulary_
+        self._idf = vectorizer.idf_
+        self._weights = np.ascontiguousarray(svm.coef_.T)  # (n_features, n_scores)
+        self._intercept = svm.intercept_
+        self._classes = svm.classes_
+
+    @classmethod
+    def train(cls, samples: list[tuple[str, str, str]]) -> "LocalNewsClassifier":
+        """
+        :param samples: `(text, category, subcategory)` triples.
+        """
+        texts = [text for text, _, _ in samples]
+        labels = [subcategory for _, _, subcategory in samples]
+        if len(set(labels)) < 2:
+            raise ValueError("Need articles from at least two subcategories to train.")
+
+        pipeline = Pipeline(
+            [
+                (
+                    "tfidf",
+                    TfidfVectorizer(
+                        analyzer="char_wb",
+                        ngram_range=(2, 4),
+                        sublinear_tf=True,
+                        min_df=1,
+                    ),
+                ),
+                ("svm", LinearSVC(C=1.0, class_weight="balanced")),
+            ]
+        )
+        pipeline.fit(texts, labels)
+        parents = {subcategory: category for _, category, subcategory in samples}
+        return cls(pipeline, parents)
+
+    def predict(self, news_text: str) -> tuple[str, str]:
+        vocabulary = self._vocabulary
+        counts = Counter(
+            vocabulary[gram] for gram in self._analyzer(news_text) if gram in vocabulary
+        )
+        scores = self._intercept
+        if counts:
+            idx = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            features = (1.0 + np.log(tf)) * self._idf[idx]  # sublinear tf * idf
+            features /= np.linalg.norm(features)
+            scores = features @ self._weights[idx] + self._intercept
+
+        if len(scores) == 1:  # binary problem: one decision function
+            subcategory = str(self._classes[int(scores[0] > 0)])
+        else:
+            subcategory = str(self._classes[int(np.argmax(scores))])
+        return self.parents.get(subcategory, ""), subcategory
+
+    def save(self, path: Path = CLASSIFIER_MODEL_FILE):
+        joblib.dump({"pipeline": self.pipeline, "parents": self.parents}, path)
+
+    @classmethod
+    def load(cls, path: Path = CLASSIFIER_MODEL_FILE) -> "LocalNewsClassifier":
+        data = joblib.load(path)
+        return cls(data["pipeline"], data["parents"])
+
+
+def training_samples_from_ontology(ontology) -> list[tuple[str, str, str]]:
+    """Collect `(text, category, subcategory)` for every labelled `NewsArticle`."""
+    samples = []
+    for article in ontology.NewsArticle.instances():
+        category = subcategory = None
+        for cat in article.hasCategory:
+            parent = cat.is_a[0] if cat.is_a else None
+            if parent is None:
+                continue
+            if parent is ontology.NewsCategory:
+                category = cat.name
+            else:
+                subcategory = cat.name
+        text = " ".join([article.hasTitle or ""] + list(article.hasFullText)).strip()
+        if category and subcategory and text:
+            samples.append((text, category, subcategory))
+    return samples
+
+
+_classifier = None
+_classifier_lock = threading.Lock()
+
+
+def get_local_classifier() -> LocalNewsClassifier:
+    """Load the saved model once and reuse it for every request."""
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = LocalNewsClassifier.load()
+        return _classifier
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    train = sub.add_parser("train", help="train the classifier from the ontology")
+    train.add_argument("--ontology", type=Path, default=None, help="ontology file")
+    train.add_argument("--output", type=Path, default=CLASSIFIER_MODEL_FILE)
+    args = parser.parse_args(argv)
+
+    from ..dynamic_ontology.manager import OntologyManager
+
+    manager = OntologyManager(args.ontology) if args.ontology else OntologyManager()
+    samples = training_samples_from_ontology(manager.ontology)
+    print(f"[INFO] Training on {len(samples)} articles")
+    classifier = LocalNewsClassifier.train(samples)
+    classifier.save(args.output)
+    print(f"[INFO] Classifier saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
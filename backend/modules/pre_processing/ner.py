@@ -1,7 +1,13 @@
-import requests
-from requests.exceptions import RequestException
 from pydantic import BaseModel
 
+from ..remote_services.cache import result_cache
+from ..remote_services.client import post_json, post_json_sync
+from ..remote_services.config import NER_BASE_URL
+from .config import NER_BACKEND
+from .gazetteer_ner import gazetteer_ner
+
+NER_API_URL = f"{NER_BASE_URL}/ner"
+
 
 class NERServiceOutput(BaseModel):
     persons: list[str]
@@ -10,18 +16,51 @@ class NERServiceOutput(BaseModel):
     events: list[str]
 
 
-def extract_named_entities(news_text, api_url="https://ner-server-v2.onrender.com/ner"):
+def _entities_from_result(result):
+    return (
+        result.get("persons", []),
+        result.get("locations", []),
+        result.get("events", []),
+        result.get("organizations", []),
+    )
+
+
+def _entities_on_error(news_text, backend, e):
+    print(f"[Error] Could not get entities from API: {e}")
+    if backend == "fallback":
+        return gazetteer_ner.extract(news_text)
+    return [], [], [], []
+
+
+async def extract_named_entities_async(
+    news_text, api_url=NER_API_URL, backend=NER_BACKEND
+):
+    if backend == "local":
+        return gazetteer_ner.extract(news_text)
+    cached = await result_cache.get_async("ner", api_url, news_text)
+    if cached is not None:
+        return tuple(cached)
+    payload = {"text": news_text}
+    try:
+        result = await post_json("ner", api_url, payload)
+        entities = _entities_from_result(result)
+    except Exception as e:
+        return _entities_on_error(news_text, backend, e)
+    await result_cache.set_async("ner", api_url, news_text, entities)
+    return entities
+
+
+def extract_named_entities(news_text, api_url=NER_API_URL, backend=NER_BACKEND):
+    if backend == "local":
+        return gazetteer_ner.extract(news_text)
+    cached = result_cache.get("ner", api_url, news_text)
+    if cached is not None:
+        return tuple(cached)
     payload = {"text": news_text}
     try:
-        response = requests.post(api_url, json=payload, timeout=90)
-        response.raise_for_status()
-        result = response.json()
-        return (
-            result.get("persons", []),
-            result.get("locations", []),
-            result.get("events", []),
-            result.get("organizations", []),
-        )
+        result = post_json_sync("ner", api_url, payload)
+        entities = _entities_from_result(result)
     except Exception as e:
-        print(f"[Error] Could not get entities from API: {e}")
-        return [], [], [], []
+        return _entities_on_error(news_text, backend, e)
+    result_cache.set("ner", api_url, news_text, entities)
+    return entities
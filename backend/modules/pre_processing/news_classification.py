@@ -1,23 +1,69 @@
-import requests
+from ..remote_services.cache import result_cache
+from ..remote_services.client import post_json, post_json_sync
+from ..remote_services.config import MODEL_SERVICE_BASE_URL
+from .config import CLASSIFICATION_BACKEND
+from .local_classifier import get_local_classifier
 
 # NOTE: Here we hosted in the google colab, the classification is done in the google colab. We use it in here to get the category and subcategory of the news text.
 
+CLASSIFICATION_API_URL = f"{MODEL_SERVICE_BASE_URL}/check_category"
+
+
+def _classify_locally(news_text) -> tuple[str, str]:
+    try:
+        return get_local_classifier().predict(news_text)
+    except Exception as e:
+        print(f"[Error] Could not get category and subcategory from local model: {e}")
+        return "", ""
+
+
+async def get_category_subcategory_async(
+    news_text, api_url=CLASSIFICATION_API_URL, backend=CLASSIFICATION_BACKEND
+) -> tuple[str, str]:
+    """
+    Async version of `get_category_subcategory`, for use inside the FastAPI handlers.
+    """
+    if backend == "local":
+        return _classify_locally(news_text)
+    cached = await result_cache.get_async("classification", api_url, news_text)
+    if cached is not None:
+        return tuple(cached)
+    payload = {"text": news_text}
+    try:
+        result = await post_json("classification", api_url, payload)
+        labels = result.get("category", ""), result.get("subcategory", "")
+    except Exception as e:
+        print(f"[Error] Could not get category and subcategory from API: {e}")
+        return "", ""
+    if all(labels):
+        await result_cache.set_async("classification", api_url, news_text, labels)
+    return labels
+
 
 def get_category_subcategory(
-    news_text, api_url="https://relaxing-morally-wallaby.ngrok-free.app/check_category"
+    news_text, api_url=CLASSIFICATION_API_URL, backend=CLASSIFICATION_BACKEND
 ) -> tuple[str, str]:
     """
     Get the category and subcategory of the news text. This code is hosted in the google colab.
+    Successful results are served from `result_cache` on repeated inputs.
     :param news_text: The text of the news article.
     :param api_url: The URL of the API that performs the classification.
+    :param backend: "remote" for the hosted service, "local" for the in-process model
+        trained by `python -m modules.pre_processing.local_classifier train`.
     :return: A tuple containing the category and subcategory of the news article.
     """
+    if backend == "local":
+        return _classify_locally(news_text)
+    cached = result_cache.get("classification", api_url, news_text)
+    if cached is not None:
+        return tuple(cached)
     payload = {"text": news_text}
     try:
-        response = requests.post(api_url, json=payload, timeout=90)
-        response.raise_for_status()
-        result = response.json()
-        return result.get("category", ""), result.get("subcategory", "")
+        result = post_json_sync("classification", api_url, payload)
+        labels = result.get("category", ""), result.get("subcategory", "")
     except Exception as e:
         print(f"[Error] Could not get category and subcategory from API: {e}")
         return "", ""
+    if all(labels):
+        result_cache.set("classification", api_url, news_text, labels)
+    return labels
@@ -1,19 +1,45 @@
 from fastapi import HTTPException
-import requests
 
+from ..remote_services.cache import result_cache
+from ..remote_services.client import post_json, post_json_sync
+from ..remote_services.config import MODEL_SERVICE_BASE_URL
 
-def get_news_or_not(
-    news_text, api_url="https://relaxing-morally-wallaby.ngrok-free.app/check_news"
-):
+NEWS_DETECTION_API_URL = f"{MODEL_SERVICE_BASE_URL}/check_news"
+
+
+def _detection_failed(e):
+    print(f"[Error] Could not get news or not from API: {e}")
+    return HTTPException(
+        status_code=500,
+        detail="Failed to connect to the news detection service. Please try again later.",
+    )
+
+
+async def get_news_or_not_async(news_text, api_url=NEWS_DETECTION_API_URL):
+    cached = await result_cache.get_async("news_detection", api_url, news_text)
+    if cached is not None:
+        return cached
+    payload = {"text": news_text}
+    try:
+        result = await post_json("news_detection", api_url, payload)
+    except Exception as e:
+        raise _detection_failed(e)
+    checking = result.get("checking", "")
+    if checking != "":
+        await result_cache.set_async("news_detection", api_url, news_text, checking)
+    return checking
+
+
+def get_news_or_not(news_text, api_url=NEWS_DETECTION_API_URL):
+    cached = result_cache.get("news_detection", api_url, news_text)
+    if cached is not None:
+        return cached
     payload = {"text": news_text}
     try:
-        response = requests.post(api_url, json=payload, timeout=90)
-        response.raise_for_status()
-        result = response.json()
-        return result.get("checking", "")
+        result = post_json_sync("news_detection", api_url, payload)
     except Exception as e:
-        print(f"[Error] Could not get news or not from API: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to connect to the news detection service. Please try again later.",
-        )
+        raise _detection_failed(e)
+    checking = result.get("checking", "")
+    if checking != "":
+        result_cache.set("news_detection", api_url, news_text, checking)
+    return checking
@@ -0,0 +1 @@
+# Remote services module init
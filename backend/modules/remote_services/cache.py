@@ -0,0 +1,179 @@
+"""
+Content-addressed cache for remote model service results.
+
+Entries are keyed by the service name and a hash of the service URL, the
+cache version and the normalized input text, so pointing a client at another
+service (or bumping RESULT_CACHE_VERSION after a model change) starts afresh.
+The in-memory tier is an LRU with a TTL; an optional SQLite tier keeps results
+across restarts. Values are stored as JSON, so callers always get a fresh copy.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+
+from .config import (
+    RESULT_CACHE_DB,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_TTL,
+    RESULT_CACHE_VERSION,
+)
+
+_MISS = object()
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize and collapse whitespace so trivially different inputs share a key."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def cache_key(service: str, url: str, text: str) -> str:
+    source = f"{RESULT_CACHE_VERSION}\0{url}\0{normalize_text(text)}"
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return f"{service}:{digest}"
+
+
+class ResultCache:
+    """In-memory LRU + TTL cache with an optional SQLite persistent tier."""
+
+    def __init__(
+        self,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        ttl: float = RESULT_CACHE_TTL,
+        db_path: Path | None = RESULT_CACHE_DB,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+
+        self._db = None
+        if db_path is not None:
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "DELETE FROM result_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            self._db.commit()
+
+    # ------------------------------------------------------------------ utils
+
+    def _count(self, service: str, counter: str):
+        per_service = self._counters.setdefault(
+            service, {"hits": 0, "persistent_hits": 0, "misses": 0, "stores": 0}
+        )
+        per_service[counter] += 1
+
+    def _remember(self, key: str, expires_at: float, value: str):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # ------------------------------------------------------------------ public
+
+    def _from_memory(self, service: str, key: str, now: float) -> Any:
+        # Callers hold the lock
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self._count(service, "hits")
+                return json.loads(value)
+            del self._entries[key]
+        return _MISS
+
+    def _from_db(self, service: str, key: str, now: float) -> Any:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] > now:
+                self._remember(key, row[1], row[0])
+                self._count(service, "hits")
+                self._count(service, "persistent_hits")
+                return json.loads(row[0])
+            self._count(service, "misses")
+            return None
+
+    def get(self, service: str, url: str, text: str) -> Any | None:
+        """Return the cached result of `service` at `url` for `text`, or None on a miss."""
+        key = cache_key(service, url, text)
+        now = time.time()
+        with self._lock:
+            value = self._from_memory(service, key, now)
+            if value is not _MISS:
+                return value
+            if self._db is None:
+                self._count(service, "misses")
+                return None
+        return self._from_db(service, key, now)
+
+    async def get_async(self, service: str, url: str, text: str) -> Any | None:
+        """`get` for the event loop: a lookup in the SQLite tier runs in the threadpool."""
+        key = cache_key(service, url, text)
+        now = time.time()
+        with self._lock:
+            value = self._from_memory(service, key, now)
+            if value is not _MISS:
+                return value
+            if self._db is None:
+                self._count(service, "misses")
+                return None
+        return await run_in_threadpool(self._from_db, service, key, now)
+
+    def set(self, service: str, url: str, text: str, value: Any):
+        """Store a successful result. Never call this with a failure fallback value."""
+        key = cache_key(service, url, text)
+        expires_at = time.time() + self.ttl
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, expires_at, encoded)
+            self._count(service, "stores")
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO result_cache (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, encoded, expires_at),
+                )
+                self._db.commit()
+
+    async def set_async(self, service: str, url: str, text: str, value: Any):
+        """`set` for the event loop: with the SQLite tier it runs in the threadpool."""
+        if self._db is None:
+            self.set(service, url, text, value)
+        else:
+            await run_in_threadpool(self.set, service, url, text, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM result_cache")
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters per service plus current tier sizes."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "persistent": self._db is not None,
+                "services": {name: dict(c) for name, c in self._counters.items()},
+            }
+
+
+# Shared cache used by the NER, classification and news-detection clients
+result_cache = ResultCache()
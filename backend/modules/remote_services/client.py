@@ -0,0 +1,147 @@
+"""
+Shared HTTP client layer for the remote model services.
+
+All remote calls go through `post_json` (async, for the FastAPI handlers) or
+`post_json_sync` (blocking, for scripts and sync helpers). Both keep their
+connections alive in a shared pool and cap the number of in-flight requests
+per service, so one slow service cannot exhaust the pool for the others.
+Deadlines, circuit breaking, retries and hedging are applied by `resilience`;
+identical concurrent calls are coalesced into one request by `remote_call_flight`.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import (
+    KEEPALIVE_EXPIRY,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    SERVICE_SETTINGS,
+)
+from .coalescing import SingleFlight, payload_key
+from .resilience import call_async, call_sync
+
+# Identical (service, url, payload) calls in flight at the same time share one request
+remote_call_flight = SingleFlight("remote_calls")
+
+# ------------------------------------------------------------------ async
+
+_async_client: httpx.AsyncClient | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
+_async_limits: dict[str, asyncio.Semaphore] = {}
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the pooled client bound to the running event loop."""
+    global _async_client, _async_loop, _async_limits
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _async_loop = loop
+        _async_limits = {
+            name: asyncio.Semaphore(settings.max_concurrency)
+            for name, settings in SERVICE_SETTINGS.items()
+        }
+    return _async_client
+
+
+async def post_json(service: str, url: str, payload: dict[str, Any]) -> Any:
+    """
+    POST `payload` as JSON to `url` on behalf of `service` and return the decoded body.
+    Raises on connection errors, timeouts, non-2xx responses, an open circuit
+    or an exceeded request deadline.
+    """
+    settings = SERVICE_SETTINGS[service]
+    client = _get_async_client()
+    limit = _async_limits[service]
+
+    async def attempt(timeout: float) -> Any:
+        async with limit:
+            response = await client.post(
+                url,
+                json=payload,
+                timeout=httpx.Timeout(
+                    timeout, connect=min(timeout, settings.connect_timeout)
+                ),
+            )
+        response.raise_for_status()
+        return response.json()
+
+    return await remote_call_flight.do(
+        payload_key(service, url, payload), lambda: call_async(service, attempt)
+    )
+
+
+async def close_async_client():
+    """Close the pooled async client (call on application shutdown)."""
+    global _async_client, _async_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+    _async_client = None
+    _async_loop = None
+
+
+# ------------------------------------------------------------------ sync
+
+_sync_session: requests.Session | None = None
+_sync_session_lock = threading.Lock()
+_sync_limits: dict[str, threading.BoundedSemaphore] = {
+    name: threading.BoundedSemaphore(settings.max_concurrency)
+    for name, settings in SERVICE_SETTINGS.items()
+}
+
+
+def _get_sync_session() -> requests.Session:
+    global _sync_session
+    with _sync_session_lock:
+        if _sync_session is None:
+            adapter = HTTPAdapter(
+                pool_connections=len(SERVICE_SETTINGS),
+                pool_maxsize=MAX_KEEPALIVE_CONNECTIONS,
+            )
+            _sync_session = requests.Session()
+            _sync_session.mount("http://", adapter)
+            _sync_session.mount("https://", adapter)
+        return _sync_session
+
+
+def post_json_sync(service: str, url: str, payload: dict[str, Any]) -> Any:
+    """Blocking counterpart of `post_json`, sharing a keep-alive `requests.Session`."""
+    settings = SERVICE_SETTINGS[service]
+    session = _get_sync_session()
+    limit = _sync_limits[service]
+
+    def attempt(timeout: float) -> Any:
+        give_up_at = time.monotonic() + timeout
+        if not limit.acquire(timeout=timeout):
+            raise TimeoutError(
+                f"No free {service} connection slot within {timeout:.1f}s"
+            )
+        try:
+            # What the slot wait left of the attempt's time
+            left = max(give_up_at - time.monotonic(), 0.001)
+            response = session.post(
+                url,
+                json=payload,
+                timeout=(min(left, settings.connect_timeout), left),
+            )
+        finally:
+            limit.release()
+        response.raise_for_status()
+        return response.json()
+
+    return remote_call_flight.do_sync(
+        payload_key(service, url, payload), lambda: call_sync(service, attempt)
+    )
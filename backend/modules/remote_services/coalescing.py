@@ -0,0 +1,94 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same key share one in-flight execution and
+all receive its result (or its exception). Used for whole verifications in
+`main.py` and for individual remote service calls in `client.py`.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable
+
+
+def payload_key(*parts: Any) -> str:
+    """Stable hash of JSON-serializable parts (service, url, payload, ...)."""
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _SyncCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._sync_calls: dict[str, _SyncCall] = {}
+        self._lock = threading.Lock()
+        self.executions = 0  # calls that actually ran
+        self.folded = 0  # calls that joined an execution already in flight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `fn()`, or join the identical call already in flight for `key`."""
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda _: self._forget(key, task))
+                self.executions += 1
+            else:
+                self.folded += 1
+        # shield: one caller giving up must not cancel the shared execution
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark as retrieved when every caller went away
+
+    def do_sync(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Blocking counterpart of `do` for calls made from worker threads."""
+        with self._lock:
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[key] = _SyncCall()
+                self.executions += 1
+            else:
+                self.folded += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._sync_calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "folded": self.folded,
+                "in_flight": len(self._tasks) + len(self._sync_calls),
+            }
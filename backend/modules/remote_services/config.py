@@ -0,0 +1,86 @@
+"""
+Connection settings for the remote model services (NER, classification,
+news detection and semantic similarity).
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# Base URLs of the hosted services. Point them at the bundled stand-in
+# (`python -m modules.remote_services.standin`) for offline runs and benchmarks;
+# REMOTE_SERVICES_BASE_URL overrides all of them at once.
+_BASE_URL_OVERRIDE = os.environ.get("REMOTE_SERVICES_BASE_URL")
+NER_BASE_URL: str = _BASE_URL_OVERRIDE or os.environ.get(
+    "NER_BASE_URL", "https://ner-server-v2.onrender.com"
+)
+MODEL_SERVICE_BASE_URL: str = _BASE_URL_OVERRIDE or os.environ.get(
+    "MODEL_SERVICE_BASE_URL", "https://relaxing-morally-wallaby.ngrok-free.app"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceSettings:
+    """Per-service timeout and concurrency limits."""
+
+    # Seconds per attempt (capped by the request deadline). Async calls give up
+    # on the whole attempt after it. `requests` has no total timeout, so blocking
+    # calls only bound the connection slot wait, the connect and each socket read
+    # by what is left of it.
+    timeout: float
+    connect_timeout: float  # seconds to establish the TCP/TLS connection
+    max_concurrency: int  # simultaneous in-flight requests to this service
+
+
+SERVICE_SETTINGS: dict[str, ServiceSettings] = {
+    "ner": ServiceSettings(timeout=90.0, connect_timeout=10.0, max_concurrency=8),
+    "classification": ServiceSettings(
+        timeout=90.0, connect_timeout=10.0, max_concurrency=16
+    ),
+    "news_detection": ServiceSettings(
+        timeout=90.0, connect_timeout=10.0, max_concurrency=16
+    ),
+    "similarity": ServiceSettings(
+        timeout=90.0, connect_timeout=10.0, max_concurrency=16
+    ),
+}
+
+# Shared connection pool (all services)
+MAX_CONNECTIONS: int = 64
+MAX_KEEPALIVE_CONNECTIONS: int = 32
+KEEPALIVE_EXPIRY: float = 60.0  # seconds an idle connection is kept open
+
+# Number of trusted texts sent per batched similarity request
+SIMILARITY_BATCH_SIZE: int = 32
+
+# Result cache for NER / classification / news detection
+RESULT_CACHE_MAX_ENTRIES: int = 10_000
+RESULT_CACHE_TTL: float = 24 * 60 * 60  # seconds
+# Part of every cache key (with the service URL): bump it after a model change
+# behind an unchanged URL to stop serving the old model's results
+RESULT_CACHE_VERSION: str = os.environ.get("RESULT_CACHE_VERSION", "1")
+# Set RESULT_CACHE_DB to a file path to keep cached results across restarts
+RESULT_CACHE_DB: Path | None = (
+    Path(os.environ["RESULT_CACHE_DB"]) if os.environ.get("RESULT_CACHE_DB") else None
+)
+
+# End-to-end deadline for one API request (all remote calls it makes)
+REQUEST_DEADLINE: float = float(os.environ.get("REQUEST_DEADLINE", "30"))
+
+# Circuit breaker: open after N consecutive failures, probe again after T seconds
+CIRCUIT_FAILURE_THRESHOLD: int = 5
+CIRCUIT_RESET_TIMEOUT: float = 30.0
+
+# Retries with exponential backoff (+ jitter), limited by a shared retry budget
+RETRY_MAX_ATTEMPTS: int = 3
+RETRY_BACKOFF_BASE: float = 0.2  # seconds
+RETRY_BACKOFF_MAX: float = 2.0  # seconds
+RETRY_BUDGET_RATIO: float = 0.1  # retries/hedges allowed per successful call
+RETRY_BUDGET_MAX_TOKENS: float = 10.0
+
+# Hedged requests: send a duplicate once a call is slower than this percentile
+HEDGE_PERCENTILE: float = 0.95
+HEDGE_MIN_SAMPLES: int = 20
+HEDGE_MIN_DELAY: float = 0.05  # seconds
+LATENCY_WINDOW: int = 200  # recent calls kept per service for percentiles
@@ -0,0 +1,395 @@
+"""
+Resilience policies shared by all remote model service calls.
+
+- Deadlines: `request_deadline()` sets an end-to-end budget for everything an
+  API request does; every remote call gets at most the time that is left.
+- Circuit breakers: after repeated failures a service is short-circuited for a
+  while instead of making every request wait for its timeout.
+- Retries: transient failures are retried with exponential backoff and jitter,
+  limited by a retry budget shared by all services so retries cannot amplify
+  an outage.
+- Hedging (async only): when a call is slower than the service's recent
+  latency percentile, a duplicate request is sent and the first answer wins.
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable
+
+import httpx
+import requests
+
+from .config import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+    LATENCY_WINDOW,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RETRY_BUDGET_MAX_TOKENS,
+    RETRY_BUDGET_RATIO,
+    RETRY_MAX_ATTEMPTS,
+    SERVICE_SETTINGS,
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's end-to-end deadline has passed."""
+
+
+class CircuitOpenError(RuntimeError):
+    """The service's circuit breaker is open; the call was not attempted."""
+
+
+# ------------------------------------------------------------------ deadlines
+
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "remote_call_deadline", default=None
+)
+
+
+@contextmanager
+def request_deadline(seconds: float):
+    """Limit all remote calls made inside this block (and tasks/threads it spawns)."""
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(deadline if outer is None else min(outer, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline, or None when there is none."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+# ------------------------------------------------------------------ policies
+
+
+class CircuitBreaker:
+    """Closed -> open after N consecutive failures -> half-open single probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Forget an attempt that ended without telling us anything about the service."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if (
+                self.state == "half_open"
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class LatencyTracker:
+    """Sliding window of recent successful call latencies (seconds)."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self) -> float | None:
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+        return max(HEDGE_MIN_DELAY, self.percentile(HEDGE_PERCENTILE))
+
+    def __len__(self):
+        return len(self._samples)
+
+
+class RetryBudget:
+    """Token bucket: successes earn `ratio` tokens, each retry or hedge spends one."""
+
+    def __init__(
+        self,
+        ratio: float = RETRY_BUDGET_RATIO,
+        max_tokens: float = RETRY_BUDGET_MAX_TOKENS,
+    ):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1.0:
+                return False
+            self.tokens -= 1.0
+            return True
+
+
+class ServiceHealth:
+    def __init__(self):
+        self.breaker = CircuitBreaker()
+        self.latency = LatencyTracker()
+        self.counters = {
+            "calls": 0,
+            "failures": 0,
+            "retries": 0,
+            "hedges": 0,
+            "hedge_wins": 0,
+            "short_circuited": 0,
+        }
+        self._lock = threading.Lock()
+
+    def count(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        p50 = self.latency.percentile(0.5)
+        p95 = self.latency.percentile(0.95)
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.consecutive_failures,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            **counters,
+        }
+
+
+_services: dict[str, ServiceHealth] = {
+    name: ServiceHealth() for name in SERVICE_SETTINGS
+}
+retry_budget = RetryBudget()
+
+
+def resilience_snapshot() -> dict[str, Any]:
+    """Circuit state, latency percentiles and counters per service (for /health)."""
+    return {
+        "services": {name: health.snapshot() for name, health in _services.items()},
+        "retry_budget_tokens": round(retry_budget.tokens, 2),
+    }
+
+
+# ------------------------------------------------------------------ helpers
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Transport errors, timeouts, 5xx and 429 are transient; everything else is not."""
+    if isinstance(exc, (DeadlineExceeded, CircuitOpenError)):
+        return False
+    if isinstance(exc, (httpx.HTTPStatusError, requests.HTTPError)):
+        status = exc.response.status_code if exc.response is not None else 0
+        return status >= 500 or status == 429
+    return isinstance(
+        exc,
+        (
+            TimeoutError,
+            httpx.TransportError,
+            requests.ConnectionError,
+            requests.Timeout,
+        ),
+    )
+
+
+def _attempt_timeout(service: str) -> float:
+    timeout = SERVICE_SETTINGS[service].timeout
+    left = remaining_time()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before calling {service}")
+    return min(timeout, left)
+
+
+def _backoff(attempt: int) -> float | None:
+    """Backoff before retry number `attempt`, or None if the deadline does not allow it."""
+    delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt)
+    delay *= random.uniform(0.5, 1.0)
+    left = remaining_time()
+    if left is not None and delay >= left:
+        return None
+    return delay
+
+
+def _after_failure(health: ServiceHealth, exc: Exception, attempt: int) -> float | None:
+    """Record a failed attempt; return the backoff before retrying, or None to give up."""
+    left = remaining_time()
+    if left is not None and left <= 0:
+        # Cut short by the caller's deadline, not necessarily a service failure.
+        health.breaker.release_probe()
+        raise DeadlineExceeded("Request deadline exceeded") from exc
+    health.count("failures")
+    if is_retryable(exc):
+        health.breaker.record_failure()
+    else:
+        # The service answered (e.g. 4xx): it is up, the request was bad.
+        health.breaker.record_success()
+        return None
+    if attempt + 1 >= RETRY_MAX_ATTEMPTS:
+        return None
+    delay = _backoff(attempt)
+    if delay is None or not retry_budget.try_withdraw():
+        return None
+    health.count("retries")
+    return delay
+
+
+def _start(service: str) -> tuple[ServiceHealth, float]:
+    health = _services[service]
+    timeout = _attempt_timeout(service)
+    if not health.breaker.allow():
+        health.count("short_circuited")
+        raise CircuitOpenError(f"Circuit open for {service}; failing fast")
+    health.count("calls")
+    return health, timeout
+
+
+def _succeeded(health: ServiceHealth, started: float):
+    health.latency.record(time.monotonic() - started)
+    health.breaker.record_success()
+    retry_budget.deposit()
+
+
+# ------------------------------------------------------------------ async
+
+
+async def _hedged(
+    health: ServiceHealth, attempt: Callable[[float], Awaitable[Any]], timeout: float
+) -> Any:
+    give_up_at = time.monotonic() + timeout
+    tasks = [asyncio.ensure_future(attempt(timeout))]
+    try:
+        delay = health.latency.hedge_delay()
+        if delay is not None and delay < timeout:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and retry_budget.try_withdraw():
+                health.count("hedges")
+                tasks.append(
+                    asyncio.ensure_future(attempt(give_up_at - time.monotonic()))
+                )
+
+        pending = set(tasks)
+        error = None
+        while pending:
+            left = give_up_at - time.monotonic()
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=max(left, 0),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise TimeoutError(f"Call timed out after {timeout:.1f}s")
+            for task in done:
+                if task.exception() is None:
+                    if task is not tasks[0]:
+                        health.count("hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark as retrieved
+
+
+async def call_async(service: str, attempt: Callable[[float], Awaitable[Any]]) -> Any:
+    """
+    Run `attempt(timeout)` under the service's deadline, circuit breaker, retry
+    and hedging policies and return its result.
+    """
+    for attempt_no in range(RETRY_MAX_ATTEMPTS):
+        health, timeout = _start(service)
+        started = time.monotonic()
+        try:
+            result = await _hedged(health, attempt, timeout)
+        except asyncio.CancelledError:
+            health.breaker.release_probe()
+            raise
+        except Exception as e:
+            delay = _after_failure(health, e, attempt_no)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            continue
+        _succeeded(health, started)
+        return result
+
+
+# ------------------------------------------------------------------ sync
+
+
+def call_sync(service: str, attempt: Callable[[float], Any]) -> Any:
+    """Blocking counterpart of `call_async` (deadline, breaker and retries; no hedging)."""
+    for attempt_no in range(RETRY_MAX_ATTEMPTS):
+        health, timeout = _start(service)
+        started = time.monotonic()
+        try:
+            result = attempt(timeout)
+        except Exception as e:
+            delay = _after_failure(health, e, attempt_no)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            continue
+        _succeeded(health, started)
+        return result
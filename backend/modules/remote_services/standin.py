@@ -0,0 +1,191 @@
+"""
+Local stand-in for the hosted NER / classification / news-detection / similarity
+services, for offline runs, load tests and benchmarks.
+
+Responses are deterministic and taken from `data/samples/*.json`: a sample
+article's own labels when the input matches it, otherwise the labels of the
+closest sample (character trigram overlap). Latency, error rate and throughput
+are configurable so the backend's resilience behaviour can be exercised.
+
+Run from the backend directory, then point the backend at it:
+    python -m modules.remote_services.standin --port 8100 --latency lognormal:0.08,0.5
+    REMOTE_SERVICES_BASE_URL=http://127.0.0.1:8100 python main.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from .cache import normalize_text
+
+SAMPLES_DIR: Path = Path(__file__).parent.parent.parent / "data" / "samples"
+
+ENTITY_TYPES = ["persons", "locations", "events", "organizations"]
+
+
+class TextRequest(BaseModel):
+    text: str
+
+
+class SimilarityRequest(BaseModel):
+    news_text: str
+    trusted_texts: list[str]
+
+
+@dataclass
+class StandinOptions:
+    # fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA | exponential:MEAN (seconds)
+    latency: str = "fixed:0"
+    error_rate: float = 0.0  # fraction of requests answered with 503
+    max_rps: float = 0.0  # throughput cap in requests/second (0 = unlimited)
+    max_concurrency: int = 0  # simultaneous requests being served (0 = unlimited)
+    seed: int = 0
+
+
+def parse_latency(spec: str):
+    """Return a `random.Random -> seconds` sampler for a latency spec string."""
+    kind, _, args = spec.partition(":")
+    params = [float(p) for p in args.split(",") if p]
+    if kind == "fixed":
+        return lambda rng: params[0] if params else 0.0
+    if kind == "uniform":
+        return lambda rng: rng.uniform(params[0], params[1])
+    if kind == "lognormal":
+        median, sigma = params
+        return lambda rng: median * rng.lognormvariate(0.0, sigma)
+    if kind == "exponential":
+        return lambda rng: rng.expovariate(1.0 / params[0])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def _trigrams(text: str) -> set[str]:
+    text = normalize_text(text)
+    return {text[i : i + 3] for i in range(max(len(text) - 2, 1))}
+
+
+def _overlap(a: set[str], b: set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+class SampleIndex:
+    """Sample articles keyed by normalized content, with nearest-sample lookup."""
+
+    def __init__(self, samples_dir: Path = SAMPLES_DIR):
+        self.articles = []
+        seen = set()
+        for path in sorted(samples_dir.glob("*.json")):
+            with open(path, encoding="utf-8") as f:
+                for article in json.load(f):
+                    key = normalize_text(article["content"])
+                    if key not in seen:
+                        seen.add(key)
+                        self.articles.append(article)
+        self._by_content = {normalize_text(a["content"]): a for a in self.articles}
+        self._grams = [_trigrams(a["content"]) for a in self.articles]
+
+    def lookup(self, text: str) -> dict:
+        exact = self._by_content.get(normalize_text(text))
+        if exact is not None:
+            return exact
+        grams = _trigrams(text)
+        scores = [_overlap(grams, g) for g in self._grams]
+        return self.articles[max(range(len(scores)), key=scores.__getitem__)]
+
+    def entities_in(self, text: str) -> dict[str, list[str]]:
+        """All sample entity names that occur verbatim in `text`."""
+        exact = self._by_content.get(normalize_text(text))
+        if exact is not None:
+            return {etype: exact.get(etype, []) for etype in ENTITY_TYPES}
+        found = {etype: [] for etype in ENTITY_TYPES}
+        for article in self.articles:
+            for etype in ENTITY_TYPES:
+                for name in article.get(etype, []):
+                    if name in text and name not in found[etype]:
+                        found[etype].append(name)
+        return found
+
+
+def create_app(options: StandinOptions, samples: SampleIndex | None = None) -> FastAPI:
+    samples = samples or SampleIndex()
+    sample_latency = parse_latency(options.latency)
+    rng = random.Random(options.seed)
+    concurrency = (
+        asyncio.Semaphore(options.max_concurrency) if options.max_concurrency else None
+    )
+    next_slot = [time.monotonic()]  # earliest start time allowed by max_rps
+    app = FastAPI(title="News Verifier service stand-in")
+
+    async def simulate():
+        if options.max_rps:
+            now = time.monotonic()
+            start = max(now, next_slot[0])
+            next_slot[0] = start + 1.0 / options.max_rps
+            await asyncio.sleep(start - now)
+        if concurrency is not None:
+            await concurrency.acquire()
+        try:
+            await asyncio.sleep(sample_latency(rng))
+            if rng.random() < options.error_rate:
+                raise HTTPException(status_code=503, detail="Injected failure")
+        finally:
+            if concurrency is not None:
+                concurrency.release()
+
+    @app.post("/ner")
+    async def ner(request: TextRequest):
+        await simulate()
+        return samples.entities_in(request.text)
+
+    @app.post("/check_category")
+    async def check_category(request: TextRequest):
+        await simulate()
+        article = samples.lookup(request.text)
+        return {"category": article["category"], "subcategory": article["subcategory"]}
+
+    @app.post("/check_news")
+    async def check_news(request: TextRequest):
+        await simulate()
+        return {"checking": "News"}
+
+    @app.post("/similarity")
+    async def similarity(request: SimilarityRequest):
+        await simulate()
+        grams = _trigrams(request.news_text)
+        scores = [_overlap(grams, _trigrams(t)) for t in request.trusted_texts]
+        return {"max_similarity": max(scores, default=0.0), "scores": scores}
+
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default="fixed:0", help="e.g. uniform:0.05,0.2")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=0.0)
+    parser.add_argument("--max-concurrency", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    options = StandinOptions(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        max_rps=args.max_rps,
+        max_concurrency=args.max_concurrency,
+        seed=args.seed,
+    )
+    parse_latency(options.latency)  # fail early on a bad spec
+    uvicorn.run(create_app(options), host=args.host, port=args.port, log_level="info")
+
+
+if __name__ == "__main__":
+    main()
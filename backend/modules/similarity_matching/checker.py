@@ -2,6 +2,7 @@
 Main entry point for fake news similarity checking logic.
 """
 
+from contextlib import nullcontext
 from typing import Dict, Any
 from pydantic import BaseModel
 from .similarity_engine import (
@@ -9,10 +10,42 @@ from .similarity_engine import (
     get_trusted_publishers,
     get_source_credibility,
     get_trusted_contents_by_category,
-    get_semantic_similarity_score,
+    get_semantic_similarity_scores,
     get_average_similarity,
 )
 from .query_mapping import QUERY_MAP
+from .config import SIMILARITY_BACKEND
+from .local_similarity import local_similarity_engine
+from .entity_index import entity_index
+from .trusted_view import trusted_view
+
+# Fields of each semantic_ranking entry besides score and rank
+RANKING_FIELDS = ("title", "url", "trustSementics")
+
+
+def _category_shard(news_json, ontology_manager):
+    """
+    With category shards, a context that keeps the shard of the claim's
+    category loaded while the lookups find its articles (a concurrent load
+    could otherwise unload it halfway); other shards are not touched.
+    """
+    shards = getattr(ontology_manager, "shards", None)
+    if shards is not None:
+        for category in (news_json.get("subcategory"), news_json.get("category")):
+            if category and shards.shard_of(category) is not None:
+                return shards.use(category)
+    return nullcontext()
+
+
+def _ontology_reads(ontology_manager):
+    """
+    Lock to hold while reading the ontology or the indexes built from it:
+    writers (populate, merge, compaction, reader-worker refresh) hold it while
+    they change them. Held for the lookups only, never across remote calls.
+    """
+    if ontology_manager is None:
+        return nullcontext()
+    return ontology_manager.write_lock
 
 
 def check_fake(
@@ -22,8 +55,22 @@ def check_fake(
     Checks if a news article is fake by comparing entities, content, and source credibility.
     Returns a score, result label, and breakdown.
     """
+    with _category_shard(news_json, ontology_manager):
+        return _check_fake(news_json, _ontology_reads(ontology_manager), debug)
+
+
+def _check_fake(news_json: Dict[str, Any], reads, debug: bool) -> Dict[str, Any]:
     subcat = news_json.get("subcategory")
     entity_types = ["persons", "locations", "events", "organizations"]
+    with reads:
+        verified_values = {
+            etype: (
+                get_verified_values(QUERY_MAP[subcat][etype])
+                if subcat in QUERY_MAP and etype in QUERY_MAP[subcat]
+                else []
+            )
+            for etype in entity_types
+        }
 
     avg_scores = {}
     debug_outputs = {}
@@ -34,12 +81,8 @@ def check_fake(
     for etype in entity_types:
         values = news_json.get(etype, [])
         counts[etype] = len(values)
-        if subcat in QUERY_MAP and etype in QUERY_MAP[subcat]:
-            verified = get_verified_values(QUERY_MAP[subcat][etype])
-        else:
-            verified = []
         avg, debug_pairs = get_average_similarity(
-            values, verified, etype if debug else None
+            values, verified_values[etype], etype if debug else None
         )
         avg_scores[etype] = avg
         debug_outputs[etype] = debug_pairs
@@ -54,13 +97,14 @@ def check_fake(
         print(f"  Overall entity similarity score: {entity_similarity_score:.3f}")
 
     # --- Semantic Similarity Ranking ---
-    trusted_cont = get_trusted_contents_by_category(subcat)
+    with reads:
+        trusted_cont = get_trusted_contents_by_category(subcat)
     content = news_json.get("content", "")
+    scores = get_semantic_similarity_scores(
+        content, [t.trustSementics for t in trusted_cont]
+    )
     similarity_results = []
-    for t in trusted_cont:
-        score = get_semantic_similarity_score(
-            content, [t.trustSementics]
-        )  # Send [t], not t!
+    for t, score in zip(trusted_cont, scores):
         similarity_results.append(
             {
                 "title": t.title,
@@ -83,7 +127,8 @@ def check_fake(
     )
 
     # --- Source Credibility ---
-    trusted_publishers = get_trusted_publishers()
+    with reads:
+        trusted_publishers = get_trusted_publishers()
     publisher = news_json.get("source", "")
     source_credibility_score = get_source_credibility(publisher, trusted_publishers)
 
@@ -135,12 +180,33 @@ class CheckNewsModel(BaseModel):
 
 
 def check_news(
-    news_json: CheckNewsModel, ontology_manager, debug: bool = False
+    news_json: CheckNewsModel,
+    ontology_manager,
+    debug: bool = False,
+    backend: str = SIMILARITY_BACKEND,
+    ranking_fields: tuple[str, ...] = RANKING_FIELDS,
 ) -> Dict[str, Any]:
     """
     Checks if a news article is fake by comparing entities, content, and source credibility.
     Returns a score, result label, and breakdown.
+    `backend` selects semantic scoring: "remote" (similarity service) or "local"
+    (precomputed matrix in `local_similarity`).
+    `ranking_fields` selects which of `RANKING_FIELDS` each semantic_ranking
+    entry carries; leave out "trustSementics" to keep article bodies out of the result.
     """
+    with _category_shard(news_json, ontology_manager):
+        return _check_news(
+            news_json, _ontology_reads(ontology_manager), debug, backend, ranking_fields
+        )
+
+
+def _check_news(
+    news_json: CheckNewsModel,
+    reads,
+    debug: bool,
+    backend: str,
+    ranking_fields: tuple[str, ...],
+) -> Dict[str, Any]:
     subcat = news_json.get("subcategory")
     entity_types = ["persons", "locations", "events", "organizations"]
 
@@ -150,15 +216,22 @@ def check_news(
     total_weight = 0
     weighted_sum = 0
 
+    # The index lists are replaced, not changed, on updates: score them unlocked
+    with reads:
+        verified_values = {}
+        for etype in entity_types:
+            if entity_index.ready:
+                verified_values[etype] = entity_index.get(subcat, etype)
+            elif subcat in QUERY_MAP and etype in QUERY_MAP[subcat]:
+                verified_values[etype] = get_verified_values(QUERY_MAP[subcat][etype])
+            else:
+                verified_values[etype] = []
+
     for etype in entity_types:
         values = news_json.get(etype, [])
         counts[etype] = len(values)
-        if subcat in QUERY_MAP and etype in QUERY_MAP[subcat]:
-            verified = get_verified_values(QUERY_MAP[subcat][etype])
-        else:
-            verified = []
         avg, debug_pairs = get_average_similarity(
-            values, verified, etype if debug else None
+            values, verified_values[etype], etype if debug else None
         )
         avg_scores[etype] = avg
         debug_outputs[etype] = debug_pairs
@@ -173,21 +246,25 @@ def check_news(
         print(f"  Overall entity similarity score: {entity_similarity_score:.3f}")
 
     # --- Semantic Similarity Ranking ---
-    trusted_cont = get_trusted_contents_by_category(subcat)
     content = news_json.get("content", "")
+    if backend == "local":
+        trusted_cont, scores = local_similarity_engine.score_category(content, subcat)
+        trusted_texts = [t.trustSementics for t in trusted_cont]
+    elif trusted_view.ready:
+        with reads:
+            trusted_cont, trusted_texts = trusted_view.rows_and_texts(subcat)
+        scores = get_semantic_similarity_scores(content, trusted_texts)
+    else:
+        with reads:
+            trusted_cont = get_trusted_contents_by_category(subcat)
+        trusted_texts = [t.trustSementics for t in trusted_cont]
+        scores = get_semantic_similarity_scores(content, trusted_texts)
     similarity_results = []
-    for t in trusted_cont:
-        score = get_semantic_similarity_score(
-            content, [t.trustSementics]
-        )  # Send [t], not t!
-        similarity_results.append(
-            {
-                "title": t.title,
-                "url": t.url,
-                "trustSementics": t.trustSementics,
-                "score": score,
-            }
-        )
+    for t, text, score in zip(trusted_cont, trusted_texts, scores):
+        entry = {"title": t.title, "url": t.url, "trustSementics": text}
+        entry = {field: entry[field] for field in ranking_fields}
+        entry["score"] = score
+        similarity_results.append(entry)
     similarity_results.sort(key=lambda x: x["score"], reverse=True)
     for idx, item in enumerate(similarity_results, 1):
         item["rank"] = idx
@@ -203,7 +280,8 @@ def check_news(
     )
 
     # --- Source Credibility ---
-    trusted_publishers = get_trusted_publishers()
+    with reads:
+        trusted_publishers = get_trusted_publishers()
     publisher = news_json.get("source", "")
     source_credibility_score = get_source_credibility(publisher, trusted_publishers)
 
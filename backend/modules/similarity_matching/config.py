@@ -0,0 +1,12 @@
+"""
+Backend selection for semantic similarity scoring.
+"""
+
+import os
+
+# "remote" (hosted /similarity service) or "local" (in-process TF-IDF matrix)
+SIMILARITY_BACKEND: str = os.environ.get("SIMILARITY_BACKEND", "remote")
+
+# Hashed character n-gram space used by the local engine
+LOCAL_SIMILARITY_FEATURES: int = 2**20
+LOCAL_SIMILARITY_NGRAM_RANGE: tuple[int, int] = (2, 4)
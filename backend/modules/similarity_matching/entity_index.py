@@ -0,0 +1,136 @@
+"""
+In-memory index of verified entity names per (subcategory, entity type).
+
+Holds the same names the `QUERY_MAP` SPARQL queries return (deduplicated), so
+`check_news` can read them in O(1) instead of scanning every article of the
+category on each verification. Built on startup, extended by an
+`OntologyManager` article listener on ingest, and rebuilt lazily after
+`invalidate()`.
+"""
+
+import threading
+
+from .query_mapping import ENTITY_PROPERTY_MAP, QUERY_MAP
+from .similarity_engine import get_verified_values
+
+
+class EntityIndex:
+    def __init__(self):
+        self._names: dict[tuple[str, str], list[str]] = {}
+        self._ontology = None
+        self._stale = True
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ontology is not None
+
+    # ------------------------------------------------------------------ utils
+
+    @staticmethod
+    def _article_names(article):
+        """Yield ((subcategory, entity type), name) for the entities of `article`."""
+        categories = {cat.name for cat in article.hasCategory}
+        for subcategory, specs in ENTITY_PROPERTY_MAP.items():
+            for entity_type, (category, prop) in specs.items():
+                if category not in categories:
+                    continue
+                for entity in getattr(article, prop, []):
+                    name = entity.canonicalName
+                    if name is not None:
+                        yield (subcategory, entity_type), str(name)
+
+    def _add_article(self, names, article):
+        for key, name in self._article_names(article):
+            current = names.setdefault(key, [])
+            if name not in current:
+                # copy-on-write: readers may hold the previous list
+                names[key] = current + [name]
+
+    def _add_articles(self, names, articles):
+        """
+        Add many articles at once: names are collected per key in an ordered
+        set and each changed list is replaced once.
+        """
+        added = {}
+        for article in articles:
+            for key, name in self._article_names(article):
+                if key not in added:
+                    added[key] = dict.fromkeys(names.get(key, ()))
+                added[key][name] = None
+        for key, found in added.items():
+            names[key] = list(found)
+
+    def _rebuild(self):
+        names = {}
+        self._add_articles(names, self._ontology.NewsArticle.instances())
+        self._names = names
+        self._stale = False
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)build the index from all articles in `ontology`."""
+        with self._lock:
+            self._ontology = ontology
+            self._rebuild()
+
+    def on_article_populated(self, article, data):
+        """`OntologyManager` article listener: add the new article's entity names."""
+        with self._lock:
+            if not self._stale:
+                self._add_article(self._names, article)
+
+    def on_shard_changed(self, categories, articles, loaded: bool):
+        """
+        `OntologyManager` shard listener: index the articles of a loaded shard,
+        drop the entries of an unloaded shard's categories.
+        """
+        with self._lock:
+            if self._stale:
+                return
+            if loaded:
+                self._add_articles(self._names, articles)
+            else:
+                self._names = {
+                    key: names
+                    for key, names in self._names.items()
+                    if key[0] not in categories
+                }
+
+    def invalidate(self):
+        """Drop the index; it is rebuilt from the ontology on the next lookup."""
+        with self._lock:
+            self._stale = True
+
+    def get(self, subcategory: str, entity_type: str) -> list[str]:
+        """Verified names for `(subcategory, entity_type)`. Treat the list as read-only."""
+        with self._lock:
+            if self._stale:
+                self._rebuild()
+            return self._names.get((subcategory, entity_type), [])
+
+    def check_consistency(self) -> list[dict]:
+        """
+        Compare every index entry with the SPARQL path (`get_verified_values`).
+        :return: One entry per mismatching (subcategory, entity type); empty when consistent.
+        """
+        mismatches = []
+        for subcategory, queries in QUERY_MAP.items():
+            for entity_type, query in queries.items():
+                expected = set(get_verified_values(query))
+                actual = set(self.get(subcategory, entity_type))
+                if expected != actual:
+                    mismatches.append(
+                        {
+                            "subcategory": subcategory,
+                            "entity_type": entity_type,
+                            "missing": sorted(expected - actual),
+                            "unexpected": sorted(actual - expected),
+                        }
+                    )
+        return mismatches
+
+
+# Shared index, built on startup
+entity_index = EntityIndex()
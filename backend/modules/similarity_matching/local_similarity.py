@@ -0,0 +1,212 @@
+"""
+Local semantic-similarity engine over a precomputed trusted-content matrix.
+
+Every trusted article text is turned into a hashed character n-gram vector and
+kept in one sparse matrix per category. Scoring a claim against a category is a
+single sparse matrix-vector product with TF-IDF weighting applied at query time,
+so new articles can be appended without refitting a vocabulary.
+"""
+
+import threading
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from .config import LOCAL_SIMILARITY_FEATURES, LOCAL_SIMILARITY_NGRAM_RANGE
+from .similarity_engine import TrustedContent
+
+
+class _CategoryMatrix:
+    """Trusted rows of one category and their (sublinear) term-frequency matrix."""
+
+    def __init__(self, n_features: int):
+        self.contents: list[TrustedContent] = []
+        self.seen: set[tuple[str, str, str]] = set()
+        self.pending: list[sp.csr_matrix] = []
+        self.matrix = sp.csr_matrix((0, n_features))
+        self.squared = sp.csr_matrix((0, n_features))
+        self.norms = None  # cached for `norms_version`
+        self.norms_version = -1
+
+    def consolidate(self):
+        if self.pending:
+            self.matrix = sp.vstack([self.matrix] + self.pending, format="csr")
+            self.squared = self.matrix.multiply(self.matrix).tocsr()
+            self.pending = []
+            self.norms = None
+
+
+class LocalSimilarityEngine:
+    def __init__(
+        self,
+        n_features: int = LOCAL_SIMILARITY_FEATURES,
+        ngram_range: tuple[int, int] = LOCAL_SIMILARITY_NGRAM_RANGE,
+    ):
+        self.n_features = n_features
+        self._vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=ngram_range,
+            n_features=n_features,
+            alternate_sign=False,
+            norm=None,
+        )
+        self._categories: dict[str, _CategoryMatrix] = {}
+        self._doc_freq = np.zeros(n_features, dtype=np.float64)
+        self._n_docs = 0
+        # Category matrices holding each text: an article filed under a category
+        # and its subcategory is one document for the document frequencies
+        self._doc_refs: dict[tuple[str, str, str], int] = {}
+        self._idf = None
+        self._idf_version = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ utils
+
+    def _tf(self, texts: list[str]) -> sp.csr_matrix:
+        tf = self._vectorizer.transform(texts).tocsr()
+        tf.data = 1.0 + np.log(tf.data)
+        return tf
+
+    def _current_idf(self) -> np.ndarray:
+        if self._idf is None:
+            # same smoothing as sklearn's TfidfTransformer
+            self._idf = np.log((1 + self._n_docs) / (1 + self._doc_freq)) + 1.0
+        return self._idf
+
+    def _add(self, category: str, content: TrustedContent):
+        key = (content.trustSementics, content.title, content.url)
+        rows = self._categories.setdefault(category, _CategoryMatrix(self.n_features))
+        if key in rows.seen:
+            return
+        tf = self._tf([content.trustSementics])
+        rows.seen.add(key)
+        rows.contents.append(content)
+        rows.pending.append(tf)
+        refs = self._doc_refs.get(key, 0)
+        self._doc_refs[key] = refs + 1
+        if not refs:
+            self._doc_freq[tf.indices] += 1
+            self._n_docs += 1
+            self._idf = None
+            self._idf_version += 1
+
+    @staticmethod
+    def _article_rows(article):
+        title, url = article.hasTitle, article.hasSourceURL
+        if title is None or url is None:
+            return []
+        return [
+            TrustedContent(trustSementics=str(text), title=str(title), url=str(url))
+            for text in article.hasFullText
+        ]
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)build all category matrices from the articles in `ontology`."""
+        with self._lock:
+            self._categories = {}
+            self._doc_freq[:] = 0
+            self._n_docs = 0
+            self._doc_refs = {}
+            self._idf = None
+            for article in ontology.NewsArticle.instances():
+                rows = self._article_rows(article)
+                for cat in article.hasCategory:
+                    for content in rows:
+                        self._add(cat.name, content)
+            for rows in self._categories.values():
+                rows.consolidate()
+
+    def on_article_populated(self, article, data):
+        """`OntologyManager` article listener: append the new article's rows."""
+        rows = self._article_rows(article)
+        with self._lock:
+            for cat in article.hasCategory:
+                for content in rows:
+                    self._add(cat.name, content)
+
+    def on_shard_changed(self, categories, articles, loaded: bool):
+        """
+        `OntologyManager` shard listener: append the rows of a loaded shard's
+        articles, drop the matrices (and document frequencies) of an unloaded
+        shard's categories.
+        """
+        if loaded:
+            for article in articles:
+                self.on_article_populated(article, None)
+            return
+        with self._lock:
+            for name in categories:
+                rows = self._categories.pop(name, None)
+                if rows is None:
+                    continue
+                rows.consolidate()
+                matrix = rows.matrix
+                for content, start, end in zip(
+                    rows.contents, matrix.indptr[:-1], matrix.indptr[1:]
+                ):
+                    key = (content.trustSementics, content.title, content.url)
+                    refs = self._doc_refs.pop(key) - 1
+                    if refs:
+                        self._doc_refs[key] = refs
+                    else:
+                        self._doc_freq[matrix.indices[start:end]] -= 1
+                        self._n_docs -= 1
+            self._idf = None
+            self._idf_version += 1
+
+    def score_category(
+        self, news_text: str, category: str
+    ) -> tuple[list[TrustedContent], list[float]]:
+        """
+        Cosine similarity of `news_text` against every trusted text of `category`.
+        :return: The trusted rows and their scores, aligned.
+        """
+        with self._lock:
+            rows = self._categories.get(category)
+            if rows is None:
+                return [], []
+            rows.consolidate()
+            idf = self._current_idf()
+            if rows.norms_version != self._idf_version or rows.norms is None:
+                rows.norms = np.sqrt(rows.squared @ (idf * idf))
+                rows.norms_version = self._idf_version
+            contents, matrix, norms = list(rows.contents), rows.matrix, rows.norms
+
+        query = self._tf([news_text]).multiply(idf).tocsr()
+        query_norm = np.sqrt(query.multiply(query).sum())
+        if query_norm == 0 or not contents:
+            return contents, [0.0] * len(contents)
+        dots = matrix @ query.multiply(idf).T.toarray().ravel()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, dots / (norms * query_norm), 0.0)
+        return contents, [float(s) for s in scores]
+
+    def score_texts(self, news_text: str, trusted_texts: list[str]) -> list[float]:
+        """Cosine similarity of `news_text` against ad-hoc texts, using the corpus IDF."""
+        if not trusted_texts:
+            return []
+        with self._lock:
+            idf = self._current_idf()
+        query = self._tf([news_text]).multiply(idf).tocsr()
+        others = self._tf(trusted_texts).multiply(idf).tocsr()
+        query_norm = np.sqrt(query.multiply(query).sum())
+        other_norms = np.sqrt(np.asarray(others.multiply(others).sum(axis=1)).ravel())
+        dots = (others @ query.T).toarray().ravel()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(
+                (other_norms > 0) & (query_norm > 0),
+                dots / (other_norms * query_norm),
+                0.0,
+            )
+        return [float(s) for s in scores]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {name: len(rows.contents) for name, rows in self._categories.items()}
+
+
+# Shared engine, built on startup when SIMILARITY_BACKEND is "local"
+local_similarity_engine = LocalSimilarityEngine()
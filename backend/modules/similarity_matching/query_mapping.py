@@ -1,114 +1,94 @@
-from .query import (
-    query1,
-    query2,
-    query3,
-    query4,
-    query5,
-    query6,
-    query7,
-    query8,
-    query9,
-    query10,
-    query11,
-    query12,
-    query13,
-    query14,
-    query15,
-    query16,
-    query17,
-    query18,
-    query19,
-    query20,
-    query21,
-    query22,
-    query23,
-    query24,
-    query25,
-    query26,
-    query27,
-    query28,
-    query29,
-    query30,
-    query31,
-    query32,
-    query33,
-    query34,
-    query35,
-    query36,
-    query37,
-    query38,
-    query39,
-    query40,
-    query41,
-    query42,
-)
+from typing import NamedTuple
 
+from .query import PreparedQuery, entity_names_query
 
-QUERY_MAP = {
+
+class EntityQuery(NamedTuple):
+    category: str
+    property: str
+
+    @property
+    def prepared(self) -> PreparedQuery:
+        """Prepared query for `property`; execute it with the category entity."""
+        return entity_names_query(self.property)
+
+
+# (subcategory, entity type) -> (category the article must have, article -> entity property)
+# Source of the QUERY_MAP catalogue below and of the in-memory entity index.
+ENTITY_PROPERTY_MAP = {
     "InternationalPolitics": {
-        "persons": query15,
-        "locations": query16,
-        "events": query14,
-        "organizations": query13,
+        "persons": ("InternationalPolitics", "hasForeignPerson"),
+        "locations": ("InternationalPolitics", "hasForeignLocation"),
+        "events": ("InternationalPolitics", "hasForeignEvent"),
+        "organizations": ("InternationalPolitics", "hasForeignOrganization"),
     },
     "DomesticPolitics": {
-        "persons": query19,
-        "locations": query20,
-        "events": query18,
-        "organizations": query17,
+        "persons": ("DomesticPolitics", "hasDomesticPerson"),
+        "locations": ("DomesticPolitics", "hasDomesticLocation"),
+        "events": ("DomesticPolitics", "hasDomesticEvent"),
+        "organizations": ("DomesticPolitics", "hasDomesticOrganization"),
     },
     "TechAndInnovation": {
-        "persons": query23,
-        "locations": query24,
-        "events": query22,
-        "organizations": query21,
+        "persons": ("TechAndInnovation", "hasTechPerson"),
+        "locations": ("TechAndInnovation", "hasTechLocation"),
+        "events": ("TechAndInnovation", "hasTechEvent"),
+        "organizations": ("TechAndInnovation", "hasTechCompany"),
     },
     "ResearchAndSpace": {
-        "persons": query27,
-        "locations": query28,
-        "events": query26,
-        "organizations": query25,
+        "persons": ("ResearchAndSpace", "hasResearchPerson"),
+        "locations": ("ResearchAndSpace", "hasResearchLocation"),
+        "events": ("ResearchAndSpace", "hasResearchEvent"),
+        "organizations": ("ResearchAndSpace", "hasResearchInstitution"),
     },
     "ScreenAndStage": {
-        "persons": query31,
-        "locations": query32,
-        "events": query30,
-        "organizations": query29,
+        "persons": ("ScreenAndStage", "hasFilmDirectorActor"),
+        "locations": ("ScreenAndStage", "hasFilmLocation"),
+        "events": ("ScreenAndStage", "hasStageEvent"),
+        "organizations": ("ScreenAndStage", "hasFilmProductionCompany"),
     },
     "MusicAndArts": {
-        "persons": query35,
-        "locations": query36,
-        "events": query34,
-        "organizations": query33,
+        "persons": ("MusicAndArts", "hasMusicArtist"),
+        "locations": ("MusicAndArts", "hasMusicLocation"),
+        "events": ("MusicAndArts", "hasMusicEvent"),
+        "organizations": ("MusicAndArts", "hasMusicCompany"),
     },
     "Cricket": {
-        "persons": query2,
-        "locations": query3,
-        "events": query4,
-        "organizations": query1,
+        "persons": ("Cricket", "hasCricketPlayer"),
+        "locations": ("Cricket", "hasCricketVenue"),
+        "events": ("Cricket", "hasCricketTournament"),
+        "organizations": ("Cricket", "hasCricketTeam"),
     },
     "Football": {
-        "persons": query6,
-        "locations": query7,
-        "events": query8,
-        "organizations": query5,
+        "persons": ("Football", "hasFootballPlayer"),
+        "locations": ("Football", "hasFootballVenue"),
+        "events": ("Football", "hasFootballTournament"),
+        "organizations": ("Football", "hasFootballTeam"),
     },
     "Other": {
-        "persons": query10,
-        "locations": query11,
-        "events": query12,
-        "organizations": query9,
+        "persons": ("Other", "hasPlayer"),
+        "locations": ("Other", "hasVenue"),
+        "events": ("Other", "hasTournament"),
+        "organizations": ("Other", "hasTeam"),
     },
     "CrimeReport": {
-        "persons": query38,
-        "locations": query40,
-        "events": query39,
-        "organizations": query37,
+        "persons": ("CrimeAndJustice", "hasWitness"),
+        "locations": ("CrimeReport", "hasCrimeLocation"),
+        "events": ("CrimeReport", "hasCrimeType"),
+        "organizations": ("CrimeAndJustice", "hasInvestigation"),
     },
     "CourtsAndInvestigation": {
-        "persons": query38,
-        "locations": query42,
-        "events": query41,
-        "organizations": query37,
+        "persons": ("CrimeAndJustice", "hasWitness"),
+        "locations": ("CourtsAndInvestigation", "hasCourtLocation"),
+        "events": ("CourtsAndInvestigation", "hasCourtCase"),
+        "organizations": ("CrimeAndJustice", "hasInvestigation"),
     },
 }
+
+
+QUERY_MAP = {
+    subcategory: {
+        entity_type: EntityQuery(category, prop)
+        for entity_type, (category, prop) in specs.items()
+    }
+    for subcategory, specs in ENTITY_PROPERTY_MAP.items()
+}
@@ -3,10 +3,15 @@ Algorithms for string/entity/semantic similarity.
 """
 
 from pydantic import BaseModel
-import requests
 from rapidfuzz.fuzz import ratio
 from owlready2 import default_world
 
+from ..remote_services.client import post_json, post_json_sync
+from ..remote_services.config import MODEL_SERVICE_BASE_URL, SIMILARITY_BATCH_SIZE
+from .query import category_entity, trusted_contents_query, trusted_publishers_query
+
+SIMILARITY_API_URL = f"{MODEL_SERVICE_BASE_URL}/similarity"
+
 # 1. Helper: Get verified values from ontology using SPARQL
 
 
@@ -17,19 +22,22 @@ class TrustedContent(BaseModel):
 
 
 def get_verified_values(sparql_query):
-    results = list(default_world.sparql(sparql_query))
+    """
+    Entity names for a `QUERY_MAP` entry, run as a prepared query with the
+    category bound as parameter. A plain SPARQL string is run as-is.
+    """
+    if isinstance(sparql_query, str):
+        results = default_world.sparql(sparql_query)
+    else:
+        category = category_entity(sparql_query.category)
+        if category is None:
+            return []
+        results = sparql_query.prepared.execute(category)
     return [str(item[0]) for item in results]
 
 
 def get_trusted_publishers():
-    sparql = """
-    PREFIX ns: <http://www.semanticweb.org/kameshfdo/ontologies/2025/5/new-ontology-v1#>
-    SELECT DISTINCT ?publisher
-    WHERE {
-      ?article ns:publisherName ?publisher .
-    }
-    """
-    results = list(default_world.sparql(sparql))
+    results = list(trusted_publishers_query.execute())
     return [str(r[0]) for r in results]
 
 
@@ -39,41 +47,95 @@ def get_source_credibility(news_publisher, trusted_publishers):
 
 
 def get_trusted_contents_by_category(category):
-    category_uri = f"ns:{category}"
-    sparql = f"""
-    PREFIX ns: <http://www.semanticweb.org/kameshfdo/ontologies/2025/5/new-ontology-v1#>
-    SELECT DISTINCT ?trustSementics ?title ?url
-    WHERE {{
-      ?article ns:hasCategory ?cat .
-      FILTER (?cat = {category_uri})
-      ?article ns:hasFullText ?trustSementics .
-      ?article ns:hasTitle ?title .
-      ?article ns:hasSourceURL ?url .
-    }}
-    """
-    results = list(default_world.sparql(sparql))
+    cat = category_entity(category)
+    if cat is None:
+        return []
+    results = list(trusted_contents_query.execute(cat))
     return [
         TrustedContent(trustSementics=str(r[0]), title=str(r[1]), url=str(r[2]))
         for r in results
     ]
 
 
+async def get_semantic_similarity_score_async(
+    news_text,
+    trusted_texts,
+    api_url=SIMILARITY_API_URL,
+):
+    payload = {"news_text": news_text, "trusted_texts": trusted_texts}
+    try:
+        result = await post_json("similarity", api_url, payload)
+        return float(result.get("max_similarity", 0.0))
+    except Exception as e:
+        print(f"[Error] Could not get similarity from API: {e}")
+        return 0.0
+
+
 def get_semantic_similarity_score(
     news_text,
     trusted_texts,
-    api_url="https://relaxing-morally-wallaby.ngrok-free.app/similarity",
+    api_url=SIMILARITY_API_URL,
 ):
     payload = {"news_text": news_text, "trusted_texts": trusted_texts}
     try:
-        response = requests.post(api_url, json=payload, timeout=90)
-        response.raise_for_status()
-        result = response.json()
+        result = post_json_sync("similarity", api_url, payload)
         return float(result.get("max_similarity", 0.0))
     except Exception as e:
         print(f"[Error] Could not get similarity from API: {e}")
         return 0.0
 
 
+def _scores_from_result(result, expected):
+    """Per-candidate scores from a /similarity response, or None if it has none."""
+    scores = result.get("scores")
+    if isinstance(scores, list) and len(scores) == expected:
+        return [float(s) for s in scores]
+    if expected == 1:
+        return [float(result.get("max_similarity", 0.0))]
+    return None
+
+
+# /similarity URLs whose service answered a batch without `scores` (an older
+# version): their candidates are scored one by one from then on
+_UNBATCHED_URLS = set()
+
+
+def _score_chunk(news_text, chunk, api_url):
+    if api_url in _UNBATCHED_URLS:
+        return [get_semantic_similarity_score(news_text, [t], api_url) for t in chunk]
+    payload = {"news_text": news_text, "trusted_texts": chunk}
+    try:
+        result = post_json_sync("similarity", api_url, payload)
+    except Exception as e:
+        print(f"[Error] Could not get similarity from API: {e}")
+        return [0.0] * len(chunk)
+    scores = _scores_from_result(result, len(chunk))
+    if scores is None:
+        # Older service versions only report max_similarity: score one by one.
+        _UNBATCHED_URLS.add(api_url)
+        return [get_semantic_similarity_score(news_text, [t], api_url) for t in chunk]
+    return scores
+
+
+def get_semantic_similarity_scores(
+    news_text,
+    trusted_texts,
+    api_url=SIMILARITY_API_URL,
+    batch_size=SIMILARITY_BATCH_SIZE,
+):
+    """
+    Score `news_text` against every text in `trusted_texts`.
+    The claim is sent once per chunk of `batch_size` candidates and the service
+    answers with one score per candidate (`scores`), in input order.
+    :return: A list of floats aligned with `trusted_texts`.
+    """
+    scores = []
+    for start in range(0, len(trusted_texts), batch_size):
+        chunk = trusted_texts[start : start + batch_size]
+        scores.extend(_score_chunk(news_text, chunk, api_url))
+    return scores
+
+
 def get_average_similarity(input_list, verified_list, debug_label=None):
     if not input_list:
         return 1.0, []
@@ -0,0 +1,136 @@
+"""
+Materialized per-category view of trusted content.
+
+Replaces the per-verify `get_trusted_contents_by_category` SPARQL scan with
+compact rows (article id, title, url, text handle) kept in memory per category.
+Article bodies stay in the ontology and are only read for callers that need
+them (`rows_and_texts`). Built on startup and refreshed per article by an
+`OntologyManager` article listener.
+"""
+
+import threading
+from typing import NamedTuple
+
+
+class TrustedRow(NamedTuple):
+    article_id: int  # storid of the NewsArticle individual
+    title: str
+    url: str
+    text_handle: int  # position among the article's distinct hasFullText values
+
+
+def _distinct_texts(article) -> list[str]:
+    return list(dict.fromkeys(str(text) for text in article.hasFullText))
+
+
+class _CategoryRows:
+    """Rows of one category grouped per article, with a cached flat list."""
+
+    def __init__(self):
+        self.by_article: dict[int, tuple[TrustedRow, ...]] = {}
+        self.flat: list[TrustedRow] | None = None
+
+    def rows(self) -> list[TrustedRow]:
+        if self.flat is None:
+            self.flat = [row for rows in self.by_article.values() for row in rows]
+        return self.flat
+
+
+class TrustedContentView:
+    def __init__(self):
+        self._categories: dict[str, _CategoryRows] = {}
+        self._ontology = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._ontology is not None
+
+    # ------------------------------------------------------------------ utils
+
+    @staticmethod
+    def _article_rows(article) -> tuple[TrustedRow, ...]:
+        title, url = article.hasTitle, article.hasSourceURL
+        if title is None or url is None:
+            return ()
+        return tuple(
+            TrustedRow(article.storid, str(title), str(url), handle)
+            for handle in range(len(_distinct_texts(article)))
+        )
+
+    def _put(self, article):
+        rows = self._article_rows(article)
+        categories = {cat.name for cat in article.hasCategory}
+        for name, category in self._categories.items():
+            if name not in categories and category.by_article.pop(article.storid, None):
+                category.flat = None
+        for name in categories:
+            category = self._categories.setdefault(name, _CategoryRows())
+            if rows:
+                category.by_article[article.storid] = rows
+            else:
+                category.by_article.pop(article.storid, None)
+            category.flat = None
+
+    # ------------------------------------------------------------------ public
+
+    def build(self, ontology):
+        """(Re)build the view from all articles in `ontology`."""
+        with self._lock:
+            self._ontology = ontology
+            self._categories = {}
+            for article in ontology.NewsArticle.instances():
+                self._put(article)
+
+    def on_article_populated(self, article, data):
+        """`OntologyManager` article listener: refresh the article's rows."""
+        with self._lock:
+            self._put(article)
+
+    def on_shard_changed(self, categories, articles, loaded: bool):
+        """
+        `OntologyManager` shard listener: add the rows of a loaded shard's
+        articles, drop the categories of an unloaded shard.
+        """
+        with self._lock:
+            if loaded:
+                for article in articles:
+                    self._put(article)
+            else:
+                for name in categories:
+                    self._categories.pop(name, None)
+
+    def rows(self, category: str) -> list[TrustedRow]:
+        """Trusted rows of `category`. Treat the list as read-only."""
+        with self._lock:
+            rows = self._categories.get(category)
+            return rows.rows() if rows is not None else []
+
+    def rows_and_texts(self, category: str) -> tuple[list[TrustedRow], list[str]]:
+        """
+        Trusted rows of `category` and their article bodies, read from the
+        ontology in the same pass. Rows whose text is gone (compaction merged
+        repeated texts since the rows were built) are left out.
+        """
+        world = self._ontology.world
+        cache = {}
+        rows, texts = [], []
+        for row in self.rows(category):
+            distinct = cache.get(row.article_id)
+            if distinct is None:
+                article = world._get_by_storid(row.article_id)
+                distinct = cache[row.article_id] = (
+                    _distinct_texts(article) if article is not None else []
+                )
+            if row.text_handle < len(distinct):
+                rows.append(row)
+                texts.append(distinct[row.text_handle])
+        return rows, texts
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {name: len(rows.rows()) for name, rows in self._categories.items()}
+
+
+# Shared view, built on startup
+trusted_view = TrustedContentView()